@@ -204,5 +204,5 @@ def parse_version(ver: str) -> Version:
     return Version(major, minor, micro, release, pre, post, dev)
 
 
-__version_info__ = Version(8, 12, 0, "final")
+__version_info__ = Version(8, 13, 0, "final")
 __version__ = __version_info__._get_canonical()
@@ -0,0 +1,260 @@
+"""
+Streaming color averages.
+
+`ColorAccumulator` averages colors the same way as `Color.average`, but colors can be added
+over time and the partial state of separate accumulators can be merged or serialized. This
+allows averaging very large sets of colors in shards, possibly in separate processes or on
+separate machines, and combining the results.
+
+Instead of running averages, the accumulator keeps running sums of the weighted channels,
+the sine and cosine components of the hue, the weights, and the number of defined values
+per channel, all of which can simply be added together when merging.
+"""
+from __future__ import annotations
+import sys
+import math
+import struct
+import itertools as it
+from array import array
+from .interpolate import mix_result, carryforward_convert
+from .types import ColorInput, AnyColor
+from typing import Any, Generic, Iterable
+
+# Version, flags, and color space name length
+HEADER = struct.Struct('<BBH')
+VERSION = 1
+
+FLG_PREMULTIPLIED = 0x1
+FLG_POWERLESS = 0x2
+FLG_CARRYFORWARD = 0x4
+
+
+class ColorAccumulator(Generic[AnyColor]):
+    """Accumulate colors into an average that can be merged with other accumulators."""
+
+    __slots__ = (
+        '_color', '_obj', 'space', 'premultiplied', 'powerless', 'carryforward',
+        '_hue_index', '_to_rad', 'count', 'weight', 'sin', 'cos', 'sums', 'counts'
+    )
+
+    def __init__(
+        self,
+        color: type[AnyColor],
+        space: str | None = None,
+        *,
+        premultiplied: bool = True,
+        powerless: bool = True,
+        carryforward: bool = False
+    ) -> None:
+        """Initialize."""
+
+        if space is None:
+            space = color.AVERAGE
+        cs = color.CS_MAP.get(space)
+        if cs is None:
+            raise ValueError(f"'{space}' is not a registered color space")
+
+        self._color = color
+        self._obj = color(space, [])
+        self.space = space
+        self.premultiplied = premultiplied
+        self.powerless = powerless
+        self.carryforward = carryforward
+        if cs.is_polar():
+            hue_index = cs.hue_index()  # type: ignore[attr-defined]
+            self._hue_index = hue_index  # type: int
+            self._to_rad = math.tau / cs.channels[hue_index].high
+        else:
+            self._hue_index = -1
+            self._to_rad = 0.0
+
+        chan_count = len(cs.channels)
+        self.count = 0
+        self.weight = 0.0
+        self.sin = 0.0
+        self.cos = 0.0
+        self.sums = [0.0] * chan_count
+        self.counts = [0] * chan_count
+
+    def __len__(self) -> int:
+        """Number of colors accumulated."""
+
+        return self.count
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """Representation."""
+
+        return f"ColorAccumulator(space='{self.space}', count={self.count})"
+
+    __str__ = __repr__
+
+    def add(self, color: ColorInput, weight: float = 1.0) -> ColorAccumulator[AnyColor]:
+        """Add a color with an optional weight. Negative weights are treated as zero."""
+
+        obj = self._obj
+        hue_index = self._hue_index
+        if self.carryforward:
+            obj.mutate(color)
+            carryforward_convert(obj, self.space, hue_index, self.powerless)
+        else:
+            obj.update(color)
+            if self.powerless and hue_index >= 0 and not math.isnan(obj[hue_index]) and obj.is_achromatic():
+                obj[hue_index] = math.nan
+
+        if weight < 0.0:
+            weight = 0.0
+        self.count += 1
+        self.weight += weight
+
+        # Include alpha if it is defined. If not defined, skip, but assume the color is opaque.
+        sums = self.sums
+        counts = self.counts
+        alpha = obj[-1]
+        if math.isnan(alpha):
+            alpha = 1.0
+        else:
+            counts[-1] += 1
+            sums[-1] += alpha * weight
+
+        # Color channels use the provided weight and alpha weighting if premultiplication is enabled.
+        # Undefined channels are skipped, as are transparent colors if not premultiplying.
+        if not self.premultiplied and not alpha:
+            return self
+        factor = (alpha * weight) if self.premultiplied else weight
+        for i, coord in enumerate(obj[:-1]):
+            if math.isnan(coord):
+                continue
+            counts[i] += 1
+            if i == hue_index:
+                rad = coord * self._to_rad
+                self.sin += math.sin(rad) * factor
+                self.cos += math.cos(rad) * factor
+            else:
+                sums[i] += coord * factor
+        return self
+
+    def add_many(
+        self,
+        colors: Iterable[ColorInput],
+        weights: Iterable[float] | None = None
+    ) -> ColorAccumulator[AnyColor]:
+        """
+        Add many colors with optional weights.
+
+        Like `Color.average`, if there are fewer weights than colors, the remaining colors use the
+        largest weight seen, and extra weights are ignored. No weights, or an empty sequence of
+        weights, averages the colors without weights.
+        """
+
+        if not weights:
+            for c in colors:
+                self.add(c)
+            return self
+
+        mx = 0.0
+        for c, w in zip(colors, it.chain(weights, it.repeat(None))):
+            if w is None:
+                w = mx
+            elif w > mx:
+                mx = w
+            self.add(c, w)
+        return self
+
+    def _check(self, other: ColorAccumulator[Any]) -> None:
+        """Check that another accumulator is compatible."""
+
+        if (
+            other.space != self.space or
+            other.premultiplied != self.premultiplied or
+            other.powerless != self.powerless or
+            other.carryforward != self.carryforward
+        ):
+            raise ValueError('Accumulators must use the same color space and options to be merged')
+
+    def merge(self, other: ColorAccumulator[Any]) -> ColorAccumulator[AnyColor]:
+        """Merge the state of another accumulator into this one."""
+
+        self._check(other)
+        self.count += other.count
+        self.weight += other.weight
+        self.sin += other.sin
+        self.cos += other.cos
+        self.sums = [a + b for a, b in zip(self.sums, other.sums)]
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        return self
+
+    def result(self, *, out_space: str | None = None) -> AnyColor:
+        """Get the average of the accumulated colors."""
+
+        if not self.count:
+            raise ValueError('At least one color must be provided in order to mix colors')
+
+        # Convert the sums to averages and resolve them just as `Color.average` would.
+        counts = self.counts[:]
+        avgs = [(s / n) if n else 0.0 for s, n in zip(self.sums, counts)]
+        sin = cos = 0.0
+        if self._hue_index >= 0 and counts[self._hue_index]:
+            n = counts[self._hue_index]
+            sin = self.sin / n
+            cos = self.cos / n
+            avgs[self._hue_index] = math.nan
+        color = mix_result(
+            self._color(self.space, []),
+            avgs,
+            counts,
+            sin,
+            cos,
+            self.weight / self.count,
+            self.premultiplied,
+            True
+        )
+        if out_space is not None and out_space != self.space:
+            color.convert(out_space, in_place=True)
+        return color
+
+    def to_bytes(self) -> bytes:
+        """Serialize the accumulator's state."""
+
+        flags = (
+            (FLG_PREMULTIPLIED if self.premultiplied else 0) |
+            (FLG_POWERLESS if self.powerless else 0) |
+            (FLG_CARRYFORWARD if self.carryforward else 0)
+        )
+        name = self.space.encode('utf-8')
+        values = array('d', [self.count, self.weight, self.sin, self.cos, *self.sums, *self.counts])
+        if sys.byteorder == 'big':  # pragma: no cover
+            values.byteswap()
+        return HEADER.pack(VERSION, flags, len(name)) + name + values.tobytes()
+
+    @classmethod
+    def from_bytes(cls, color: type[AnyColor], data: bytes) -> ColorAccumulator[AnyColor]:
+        """Restore an accumulator from serialized state."""
+
+        try:
+            version, flags, size = HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError('Invalid accumulator state') from None
+        if version != VERSION:
+            raise ValueError(f'Unsupported accumulator state version {version}')
+        start = HEADER.size + size
+        obj = cls(
+            color,
+            bytes(data[HEADER.size:start]).decode('utf-8'),
+            premultiplied=bool(flags & FLG_PREMULTIPLIED),
+            powerless=bool(flags & FLG_POWERLESS),
+            carryforward=bool(flags & FLG_CARRYFORWARD)
+        )
+
+        values = array('d', bytes(data[start:]))
+        if sys.byteorder == 'big':  # pragma: no cover
+            values.byteswap()
+        chan_count = len(obj.sums)
+        if len(values) != 4 + chan_count * 2:
+            raise ValueError('Invalid accumulator state')
+        obj.count = int(values[0])
+        obj.weight = values[1]
+        obj.sin = values[2]
+        obj.cos = values[3]
+        obj.sums = values[4:4 + chan_count].tolist()
+        obj.counts = [int(v) for v in values[4 + chan_count:]]
+        return obj
@@ -25,7 +25,6 @@ import sys
 import cmath
 import math
 import operator
-import functools
 import itertools as it
 from .types import (
     Number, StrictNumber, Shape, DimHints, EmptyShape, VectorShape, MatrixShape, TensorShape, ArrayShape,
@@ -75,9 +74,6 @@ D2_SC = (2, 0)
 D2_D1 = (2, 1)
 DN_DM = (-1, -1)
 
-# Vector used to create a special matrix used in natural splines
-M141 = [1, 4, 1]
-
 # QR decomposition modes
 QR_MODES = {'reduced', 'complete', 'r', 'raw'}
 
@@ -989,6 +985,23 @@ class _CubicInterpolator(Interpolator):
 
         raise NotImplementedError('This function is not implemented')
 
+    @staticmethod
+    def coefficients(p0: float, p1: float, p2: float, p3: float) -> VectorT[float]:  # pragma: no cover
+        """
+        Get the coefficients of the cubic polynomial for the segment between `p1` and `p2`.
+
+        Coefficients are `[a, b, c, d]` for `a * t ** 3 + b * t ** 2 + c * t + d`.
+        """
+
+        raise NotImplementedError('This function is not implemented')
+
+    @staticmethod
+    def evaluate(coefficients: VectorTLike[float], t: float) -> float:
+        """Evaluate the segment polynomial described by the given coefficients."""
+
+        a, b, c, d = coefficients[:4]
+        return ((a * t + b) * t + c) * t + d
+
     def run(self, i: int, t: float) -> VectorT[float]:
         """Begin interpolation."""
 
@@ -1026,12 +1039,29 @@ class CatmullRomInterpolator(_CubicInterpolator):
             (t3 - t2) * p3  # B3
         ) / 2
 
+    @staticmethod
+    def coefficients(p0: float, p1: float, p2: float, p3: float) -> VectorT[float]:
+        """Get the coefficients of the cubic polynomial for the segment between `p1` and `p2`."""
+
+        return [
+            (-p0 + 3 * p1 - 3 * p2 + p3) / 2,
+            (2 * p0 - 5 * p1 + 4 * p2 - p3) / 2,
+            (p2 - p0) / 2,
+            p1
+        ]
+
 
 class MonotoneInterpolator(_CubicInterpolator):
     """Monotone interpolator."""
 
     @staticmethod
     def interpolate(p0: float, p1: float, p2: float, p3: float, t: float) -> float:
+        """Calculate the new point using the provided values."""
+
+        return MonotoneInterpolator.evaluate(MonotoneInterpolator.coefficients(p0, p1, p2, p3), t)
+
+    @staticmethod
+    def coefficients(p0: float, p1: float, p2: float, p3: float) -> VectorT[float]:
         """
         A monotonic cubic Hermite sampler spline.
 
@@ -1059,10 +1089,6 @@ class MonotoneInterpolator(_CubicInterpolator):
         - https://en.wikipedia.org/w/index.php?title=Monotone_cubic_interpolation&oldid=950478742
         """
 
-        # Save some time calculating this once
-        t2 = t ** 2
-        t3 = t2 * t
-
         # Calculate the secants for the differing segments
         s0 = p1 - p0
         s1 = p2 - p1
@@ -1093,18 +1119,22 @@ class MonotoneInterpolator(_CubicInterpolator):
             else:
                 m1 *= min(3.0 * s1 / m1, 3.0 * s2 / m1, 1.0)
 
-        # Now we can evaluate the Hermite spline
-        result = (
-            (m0 + m1 - 2.0 * s1) * t3 +
-            (3.0 * s1 - 2.0 * m0 - m1) * t2 +
-            m0 * t +
-            p1
-        )
+        # Return the Hermite spline coefficients along with the segment's bounds.
+        return [m0 + m1 - 2.0 * s1, 3.0 * s1 - 2.0 * m0 - m1, m0, p1, min(p1, p2), max(p1, p2)]
+
+    @staticmethod
+    def evaluate(coefficients: VectorTLike[float], t: float) -> float:
+        """Evaluate the Hermite spline described by the given coefficients."""
+
+        a, b, c, d, lo, hi = coefficients
+        t2 = t ** 2
+        t3 = t2 * t
+        result = a * t3 + b * t2 + c * t + d
 
         # As the spline is monotonic, all interpolated values should be confined between the endpoints.
         # Floating point arithmetic can cause this to be out of bounds on occasions.
         # If we are extrapolating (`t` is beyond the range), it doesn't really matter.
-        return clamp(result, min(p1, p2), max(p1, p2)) if 0 <= t <= 1 else result
+        return clamp(result, lo, hi) if 0 <= t <= 1 else result
 
 
 class BSplineInterpolator(_CubicInterpolator):
@@ -1126,17 +1156,16 @@ class BSplineInterpolator(_CubicInterpolator):
             t3 * p3  # B3
         ) / 6
 
+    @staticmethod
+    def coefficients(p0: float, p1: float, p2: float, p3: float) -> VectorT[float]:
+        """Get the coefficients of the cubic polynomial for the segment between `p1` and `p2`."""
 
-@functools.lru_cache(maxsize=10)
-def _matrix_141(n: int) -> MatrixT[float]:
-    """Get matrix '1 4 1'."""
-
-    m = [[0] * n for _ in range(n)]  # type: MatrixT[float]
-    m[0][0:2] = M141[1:]
-    m[-1][-2:] = M141[:-1]
-    for x in range(n - 2):
-        m[x + 1][x:x + 3] = M141
-    return inv(m)
+        return [
+            (-p0 + 3 * p1 - 3 * p2 + p3) / 6,
+            (p0 - 2 * p1 + p2) / 2,
+            (p2 - p0) / 2,
+            (p0 + 4 * p1 + p2) / 6
+        ]
 
 
 class NaturalBSplineInterpolator(BSplineInterpolator):
@@ -1165,8 +1194,8 @@ class NaturalBSplineInterpolator(BSplineInterpolator):
 
         # Handle all other cases where n does not result in linear interpolation
         elif n > 1:
-            # Create [1, 4, 1] matrix for size `n` set of control points
-            m = _matrix_141(n)
+            # Create the bands of the tridiagonal [1, 4, 1] matrix for size `n` set of control points
+            ab = [[0.0] + [1.0] * (n - 1), [4.0] * n, [1.0] * (n - 1) + [0.0]]
 
             # Create C matrix from the data points
             c = []  # type: MatrixT[float]
@@ -1178,10 +1207,8 @@ class NaturalBSplineInterpolator(BSplineInterpolator):
                 else:
                     c.append([a * 6 for a in points[r]])
 
-            # Dot M^-1 and C to get B (control points)
-            v = dot(m, c, dims=D2)
-            for r in range(1, n + 1):
-                points[r] = v[r - 1]
+            # Solve the tridiagonal system to get B (control points)
+            points[1:n + 1] = solve_banded((1, 1), ab, c)
 
     @classmethod
     def preprocess(cls, points: list[VectorT[float]], end_cond: str | None = None, **kwargs: Any) -> None:
@@ -5752,6 +5779,98 @@ def solve(a: MatrixTLike[StrictNumber] | TensorTLike[StrictNumber], b: ArrayTLik
     return m
 
 
+@overload
+def solve_banded(
+    l_and_u: tuple[int, int],
+    ab: MatrixTLike[StrictNumber],
+    b: VectorTLike[StrictNumber]
+) -> VectorT[float]:
+    ...
+
+
+@overload
+def solve_banded(
+    l_and_u: tuple[int, int],
+    ab: MatrixTLike[StrictNumber],
+    b: MatrixTLike[StrictNumber]
+) -> MatrixT[float]:
+    ...
+
+
+def solve_banded(
+    l_and_u: tuple[int, int],
+    ab: MatrixTLike[StrictNumber],
+    b: VectorTLike[StrictNumber] | MatrixTLike[StrictNumber]
+) -> VectorT[float] | MatrixT[float]:
+    """
+    Solve the system of equations for `x` where `ax = b` and `a` is a banded matrix.
+
+    `l_and_u` specifies the number of non-zero lower and upper diagonals. `a` is provided in
+    diagonal ordered form, matching SciPy, such that `a[i][j] == ab[u + i - j][j]`. Unused
+    corners of `ab` are ignored. `b` can be a vector or a matrix with a row per equation.
+
+    Gaussian elimination is performed within the bands without pivoting, which is suitable for
+    diagonally dominant matrices, such as those found in splines. With one lower and upper
+    diagonal, this is the Thomas algorithm.
+    """
+
+    nl, nu = l_and_u
+    if nl < 0 or nu < 0:
+        raise ValueError('The number of lower and upper diagonals must not be negative')
+    if len(ab) != nl + nu + 1:
+        raise ValueError(f'Expected {nl + nu + 1} diagonals, but received {len(ab)}')
+    n = len(ab[0])
+    if _any(len(r) != n for r in ab):
+        raise ValueError('Mismatched dimensions')
+
+    vector = not b or not isinstance(b[0], Sequence)
+    if vector:
+        x = [[v] for v in cast(VectorTLike[float], b)]  # type: MatrixT[float]
+    else:
+        x = [list(r) for r in cast(MatrixTLike[float], b)]
+    if len(x) != n:
+        raise ValueError('Mismatched dimensions')
+
+    # Gather each row's band, where `a[i][j]` is stored at `band[i][j - i + nl]`.
+    band = [
+        [ab[nu + i - j][j] if 0 <= j < n else 0.0 for j in range(i - nl, i + nu + 1)]
+        for i in range(n)
+    ]  # type: MatrixT[float]
+
+    # Forward elimination
+    for k in range(n):
+        pivot = band[k][nl]
+        if pivot == 0.0:
+            raise ValueError('Matrix is singular')
+        row = band[k]
+        xk = x[k]
+        for i in range(k + 1, min(k + nl + 1, n)):
+            f = band[i][k - i + nl] / pivot
+            if not f:
+                continue
+            ri = band[i]
+            for j in range(k, min(k + nu + 1, n)):
+                ri[j - i + nl] -= f * row[j - k + nl]
+            xi = x[i]
+            for c, v in enumerate(xk):
+                xi[c] -= f * v
+
+    # Back substitution
+    for i in range(n - 1, -1, -1):
+        row = band[i]
+        xi = x[i]
+        for j in range(i + 1, min(i + nu + 1, n)):
+            a = row[j - i + nl]
+            if a:
+                for c, v in enumerate(x[j]):
+                    xi[c] -= a * v
+        pivot = row[nl]
+        for c in range(len(xi)):
+            xi[c] /= pivot
+
+    return [r[0] for r in x] if vector else x
+
+
 def trace(matrix: MatrixTLike[StrictNumber]) -> StrictNumber:
     """Sum the diagonal."""
 
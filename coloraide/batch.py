@@ -0,0 +1,410 @@
+"""
+Batch color handling.
+
+`ColorArray` stores many colors of a single color space in one packed `array('d')`.
+Each color occupies `channels + 1` consecutive values, alpha being the last value,
+the same layout used by `Color` internally. Operations are applied over the whole
+batch, resolving conversion chains and plugins once instead of once per color.
+"""
+from __future__ import annotations
+import math
+from array import array
+from . import convert
+from . import kernels
+from . import transfer
+from . import util
+from .spaces import RGBish
+from .types import ColorInput, Vector, VectorLike, AnyColor
+from typing import Any, Generic, Iterable, Iterator, Sequence, TYPE_CHECKING, overload
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .spaces import Space
+
+
+class ColorArray(Generic[AnyColor]):
+    """A packed array of colors that share a single color space."""
+
+    __slots__ = ('_color', '_space', '_stride', 'data')
+
+    def __init__(
+        self,
+        color: type[AnyColor],
+        space: str,
+        coords: Iterable[VectorLike] = (),
+        alpha: Iterable[float] | None = None
+    ) -> None:
+        """Initialize."""
+
+        cs = color.CS_MAP.get(space)
+        if cs is None:
+            raise ValueError(f"'{space}' is not a registered color space")
+
+        self._color = color
+        self._space = cs
+        self._stride = len(cs.channels)
+        self.data = array('d')
+
+        num = self._stride - 1
+        alphas = iter(alpha) if alpha is not None else None
+        extend = self.data.extend
+        for c in coords:
+            if len(c) != num:
+                raise ValueError(f'Expected {num} channels for {space}, but received {len(c)}')
+            extend(c)
+            self.data.append(util.DEF_ALPHA if alphas is None else next(alphas))
+
+    @classmethod
+    def from_colors(
+        cls,
+        color: type[AnyColor],
+        colors: Iterable[ColorInput],
+        space: str | None = None
+    ) -> ColorArray[AnyColor]:
+        """
+        Create a color array from a collection of colors.
+
+        If no space is provided, the space of the first color is used. Colors in other spaces
+        are converted to the array's color space.
+        """
+
+        items = [color._handle_color_input(c) for c in colors]
+        if space is None:
+            if not items:
+                raise ValueError('A color space must be specified when no colors are provided')
+            space = items[0].space()
+
+        obj = cls(color, space)
+        data = obj.data
+        for c in items:
+            if c.space() != space:
+                c = c.convert(space)
+            data.extend(c._coords)
+        return obj
+
+    @classmethod
+    def from_ints(
+        cls,
+        color: type[AnyColor],
+        space: str,
+        data: Sequence[int],
+        bits: int = 8,
+        *,
+        alpha: bool = False,
+        linear: bool = True
+    ) -> ColorArray[AnyColor]:
+        """
+        Create a color array of RGB colors from interleaved integer channels of the given bit depth.
+
+        Integers are decoded via cached lookup tables. If `linear` is enabled and the color space
+        has a transfer function, colors are decoded straight to the linear version of the space.
+        If `alpha` is enabled, each color is followed by an integer alpha channel.
+        """
+
+        cs = color.CS_MAP.get(space)
+        if cs is None:
+            raise ValueError(f"'{space}' is not a registered color space")
+        if not isinstance(cs, RGBish):
+            raise ValueError(f"Integer channels can only be decoded for RGB spaces, not '{space}'")
+
+        quantized = transfer.quantization_table(bits)
+        if linear and transfer.has_transfer(cs):
+            table = transfer.decode_table(cs, bits)
+            cs = color.CS_MAP[cs.linear()]
+        else:
+            table = quantized
+
+        channels = len(cs.CHANNELS)
+        step = channels + 1 if alpha else channels
+        total = len(data)
+        if total % step:
+            raise ValueError(f'Expected a multiple of {step} integers for {space}, but received {total}')
+
+        stride = channels + 1
+        out = array('d', [util.DEF_ALPHA]) * (total // step * stride)
+        try:
+            for i in range(channels):
+                out[i::stride] = array('d', [table[v] for v in data[i::step]])
+            if alpha:
+                out[channels::stride] = array('d', [quantized[v] for v in data[channels::step]])
+        except IndexError:
+            raise ValueError(f'Integers exceed the range of a {bits} bit channel') from None
+        return cls._from_space(color, cs, out)
+
+    @classmethod
+    def _from_space(cls, color: type[AnyColor], cs: Space, data: array[float]) -> ColorArray[AnyColor]:
+        """Create a color array directly from packed data without validation."""
+
+        obj = cls.__new__(cls)
+        obj._color = color
+        obj._space = cs
+        obj._stride = len(cs.channels)
+        obj.data = data
+        return obj
+
+    def __len__(self) -> int:
+        """Number of colors."""
+
+        return len(self.data) // self._stride
+
+    @overload
+    def __getitem__(self, i: int) -> AnyColor:
+        ...
+
+    @overload
+    def __getitem__(self, i: slice) -> ColorArray[AnyColor]:
+        ...
+
+    def __getitem__(self, i: int | slice) -> AnyColor | ColorArray[AnyColor]:
+        """Get a color or a slice of colors."""
+
+        stride = self._stride
+        if isinstance(i, slice):
+            data = array('d')
+            for index in range(len(self))[i]:
+                data.extend(self.data[index * stride:index * stride + stride])
+            return self._from_space(self._color, self._space, data)
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('ColorArray index out of range')
+        start = i * stride
+        obj = self._color.__new__(self._color)
+        obj._space = self._space
+        obj._coords = self.data[start:start + stride]
+        return obj
+
+    def __setitem__(self, i: int, color: ColorInput) -> None:
+        """Set a color at the given index."""
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('ColorArray index out of range')
+        c = self._color._handle_color_input(color)
+        if c.space() != self._space.NAME:
+            c = c.convert(self._space.NAME)
+        start = i * self._stride
+        self.data[start:start + self._stride] = array('d', c._coords)
+
+    def __iter__(self) -> Iterator[AnyColor]:
+        """Iterate the colors."""
+
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        """Representation."""
+
+        return f'ColorArray(space={self._space.NAME!r}, size={len(self)})'
+
+    __str__ = __repr__
+
+    def space(self) -> str:
+        """The color space of the array."""
+
+        return self._space.NAME
+
+    def clone(self) -> ColorArray[AnyColor]:
+        """Clone."""
+
+        return self._from_space(self._color, self._space, array('d', self.data))
+
+    def append(self, color: ColorInput) -> None:
+        """Append a color to the array."""
+
+        c = self._color._handle_color_input(color)
+        if c.space() != self._space.NAME:
+            c = c.convert(self._space.NAME)
+        self.data.extend(c._coords)
+
+    def coords(self, *, nans: bool = True) -> list[Vector]:
+        """Get the color coordinates of all colors, optionally resolving undefined values."""
+
+        stride = self._stride
+        data = self.data
+        end = stride - 1
+        if nans:
+            return [data[i:i + end].tolist() for i in range(0, len(data), stride)]
+        resolve = [c.nans for c in self._space.CHANNELS]
+        return [
+            [resolve[e] if math.isnan(v) else v for e, v in enumerate(data[i:i + end])]
+            for i in range(0, len(data), stride)
+        ]
+
+    def alpha(self, *, nans: bool = True) -> Vector:
+        """Get the alpha values of all colors."""
+
+        values = self.data[self._stride - 1::self._stride].tolist()
+        if nans:
+            return values
+        return [0.0 if math.isnan(a) else a for a in values]
+
+    def to_colors(self) -> list[AnyColor]:
+        """Convert the array to a list of color objects."""
+
+        return list(self)
+
+    def to_ints(self, space: str, bits: int = 8, *, alpha: bool = False, linear: bool = True) -> list[int]:
+        """
+        Encode the colors as interleaved integer channels of the given bit depth in an RGB color space.
+
+        Channels are clamped and quantized, rounding half up. If `linear` is enabled and the color space
+        has a transfer function, colors are converted to the linear version of the space and encoded
+        via cached lookup tables. If `alpha` is enabled, each color is followed by an integer alpha channel.
+        """
+
+        cs = self._color.CS_MAP.get(space)
+        if cs is None:
+            raise ValueError(f"'{space}' is not a registered color space")
+        if not isinstance(cs, RGBish):
+            raise ValueError(f"Integer channels can only be encoded for RGB spaces, not '{space}'")
+
+        mx = transfer.max_value(bits)
+        table = None
+        if linear and transfer.has_transfer(cs):
+            table = transfer.encode_table(cs, bits)
+            space = cs.linear()
+        colors = self.convert(space)
+
+        stride = colors._stride
+        data = colors.data
+        channels = stride if alpha else stride - 1
+        encode = kernels.encode if len(self) >= kernels.MIN_BATCH and kernels.available() else transfer.encode
+        out = [0] * (len(self) * channels)
+        for i in range(channels):
+            values = data[i::stride]
+            if table is not None and i < stride - 1:
+                out[i::channels] = encode(table, values)
+            else:
+                out[i::channels] = [(mx if v >= 1.0 else int(v * mx + 0.5)) if v > 0.0 else 0 for v in values]
+        return out
+
+    def _scratch(self) -> AnyColor:
+        """Get a reusable color object to run per-color operations through."""
+
+        obj = self._color.__new__(self._color)
+        obj._space = self._space
+        obj._coords = array('d')
+        return obj
+
+    def convert(self, space: str, *, in_place: bool = False, norm: bool = True) -> ColorArray[AnyColor]:
+        """Convert all colors to the given color space."""
+
+        if space == self._space.NAME:
+            return self if in_place else self.clone()
+
+        run = None
+        if len(self) >= kernels.MIN_BATCH:
+            run = self._color._get_converter(self._space, space, self._color.CHROMATIC_ADAPTATION).kernel()
+
+        if run is not None:
+            cs = self._color.CS_MAP[space]
+            nans = [c.nans for c in self._space.CHANNELS]
+            data = kernels.convert_buffer(run, self.data, self._stride, nans)
+        else:
+            cs, results = convert.convert_many(self._color, self._space, space, self.coords(nans=False))
+            data = array('d')
+            for coords, a in zip(results, self.alpha()):
+                data.extend(coords)
+                data.append(a)
+
+        # Normalize achromatic colors, but skip if we internally don't need this.
+        hi = cs.hue_index() if norm and cs.is_polar() else -1  # type: ignore[attr-defined]
+        stride = len(cs.channels)
+        if hi >= 0:
+            scratch = self._scratch()
+            for i in range(0, len(data), stride):
+                scratch._space = cs
+                scratch._coords = data[i:i + stride]
+                if scratch.is_achromatic():
+                    data[i + hi] = math.nan
+
+        if in_place:
+            self._space = cs
+            self._stride = stride
+            self.data = data
+            return self
+        return self._from_space(self._color, cs, data)
+
+    def _apply(self, func: Any, *args: Any, **kwargs: Any) -> ColorArray[AnyColor]:
+        """Apply an in place color operation to each color in the array."""
+
+        stride = self._stride
+        data = self.data
+        scratch = self._scratch()
+        cs = self._space
+        for i in range(0, len(data), stride):
+            scratch._space = cs
+            scratch._coords = data[i:i + stride]
+            func(scratch, *args, **kwargs)
+            data[i:i + stride] = scratch._coords
+        return self
+
+    def clip(self, space: str | None = None) -> ColorArray[AnyColor]:
+        """Clip all colors in place."""
+
+        return self._apply(self._color.clip, space)
+
+    def fit(self, space: str | None = None, *, method: str | None = None, **kwargs: Any) -> ColorArray[AnyColor]:
+        """Fit all colors in place with the given gamut mapping method."""
+
+        return self._apply(self._color.fit, space, method=method, **kwargs)
+
+    def in_gamut(self, space: str | None = None, *, tolerance: float | None = None, **kwargs: Any) -> list[bool]:
+        """Check which colors are in gamut."""
+
+        stride = self._stride
+        data = self.data
+        scratch = self._scratch()
+        cs = self._space
+        results = []
+        for i in range(0, len(data), stride):
+            scratch._space = cs
+            scratch._coords = data[i:i + stride]
+            results.append(scratch.in_gamut(space, tolerance=tolerance, **kwargs))
+        return results
+
+    def delta_e(
+        self,
+        color: ColorInput | ColorArray[AnyColor] | Sequence[ColorInput],
+        *,
+        method: str | None = None,
+        **kwargs: Any
+    ) -> list[float]:
+        """
+        Calculate the distance between all colors and the given color(s).
+
+        If a single color is provided, all colors are compared against it, if an array
+        or sequence of colors is provided, colors are compared pair-wise.
+        """
+
+        if method is None:
+            method = self._color.DELTA_E
+
+        delta = self._color.DE_MAP.get(method)
+        if not delta:
+            raise ValueError(f"'{method}' is not currently a supported distancing algorithm.")
+
+        others = None  # type: Iterator[AnyColor] | None
+        single = None  # type: AnyColor | None
+        if isinstance(color, (ColorArray, Sequence)) and not isinstance(color, str):
+            if len(color) != len(self):
+                raise ValueError(f'Expected {len(self)} colors to compare against, but received {len(color)}')
+            others = iter(color) if isinstance(color, ColorArray) else (
+                self._color._handle_color_input(c) for c in color
+            )
+        else:
+            single = self._color._handle_color_input(color)
+
+        stride = self._stride
+        data = self.data
+        scratch = self._scratch()
+        cs = self._space
+        results = []
+        for i in range(0, len(data), stride):
+            scratch._space = cs
+            scratch._coords = data[i:i + stride]
+            sample = next(others) if others is not None else single
+            results.append(delta.distance(scratch, sample, **kwargs))  # type: ignore[type-var]
+        return results
@@ -0,0 +1,276 @@
+"""
+Caches.
+
+In memory caches are LRU caches whose sizes can be adjusted and whose statistics can be
+inspected. All internal, module level caches are registered here by name.
+
+Some plugins generate large tables at runtime, such as the CCT tables which require integrating
+the Planckian locus many times. When enabled, such tables are stored in a cache directory so that
+new processes can load them instead of generating them again.
+
+Tables are stored as packed, little endian arrays of doubles with a header that identifies the
+table and a checksum of the data. Files that fail validation are simply regenerated. Tables are
+keyed by a fingerprint of the parameters used to generate them and the ColorAide version.
+
+The persistent cache is disabled by default. It can be enabled via `enable()` or by setting the
+`COLORAIDE_CACHE_DIR` environment variable to the desired directory.
+"""
+from __future__ import annotations
+import os
+import sys
+import struct
+import hashlib
+import tempfile
+import zlib
+import functools
+from array import array
+from .__meta__ import __version__
+from typing import Any, Callable, Iterable, Generic, NamedTuple, ParamSpec, TypeVar
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+MAGIC = b'CATABLE\x00'
+VERSION = 1
+HEADER = struct.Struct('<8sH32sQI')
+SUFFIX = '.bin'
+
+_directory = None  # type: str | None
+
+
+class CacheInfo(NamedTuple):
+    """
+    Cache statistics.
+
+    Evictions are derived from the number of misses that are no longer held in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+def stats(info: functools._CacheInfo) -> CacheInfo:
+    """Get cache statistics from a `functools.lru_cache` cache info."""
+
+    hits, misses, maxsize, currsize = info
+    return CacheInfo(hits, misses, max(0, misses - currsize), maxsize, currsize)
+
+
+class LRUCache(Generic[P, R]):
+    """
+    A resizable LRU cache wrapping a function.
+
+    The cached function can be replaced when resized while references to the wrapper remain valid.
+    """
+
+    def __init__(self, func: Callable[P, R], maxsize: int | None, typed: bool = False) -> None:
+        """Initialize."""
+
+        self.func = func
+        self.typed = typed
+        self._cached = functools.lru_cache(maxsize=maxsize, typed=typed)(func)
+        functools.update_wrapper(self, func)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Call the cached function."""
+
+        return self._cached(*args, **kwargs)  # type: ignore[arg-type]
+
+    def resize(self, maxsize: int | None) -> None:
+        """Resize the cache, discarding all cached results."""
+
+        self._cached = functools.lru_cache(maxsize=maxsize, typed=self.typed)(self.func)
+
+    def cache_clear(self) -> None:
+        """Clear the cache and statistics."""
+
+        self._cached.cache_clear()
+
+    def cache_info(self) -> CacheInfo:
+        """Get the cache statistics."""
+
+        return stats(self._cached.cache_info())
+
+
+MEMORY = {}  # type: dict[str, LRUCache[..., Any]]
+
+
+def memoize(name: str, maxsize: int | None, typed: bool = False) -> Callable[[Callable[P, R]], LRUCache[P, R]]:
+    """Wrap a function in a named, resizable LRU cache."""
+
+    def decorator(func: Callable[P, R]) -> LRUCache[P, R]:
+        """Decorator."""
+
+        cache = LRUCache(func, maxsize, typed)
+        MEMORY[name] = cache
+        return cache
+
+    return decorator
+
+
+def resize(name: str, maxsize: int | None) -> None:
+    """Resize a named in memory cache."""
+
+    cache = MEMORY.get(name)
+    if cache is None:
+        raise ValueError(f"'{name}' is not a known cache")
+    cache.resize(maxsize)
+
+
+def info() -> dict[str, CacheInfo]:
+    """Get the statistics of all named in memory caches."""
+
+    return {name: cache.cache_info() for name, cache in MEMORY.items()}
+
+
+def user_cache_dir() -> str:
+    """Get the default, platform specific, user cache directory."""
+
+    if sys.platform == 'win32':  # pragma: no cover
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+    elif sys.platform == 'darwin':  # pragma: no cover
+        base = os.path.expanduser(os.path.join('~', 'Library', 'Caches'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    return os.path.join(base, 'coloraide')
+
+
+def enable(path: str | None = None) -> None:
+    """Enable the cache using the given directory or the user cache directory."""
+
+    global _directory
+
+    _directory = os.path.abspath(path if path is not None else user_cache_dir())
+
+
+def disable() -> None:
+    """Disable the cache."""
+
+    global _directory
+
+    _directory = None
+
+
+def directory() -> str | None:
+    """Get the cache directory if the cache is enabled."""
+
+    return _directory
+
+
+def clear() -> None:
+    """Remove all cached tables from the cache directory."""
+
+    if _directory is None or not os.path.isdir(_directory):
+        return
+
+    for name in os.listdir(_directory):
+        if name.endswith(SUFFIX):
+            try:
+                os.remove(os.path.join(_directory, name))
+            except OSError:  # pragma: no cover
+                pass
+
+
+def _normalize(obj: Any) -> Any:
+    """Normalize an object into basic types with a stable representation."""
+
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    if hasattr(obj, 'items'):
+        return [[k, _normalize(v)] for k, v in obj.items()]
+    if isinstance(obj, Iterable):
+        return [_normalize(o) for o in obj]
+    raise TypeError(f"Cannot fingerprint an object of type '{type(obj).__name__}'")
+
+
+def fingerprint(*parts: Any) -> bytes:
+    """
+    Create a fingerprint from the parameters used to generate a table.
+
+    Parameters can be strings, numbers, or nested sequences and mappings of them, such as CMFs.
+    """
+
+    return hashlib.sha256(repr((__version__, VERSION, _normalize(parts))).encode('utf-8')).digest()
+
+
+def path(name: str, key: bytes) -> str | None:
+    """Get the file path for a table if the cache is enabled."""
+
+    if _directory is None:
+        return None
+    return os.path.join(_directory, f'{name}-{key.hex()[:16]}{SUFFIX}')
+
+
+def read(filename: str, key: bytes) -> array[float] | None:
+    """Read a table, returning `None` if it does not exist or is not valid."""
+
+    try:
+        with open(filename, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) < HEADER.size:
+        return None
+    magic, version, digest, count, crc = HEADER.unpack_from(data)
+    payload = data[HEADER.size:]
+    if (
+        magic != MAGIC or version != VERSION or digest != key or
+        len(payload) != count * 8 or zlib.crc32(payload) != crc
+    ):
+        return None
+
+    table = array('d')
+    table.frombytes(payload)
+    if sys.byteorder != 'little':  # pragma: no cover
+        table.byteswap()
+    return table
+
+
+def write(filename: str, key: bytes, table: array[float]) -> None:
+    """Write a table, replacing any existing table atomically. Failures are ignored."""
+
+    data = array('d', table)
+    if sys.byteorder != 'little':  # pragma: no cover
+        data.byteswap()
+    payload = data.tobytes()
+
+    try:
+        folder = os.path.dirname(filename)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=folder)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, key, len(table), zlib.crc32(payload)))
+                f.write(payload)
+            os.replace(tmp, filename)
+        except BaseException:  # pragma: no cover
+            os.remove(tmp)
+            raise
+    except OSError:  # pragma: no cover
+        pass
+
+
+def load(name: str, key: bytes, build: Callable[[], array[float]]) -> array[float]:
+    """
+    Load a table from the cache, building and storing it if it is not available.
+
+    If the cache is disabled, the table is simply built.
+    """
+
+    filename = path(name, key)
+    if filename is None:
+        return build()
+
+    table = read(filename, key)
+    if table is None:
+        table = build()
+        write(filename, key, table)
+    return table
+
+
+if os.environ.get('COLORAIDE_CACHE_DIR'):  # pragma: no cover
+    enable(os.environ['COLORAIDE_CACHE_DIR'])
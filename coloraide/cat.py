@@ -3,7 +3,7 @@ from __future__ import annotations
 from . import util
 from abc import ABCMeta, abstractmethod
 from . import algebra as alg
-import functools
+from . import cache
 from .types import Matrix, VectorLike, Vector, Plugin
 from typing import cast
 
@@ -46,7 +46,7 @@ WHITES = {
 }  # type: dict[str, dict[str, tuple[float, float]]]
 
 
-@functools.lru_cache(maxsize=20)
+@cache.memoize('cat', maxsize=20)
 def calc_adaptation_matrices(
     w1: tuple[float, float],
     w2: tuple[float, float],
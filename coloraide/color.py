@@ -5,8 +5,12 @@ import abc
 import functools
 import random
 import math
+import re  # noqa: F401
+import mmap
+from array import array
 from contextlib import contextmanager
 from . import cat
+from . import cache
 from . import distance
 from . import convert
 from . import gamut
@@ -23,6 +27,7 @@ from .channels import ANGLE_DEG, ANGLE_RAD, ANGLE_GRAD, ANGLE_TURN, ANGLE_NULL
 from .deprecate import warn_deprecated, deprecated
 from itertools import zip_longest as zipl
 from .css import parse
+from .css import serialize
 from .types import VectorLike, Vector, ColorInput
 from .spaces import Space
 from .spaces.hsv import HSV
@@ -70,6 +75,8 @@ from .gamut.fit_oklch_chroma import OkLChChroma
 from .gamut.fit_raytrace import RayTrace
 from .gamut.fit_scale import Scale
 from .gamut.fit_scale_luminance import ScaleLuminance
+from .gamut.fit_lut import LUTFit
+from .gamut import lut as gamut_lut
 from .cat import CAT, Bradford
 from .filters import Filter
 from .filters.w3c_filter_effects import Sepia, Brightness, Contrast, Saturate, Opacity, HueRotate, Grayscale, Invert
@@ -122,6 +129,36 @@ class ColorMatch:
     __repr__ = __str__
 
 
+def convert_caches(size: int | None) -> tuple[Any, Any]:
+    """Create the conversion chain and compiled conversion pipeline caches for a class."""
+
+    @classmethod  # type: ignore[misc]
+    @functools.lru_cache(maxsize=size)
+    def _get_convert_chain(
+        cls: type[Color],
+        space: Space,
+        target: str
+    ) -> list[tuple[Space, Space, int, bool]]:
+        """Resolve a conversion chain, cache it for speed."""
+
+        return convert.get_convert_chain(cls, space, target)
+
+    # Compiled conversion pipelines are cached alongside the conversion chains.
+    @classmethod  # type: ignore[misc]
+    @functools.lru_cache(maxsize=size)
+    def _get_converter(
+        cls: type[Color],
+        space: Space,
+        target: str,
+        cat: str
+    ) -> convert.Converter:
+        """Compile a conversion pipeline, cache it for speed."""
+
+        return convert.compile_chain(cls, space, target, cat)
+
+    return _get_convert_chain, _get_converter
+
+
 class ColorMeta(abc.ABCMeta):
     """Ensure on subclass that the subclass has new instances of mappings."""
 
@@ -141,23 +178,19 @@ class ColorMeta(abc.ABCMeta):
 
         # Ensure each derived class tracks its own conversion paths for color spaces
         # relative to the installed color space plugins.
-        @classmethod  # type: ignore[misc]
-        @functools.lru_cache(maxsize=256)
-        def _get_convert_chain(
-            cls: type[Color],
-            space: Space,
-            target: str
-        ) -> list[tuple[Space, Space, int, bool]]:
-            """Resolve a conversion chain, cache it for speed."""
-
-            return convert.get_convert_chain(cls, space, target)
+        cls._get_convert_chain, cls._get_converter = convert_caches(cls.CONVERT_CACHE_SIZE)  # type: ignore[attr-defined]
 
-        cls._get_convert_chain = _get_convert_chain
+        # Routing tables are not shared with the parent, and subclasses of frozen classes are not frozen.
+        cls._reset_routes()  # type: ignore[attr-defined]
 
 
 class Color(metaclass=ColorMeta):
     """Color class object which provides access and manipulation of color spaces."""
 
+    # Coordinates, including alpha, are stored in a packed array instead of a list of floats.
+    # Subclasses should also define empty slots to avoid creating an instance dictionary.
+    __slots__ = ('_space', '_coords')
+
     CS_MAP = {}  # type: dict[str, Space]
     DE_MAP = {}  # type: dict[str, DeltaE]
     FIT_MAP = {}  # type: dict[str, Fit]
@@ -179,6 +212,8 @@ class Color(metaclass=ColorMeta):
     CCT = util.DEF_CCT
     POWERLESS = False
     CARRYFORWARD = False
+    CONVERT_CACHE_SIZE = 256  # type: int | None
+    ROUTING_TABLE = False
 
     # It is highly unlikely that a user would ever need to override this, but
     # just in case, it is exposed, but undocumented.
@@ -190,6 +225,18 @@ class Color(metaclass=ColorMeta):
     #    XYZ -> sRGB Linear -> sRGB -> HSL -> HSV -> HWB
     _MAX_CONVERT_ITERATIONS = 10
 
+    # Parsing index of color spaces by serialization identifier, rebuilt on registration.
+    _MATCH_INDEX = ({}, {}, [])  # type: tuple[dict[str, list[Space]], dict[str, list[Space]], list[Space]]
+
+    # Patterns to find potential colors in buffers, for strings and bytes, rebuilt on registration.
+    _PREFILTER = (parse.RE_PREFILTER, parse.RE_PREFILTER_BYTES)  # type: tuple[re.Pattern[str], re.Pattern[bytes]]
+
+    # Precomputed conversion routes between all color spaces, maintained if `ROUTING_TABLE` is enabled.
+    _ROUTES = None  # type: convert.RoutingTable | None
+
+    # Frozen classes cannot register or deregister plugins.
+    _FROZEN = False
+
     def __init__(
         self,
         color: ColorInput,
@@ -222,6 +269,8 @@ class Color(metaclass=ColorMeta):
     def __getitem__(self, i: str | int | slice) -> float | Vector:
         """Get channels."""
 
+        if isinstance(i, slice):
+            return self._coords[i].tolist()
         return self._coords[self._space.get_channel_index(i)] if isinstance(i, str) else self._coords[i]
 
     @overload
@@ -259,7 +308,7 @@ class Color(metaclass=ColorMeta):
         data: VectorLike | None = None,
         alpha: float = util.DEF_ALPHA,
         **kwargs: Any
-    ) -> tuple[Space, Vector]:
+    ) -> tuple[Space, array[float]]:
         """Parse the color."""
 
         # Parse a color string or color space name and coordinates
@@ -276,7 +325,7 @@ class Color(metaclass=ColorMeta):
                     data = [*data, *[math.nan] * (num_channels - num_data)]
                 coords = [c.limit(v) for c, v in zipl(space_class.CHANNELS, data)]
                 coords.append(space_class.channels[-1].limit(alpha))
-                obj = space_class, coords
+                obj = space_class, array('d', coords)
 
             # Parse a CSS string
             else:
@@ -285,7 +334,7 @@ class Color(metaclass=ColorMeta):
                     raise ValueError(f"'{color}' is not a valid color")
                 coords = [c.limit(v) for c, v in zipl(m[0].CHANNELS, m[1])]
                 coords.append(m[0].channels[-1].limit(m[2]))
-                obj = m[0], coords
+                obj = m[0], array('d', coords)
 
         # Handle a color instance
         elif isinstance(color, Color):
@@ -293,7 +342,7 @@ class Color(metaclass=ColorMeta):
             space_class = cls.CS_MAP.get(cs.NAME)
             if not space_class or type(cs) is not type(space_class):
                 raise ValueError(f"{type(cs)} is not a registered color space within {cls}")
-            obj = space_class, color[:]
+            obj = space_class, array('d', color._coords)
 
         # Handle a color dictionary
         elif isinstance(color, Mapping):
@@ -317,20 +366,30 @@ class Color(metaclass=ColorMeta):
         This must return the color space, not the Color object.
         """
 
-        # Attempt color match
-        if string[start:start + 6].lower() == 'color(':
-            for space_class in cls.CS_MAP.values():
-                if not space_class.COLOR_FORMAT:  # pragma: no cover
-                    continue
-                m = parse.parse_css(space_class, string, start, fullmatch, True)
-                if m is not None:
-                    return space_class, m[0][0], m[0][1], start, m[1]
-
-        # Attempt color space specific match
-        for space_class in cls.CS_MAP.values():
-            m2 = space_class.match(string, start, fullmatch)
-            if m2 is not None:
-                return space_class, m2[0][0], m2[0][1], start, m2[1]
+        # Tokenize once and dispatch to the spaces registered for the token's identifier.
+        color_index, css_index, matchers = cls._MATCH_INDEX
+        tokens = parse.tokenize_css(string, start=start)
+        tried = []  # type: list[Space]
+        if tokens:
+            if 'func' in tokens and tokens['func']['name'] == 'color':
+                for space_class in color_index.get(tokens['id'], []):
+                    m = parse.parse_tokens(space_class, tokens, string, fullmatch, True)
+                    if m is not None:
+                        return space_class, m[0][0], m[0][1], start, m[1]
+            else:
+                tried = css_index.get(tokens['id'], [])
+                for space_class in tried:
+                    m = space_class.match(string, start, fullmatch)
+                    if m is not None:
+                        return space_class, m[0][0], m[0][1], start, m[1]
+
+        # Attempt any remaining color space specific matches
+        for space_class in matchers:
+            if space_class in tried:
+                continue
+            m = space_class.match(string, start, fullmatch)
+            if m is not None:
+                return space_class, m[0][0], m[0][1], start, m[1]
         return None
 
     @classmethod
@@ -347,6 +406,109 @@ class Color(metaclass=ColorMeta):
             return ColorMatch(cls(m[0].NAME, m[1], m[2]), m[3], m[4])
         return None
 
+    @classmethod
+    def finditer(
+        cls,
+        string: str | bytes | bytearray | mmap.mmap,
+        start: int = 0,
+        end: int | None = None
+    ) -> Iterator[ColorMatch]:
+        """
+        Find all colors within a buffer.
+
+        Buffers can be strings or byte buffers such as `bytes` or `mmap`. Potential colors are located
+        with a prefilter that finds hex codes, CSS color functions, CSS color names, and the identifiers
+        of registered spaces that provide their own syntax, and then each candidate is matched. Byte
+        buffers are decoded in small windows, so positions are byte offsets. Functions and custom syntax
+        cut off by the window are retried with a larger window, up to `parse.MAX_MATCH_LENGTH`.
+        """
+
+        is_str = isinstance(string, str)
+        pattern = cls._PREFILTER[0] if is_str else cls._PREFILTER[1]  # type: Any
+        close = ')' if is_str else b')'  # type: Any
+        length = len(string)
+        end = length if end is None else min(end, length)
+        pos = start
+
+        while pos < end:
+            m = pattern.search(string, pos, end)
+            if m is None:
+                break
+
+            pos = m.start()
+            stop = min(pos + parse.MAX_MATCH_WINDOW, end)
+            window = string[pos:stop]
+            result = cls._match(window if isinstance(window, str) else window.decode('latin-1'))
+
+            # The window may have cut off a long function or custom syntax, so grow it in bounded steps.
+            # Functions are grown to their end, while custom syntax is grown by doubling the window.
+            kind = m.lastgroup
+            if result is None and kind is not None and stop < end and (kind != 'func' or close not in window):
+                limit = min(pos + parse.MAX_MATCH_LENGTH, end)
+                if kind == 'func':
+                    index = string.find(close, stop, limit)
+                    if index != -1:
+                        window = string[pos:index + 1]
+                        result = cls._match(window if isinstance(window, str) else window.decode('latin-1'))
+                else:
+                    while result is None and stop < limit:
+                        stop = min(pos + (stop - pos) * 2, limit)
+                        window = string[pos:stop]
+                        result = cls._match(window if isinstance(window, str) else window.decode('latin-1'))
+
+            if result is None:
+                pos += 1
+                continue
+
+            yield ColorMatch(cls(result[0].NAME, result[1], result[2]), pos, pos + result[4])
+            pos += result[4]
+
+    @classmethod
+    def from_hex_many(cls, colors: Iterable[str]) -> list[Self]:
+        """
+        Create sRGB colors from many hexadecimal color strings.
+
+        Strings must be exactly a hex color (`#rgb`, `#rgba`, `#rrggbb`, or `#rrggbbaa`). Channels are
+        decoded via lookup tables without tokenizing the strings.
+        """
+
+        cs = cls.CS_MAP.get('srgb')
+        if cs is None:
+            raise ValueError("'srgb' is not a registered color space")
+
+        results = []
+        for value in colors:
+            obj = cls.__new__(cls)
+            obj._space = cs
+            obj._coords = parse.decode_hex(value)
+            results.append(obj)
+        return results
+
+    @classmethod
+    def to_hex_many(
+        cls,
+        colors: Iterable[Color],
+        *,
+        alpha: bool | None = None,
+        fit: bool | str | dict[str, Any] = True,
+        upper: bool = False,
+        compress: bool = False
+    ) -> list[str]:
+        """
+        Serialize many colors as hexadecimal color strings.
+
+        Colors not in sRGB are converted to sRGB. Results match `to_string(hex=True)`, but the given
+        colors are never modified.
+        """
+
+        return serialize.hexadecimal_many(
+            (c if c.space() == 'srgb' else c.convert('srgb') for c in colors),
+            alpha,
+            fit,
+            upper,
+            compress
+        )
+
     @classmethod
     def _is_this_color(cls, obj: Any) -> bool:
         """Test if the input is "this" Color, not a subclass."""
@@ -359,16 +521,200 @@ class Color(metaclass=ColorMeta):
 
         return isinstance(obj, Color)
 
+    @classmethod
+    def _clear_convert_cache(cls) -> None:
+        """
+        Clear cached conversion chains and compiled conversion pipelines.
+
+        As this is called whenever color spaces are registered or deregistered, the
+        color space parsing index is rebuilt as well.
+        """
+
+        cls._get_convert_chain.cache_clear()
+        cls._get_converter.cache_clear()
+        cls._update_routes()
+        cls._index_spaces()
+
+    @classmethod
+    def _reset_routes(cls) -> None:
+        """Reset the routing table and frozen state for a new class."""
+
+        cls._ROUTES = None
+        cls._FROZEN = False
+        cls._update_routes()
+
+    @classmethod
+    def _update_routes(cls) -> None:
+        """Update the routing table if enabled."""
+
+        if cls.ROUTING_TABLE:
+            if cls._ROUTES is None:
+                cls._ROUTES = convert.RoutingTable()
+            cls._ROUTES.update(cls)
+        else:
+            cls._ROUTES = None
+
+    @classmethod
+    def _check_frozen(cls) -> None:
+        """Raise an error if the class is frozen."""
+
+        if cls._FROZEN:
+            raise RuntimeError(f"'{cls.__name__}' is frozen and cannot be modified")
+
+    @classmethod
+    def _index_spaces(cls) -> None:
+        """
+        Index color spaces by their serialization identifiers for parsing.
+
+        `color()` identifiers map to spaces that support the `color()` format and all other identifiers
+        map to spaces that provide their own matching. Order of registration is preserved so that
+        precedence is the same as iterating the registered spaces.
+        """
+
+        color_index = {}  # type: dict[str, list[Space]]
+        css_index = {}  # type: dict[str, list[Space]]
+        matchers = []  # type: list[Space]
+        idents = set()  # type: set[str]
+        for space in cls.CS_MAP.values():
+            ids = space.SERIALIZE or (space.NAME,)
+            if space.COLOR_FORMAT:
+                for i in ids:
+                    color_index.setdefault(i, []).append(space)
+            if type(space).match is not Space.match:
+                matchers.append(space)
+                for i in ids:
+                    css_index.setdefault(i, []).append(space)
+                    # Spaces with their own syntax are assumed to start with their identifier.
+                    # Those that are CSS functions are already found by the prefilter.
+                    ident = i.lstrip('-')
+                    if ident and not parse.RE_CSS_FUNC.fullmatch(ident):
+                        idents.add(ident)
+        cls._MATCH_INDEX = (color_index, css_index, matchers)
+        cls._PREFILTER = parse.compile_prefilter(tuple(sorted(idents)))
+
+    @classmethod
+    def converter(cls, space: str, target: str) -> convert.Converter:
+        """
+        Get a compiled conversion pipeline between two color spaces.
+
+        Consecutive linear steps are collapsed into a single matrix. Coordinates passed to
+        the converter should not contain undefined values (NaN).
+        """
+
+        cs = cls.CS_MAP.get(space)
+        if cs is None:
+            raise ValueError(f"'{space}' is not a valid color space")
+        converter = cls._get_converter(cs, target, cls.CHROMATIC_ADAPTATION)  # type: convert.Converter
+        return converter
+
+    @classmethod
+    def set_cache_size(cls, size: int | None) -> None:
+        """
+        Set the size of the class's conversion chain and compiled conversion pipeline caches.
+
+        Resizing discards all cached entries. `None` allows the caches to grow without bound.
+        """
+
+        cls._check_frozen()
+        cls.CONVERT_CACHE_SIZE = size
+        cls._get_convert_chain, cls._get_converter = convert_caches(size)
+
+    @classmethod
+    def precompute(cls) -> None:
+        """
+        Compile conversion pipelines between every pair of registered color spaces.
+
+        If the conversion caches are too small to hold every pair, they are enlarged.
+        """
+
+        size = cls.CONVERT_CACHE_SIZE
+        total = len(cls.CS_MAP) ** 2
+        if size is not None and size < total:
+            cls.set_cache_size(total)
+
+        adaptation = cls.CHROMATIC_ADAPTATION
+        for cs in cls.CS_MAP.values():
+            for target in cls.CS_MAP:
+                cls._get_converter(cs, target, adaptation)
+
+    @classmethod
+    def freeze(cls) -> type[Self]:
+        """
+        Create a frozen subclass that can be safely shared across threads.
+
+        Routes and compiled conversion pipelines between all registered color spaces are calculated
+        up front and stored in read only caches. Plugins cannot be registered or deregistered.
+        """
+
+        frozen = cast(
+            'type[Self]',
+            type(
+                cls.__name__,
+                (cls,),
+                {
+                    '__module__': cls.__module__,
+                    '__qualname__': cls.__qualname__,
+                    '__doc__': cls.__doc__,
+                    '__slots__': (),
+                    'ROUTING_TABLE': True
+                }
+            )
+        )
+
+        adaptation = frozen.CHROMATIC_ADAPTATION
+        chains = {}
+        converters = {}
+        for cs in frozen.CS_MAP.values():
+            for target in frozen.CS_MAP:
+                chains[(cs, target)] = convert.get_convert_chain(frozen, cs, target)
+                converter = convert.compile_chain(frozen, cs, target, adaptation)
+                # Resolve array kernels now so they are not resolved lazily later.
+                converter.kernel()
+                converters[(cs, target, adaptation)] = converter
+
+        frozen._get_convert_chain = convert.FrozenCache(
+            functools.partial(convert.get_convert_chain, frozen),
+            chains
+        )
+        frozen._get_converter = convert.FrozenCache(
+            functools.partial(convert.compile_chain, frozen),
+            converters
+        )
+        frozen._FROZEN = True
+        return frozen
+
+    @classmethod
+    def cache_info(cls) -> dict[str, cache.CacheInfo]:
+        """
+        Get the statistics of all internal caches.
+
+        Conversion caches are specific to the class while all other caches are shared.
+        """
+
+        info = {
+            'convert_chain': cache.stats(cls._get_convert_chain.cache_info()),
+            'converter': cache.stats(cls._get_converter.cache_info())
+        }
+        info.update(cache.info())
+        return info
+
     @classmethod
     def register(
         cls,
         plugin: Plugin | Sequence[Plugin],
         *,
         overwrite: bool = False,
-        silent: bool = False
+        silent: bool = False,
+        precompute: bool = False
     ) -> None:
-        """Register the hook."""
+        """
+        Register the hook.
 
+        If `precompute` is enabled, conversion pipelines between all registered color spaces are
+        compiled after registration.
+        """
+
+        cls._check_frozen()
         reset_convert_cache = False
         mapping = None  # type: Any
         p = None  # type: Any
@@ -384,6 +730,7 @@ class Color(metaclass=ColorMeta):
                 p = i
             elif isinstance(i, CAT):
                 mapping = cls.CAT_MAP
+                reset_convert_cache = True
                 p = i
             elif isinstance(i, Filter):
                 mapping = cls.FILTER_MAP
@@ -402,29 +749,33 @@ class Color(metaclass=ColorMeta):
                 p = i
                 if p.NAME == 'clip':
                     if reset_convert_cache:  # pragma: no cover
-                        cls._get_convert_chain.cache_clear()
+                        cls._clear_convert_cache()
                     if not silent:
                         raise ValueError("'{}' is a reserved name for gamut mapping/reduction and cannot be overridden")
                     continue  # pragma: no cover
             else:
                 if reset_convert_cache:  # pragma: no cover
-                    cls._get_convert_chain.cache_clear()
+                    cls._clear_convert_cache()
                 raise TypeError(f"Cannot register plugin of type '{type(i)}'")
 
             if p.NAME != "*" and (p.NAME not in mapping or overwrite):
                 mapping[p.NAME] = p
             elif not silent:
                 if reset_convert_cache:  # pragma: no cover
-                    cls._get_convert_chain.cache_clear()
+                    cls._clear_convert_cache()
                 raise ValueError(f"A plugin of name '{p.NAME}' already exists or is not allowed")
 
         if reset_convert_cache:
-            cls._get_convert_chain.cache_clear()
+            cls._clear_convert_cache()
+
+        if precompute:
+            cls.precompute()
 
     @classmethod
     def deregister(cls, plugin: str | Sequence[str], *, silent: bool = False) -> None:
         """Deregister a plugin by name of specified plugin type."""
 
+        cls._check_frozen()
         reset_convert_cache = False
 
         if isinstance(plugin, str):
@@ -441,6 +792,7 @@ class Color(metaclass=ColorMeta):
                 cls.INTERPOLATE_MAP.clear()
                 cls.CCT_MAP.clear()
                 cls.FIT_MAP.clear()
+                cls._clear_convert_cache()
                 return
 
             ptype, name = p.split(':', 1)
@@ -451,6 +803,7 @@ class Color(metaclass=ColorMeta):
                 mapping = cls.DE_MAP
             elif ptype == 'cat':
                 mapping = cls.CAT_MAP
+                reset_convert_cache = True
             elif ptype == 'filter':
                 mapping = cls.FILTER_MAP
             elif ptype == 'contrast':
@@ -463,7 +816,7 @@ class Color(metaclass=ColorMeta):
                 mapping = cls.FIT_MAP
                 if name == 'clip':
                     if reset_convert_cache:  # pragma: no cover
-                        cls._get_convert_chain.cache_clear()
+                        cls._clear_convert_cache()
                     if not silent:
                         raise ValueError(
                             f"'{name}' is a reserved name gamut mapping/reduction and cannot be removed"
@@ -471,7 +824,7 @@ class Color(metaclass=ColorMeta):
                     continue  # pragma: no cover
             else:
                 if reset_convert_cache:  # pragma: no cover
-                    cls._get_convert_chain.cache_clear()
+                    cls._clear_convert_cache()
                 raise ValueError(f"The plugin category of '{ptype}' is not recognized")
 
             if name == '*':
@@ -480,11 +833,11 @@ class Color(metaclass=ColorMeta):
                 del mapping[name]
             elif not silent:
                 if reset_convert_cache:
-                    cls._get_convert_chain.cache_clear()
+                    cls._clear_convert_cache()
                 raise ValueError(f"A plugin of name '{name}' under category '{ptype}' could not be found")
 
         if reset_convert_cache:
-            cls._get_convert_chain.cache_clear()
+            cls._clear_convert_cache()
 
     @classmethod
     def random(cls, space: str, *, limits: Sequence[Sequence[float] | None] | None = None) -> Self:
@@ -631,7 +984,10 @@ class Color(metaclass=ColorMeta):
     def clone(self) -> Self:
         """Clone."""
 
-        return self.new(self.space(), self[:-1], self[-1])
+        obj = self.__class__.__new__(self.__class__)
+        obj._space = self._space
+        obj._coords = self._coords[:]
+        return obj
 
     def convert(
         self,
@@ -649,7 +1005,8 @@ class Color(metaclass=ColorMeta):
 
         # Actually convert the color
         this = self if in_place else self.clone()
-        this._space, this._coords[:-1] = convert.convert(self, space)
+        this._space, coords = convert.convert(self, space)
+        this._coords[:-1] = array('d', coords)
 
         # Normalize achromatic colors, but skip if we internally don't need this.
         if norm and this._space.is_polar() and this.is_achromatic():
@@ -725,7 +1082,7 @@ class Color(metaclass=ColorMeta):
         We expect it to be a color object, no special parsing, we just want to go fast.
         """
 
-        self._space, self._coords = self.CS_MAP[color.space()], color[:]
+        self._space, self._coords = self.CS_MAP[color.space()], array('d', color._coords)
         return self
 
     def to_string(self, **kwargs: Any) -> str:
@@ -989,6 +1346,19 @@ class Color(metaclass=ColorMeta):
 
         return adapter.adapt(tuple(w1), tuple(w2), xyz)  # type: ignore[arg-type]
 
+    @classmethod
+    def bake_fit_lut(
+        cls,
+        src_space: str,
+        dst_space: str,
+        method: str | None = None,
+        size: int = 33,
+        **kwargs: Any
+    ) -> gamut_lut.FitLUT:
+        """Bake a gamut mapping method into a 3D LUT for use with the `lut` fit method."""
+
+        return gamut_lut.bake(cls, src_space, dst_space, method, size, **kwargs)
+
     def clip(self, space: str | None = None) -> Self:
         """Clip the color channels."""
 
@@ -1147,6 +1517,7 @@ class Color(metaclass=ColorMeta):
         max_delta_e: float = 0,
         delta_e: str | None = None,
         delta_e_args: dict[str, Any] | None = None,
+        adaptive: bool = False,
         **interpolate_args: Any
     ) -> list[Self]:
         """Discrete steps."""
@@ -1156,7 +1527,14 @@ class Color(metaclass=ColorMeta):
         if domain is not None:
             interpolate_args['domain'] = interpolate.normalize_domain(domain)
 
-        return cls.interpolate(colors, **interpolate_args).steps(steps, max_steps, max_delta_e, delta_e, delta_e_args)
+        return cls.interpolate(colors, **interpolate_args).steps(
+            steps,
+            max_steps,
+            max_delta_e,
+            delta_e,
+            delta_e_args,
+            adaptive
+        )
 
     @classmethod
     def discrete(
@@ -1171,6 +1549,7 @@ class Color(metaclass=ColorMeta):
         delta_e: str | None = None,
         delta_e_args: dict[str, Any] | None = None,
         domain: Vector | None = None,
+        adaptive: bool = False,
         **interpolate_args: Any
     ) -> Interpolator[Self]:
         """Create a discrete interpolation."""
@@ -1179,7 +1558,7 @@ class Color(metaclass=ColorMeta):
         num = sum((not callable(c) or not isinstance(c, interpolate.stop)) for c in colors) if steps is None else steps
         i = cls.interpolate(colors, space=space, **interpolate_args)
         # Convert the interpolation into a discretized interpolation with the requested number of steps
-        i = i.discretize(num, max_steps, max_delta_e, delta_e, delta_e_args)
+        i = i.discretize(num, max_steps, max_delta_e, delta_e, delta_e_args, adaptive)
         if domain is not None:
             i.domain(domain)
         if out_space is not None:
@@ -1312,6 +1691,17 @@ class Color(metaclass=ColorMeta):
 
         return filters.filters(self, name, amount, space, out_space, in_place, **kwargs)
 
+    @classmethod
+    def filter_chain(cls, requests: Sequence[filters.FilterRequest]) -> filters.FilterChain:
+        """
+        Compile a series of filters that can be applied to colors or color arrays.
+
+        Each request is a filter name, or a sequence of a name, an amount, and a dictionary
+        of keyword arguments.
+        """
+
+        return filters.compile_filters(cls, requests)
+
     def harmony(
         self,
         name: str,
@@ -1709,6 +2099,7 @@ Color.register(
         RayTrace(),
         Scale(),
         ScaleLuminance(),
+        LUTFit(),
 
         # Filters
         Sepia(),
@@ -1,7 +1,12 @@
 """Convert the color."""
 from __future__ import annotations
-from .types import Vector
-from typing import TYPE_CHECKING
+import functools
+from . import algebra as alg
+from . import kernels
+from .cat import VonKries, calc_adaptation_matrices
+from .spaces.xyz_d65 import XYZD65
+from .types import Vector, VectorLike, Matrix
+from typing import Any, Callable, Iterable, Sequence, TYPE_CHECKING  # noqa: F401
 
 if TYPE_CHECKING:  # pragma: no cover
     from .spaces import Space
@@ -66,6 +71,13 @@ def get_convert_chain(
     a chromatic adaptation will need to occur.
     """
 
+    # Use the precomputed routes if available
+    routes = color._ROUTES
+    if routes is not None:
+        routed = routes.chain(space, target)
+        if routed is not None:
+            return routed
+
     # Get the color space chain for the current space to XYZ
     from_color, from_color_index = calc_path_to_xyz(color, target)
 
@@ -119,6 +131,146 @@ def get_convert_chain(
     return chain
 
 
+class RoutingTable:
+    """
+    Conversion routes between every pair of registered color spaces.
+
+    Routes are stored as tuples of integer steps, `(from, to, direction, adapt)`, where `from` and `to`
+    index into the registered color spaces. When updated, only routes involving color spaces that were
+    added, replaced, or whose path to XYZ D65 changed are recalculated. If color spaces are removed,
+    the table is rebuilt.
+    """
+
+    __slots__ = ('spaces', 'index', 'paths', 'routes')
+
+    def __init__(self) -> None:
+        """Initialize."""
+
+        self.spaces = ()  # type: tuple[Space, ...]
+        self.index = {}  # type: dict[str, int]
+        self.paths = []  # type: list[tuple[int, ...] | None]
+        self.routes = {}  # type: dict[tuple[int, int], tuple[tuple[int, int, int, bool], ...]]
+
+    def __len__(self) -> int:
+        """Number of routes."""
+
+        return len(self.routes)
+
+    def update(self, color: type[Color]) -> None:
+        """Update the routes for the color spaces registered in the given class."""
+
+        spaces = tuple(color.CS_MAP.values())
+        index = {cs.NAME: i for i, cs in enumerate(spaces)}
+        paths = []  # type: list[tuple[int, ...] | None]
+        for cs in spaces:
+            try:
+                paths.append(tuple(index[p.NAME] for p in calc_path_to_xyz(color, cs.NAME)[0]))
+            except KeyError:
+                # Color spaces that do not resolve to XYZ D65 are left to fail during conversion.
+                paths.append(None)
+
+        old = self.spaces
+        total = len(old)
+        if len(spaces) >= total and all(a.NAME == b.NAME for a, b in zip(old, spaces)):
+            routes = self.routes
+            changed = {
+                i for i in range(len(spaces))
+                if i >= total or spaces[i] is not old[i] or paths[i] != self.paths[i]
+            }
+        else:
+            routes = {}
+            changed = set(range(len(spaces)))
+
+        for i in range(len(spaces)):
+            src = paths[i]
+            for j in range(len(spaces)):
+                if i not in changed and j not in changed:
+                    continue
+                dst = paths[j]
+                if src is None or dst is None:
+                    routes.pop((i, j), None)
+                else:
+                    routes[(i, j)] = self.route(spaces, src, dst)
+
+        self.spaces = spaces
+        self.index = index
+        self.paths = paths
+        self.routes = routes
+
+    @staticmethod
+    def route(
+        spaces: tuple[Space, ...],
+        src: tuple[int, ...],
+        dst: tuple[int, ...]
+    ) -> tuple[tuple[int, int, int, bool], ...]:
+        """
+        Calculate the route between two color spaces given their paths to XYZ D65.
+
+        Moves towards XYZ D65 until a color space in the target's path is reached, and then away from it.
+        """
+
+        position = {i: p for p, i in enumerate(dst)}
+        steps = []
+        current = src[0]
+        for base in src[1:]:
+            if current in position:
+                break
+            adapt = spaces[base].NAME == ABSOLUTE_BASE and spaces[current].WHITE != spaces[base].WHITE
+            steps.append((current, base, 0, adapt))
+            current = base
+
+        for p in range(position[current] - 1, -1, -1):
+            base = current
+            current = dst[p]
+            adapt = spaces[base].NAME == ABSOLUTE_BASE and spaces[current].WHITE != spaces[base].WHITE
+            steps.append((base, current, 1, adapt))
+        return tuple(steps)
+
+    def chain(self, space: Space, target: str) -> list[tuple[Space, Space, int, bool]] | None:
+        """Get the conversion chain between two color spaces, or `None` if there is no route."""
+
+        i = self.index.get(space.NAME)
+        j = self.index.get(target)
+        if i is None or j is None or self.spaces[i] is not space:
+            return None
+        steps = self.routes.get((i, j))
+        if steps is None:
+            return None
+        spaces = self.spaces
+        return [(spaces[a], spaces[b], direction, adapt) for a, b, direction, adapt in steps]
+
+
+class FrozenCache:
+    """
+    A read only cache of precomputed results.
+
+    Results that were not precomputed are calculated, but are not stored.
+    """
+
+    __slots__ = ('func', 'results')
+
+    def __init__(self, func: Callable[..., Any], results: dict[Any, Any]) -> None:
+        """Initialize."""
+
+        self.func = func
+        self.results = results
+
+    def __call__(self, *args: Any) -> Any:
+        """Get the result."""
+
+        result = self.results.get(args)
+        return self.func(*args) if result is None else result
+
+    def cache_clear(self) -> None:
+        """Frozen caches cannot be cleared."""
+
+    def cache_info(self) -> functools._CacheInfo:
+        """Get cache info. Hits and misses are not tracked."""
+
+        size = len(self.results)
+        return functools._CacheInfo(0, 0, size, size)
+
+
 def convert(color: Color, space: str) -> tuple[Space, Vector]:
     """Convert the color coordinates to the specified space."""
 
@@ -150,3 +302,158 @@ def convert(color: Color, space: str) -> tuple[Space, Vector]:
         last = b
 
     return last, coords
+
+
+class Converter:
+    """
+    A compiled conversion pipeline between two color spaces.
+
+    Consecutive stages that are purely linear (linear RGB to and from XYZ, XYZ white point
+    changes, and von Kries style chromatic adaptation) are collapsed into a single matrix.
+    All other stages are called as is.
+
+    When NumPy is available and every stage has an array kernel, large batches passed to
+    `many` are converted as arrays.
+    """
+
+    __slots__ = ('source', 'target', 'steps', '_kernel')
+
+    def __init__(self, source: str, target: str, steps: list[Matrix | Callable[[Vector], Vector]]) -> None:
+        """Initialize."""
+
+        self.source = source
+        self.target = target
+        self.steps = steps
+        self._kernel = None  # type: Callable[[Any], Any] | None | bool
+
+    def __call__(self, coords: VectorLike) -> Vector:
+        """
+        Convert a set of coordinates.
+
+        Coordinates are expected to be free of undefined values (NaN).
+        """
+
+        c = list(coords)
+        for step in self.steps:
+            c = alg.matmul_x3(step, c, dims=alg.D2_D1) if isinstance(step, list) else step(c)
+        return c
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """Representation."""
+
+        return f"Converter(source='{self.source}', target='{self.target}', steps={len(self.steps)})"
+
+    __str__ = __repr__
+
+    def kernel(self) -> Callable[[Any], Any] | None:
+        """Get the array kernel for the pipeline if one is available."""
+
+        if not kernels.available():
+            return None
+        if self._kernel is None:
+            self._kernel = kernels.compile_steps(self.steps) or False
+        return self._kernel if callable(self._kernel) else None
+
+    def many(self, coords: Iterable[VectorLike]) -> list[Vector]:
+        """Convert many sets of coordinates."""
+
+        if not isinstance(coords, Sequence):
+            coords = list(coords)
+        if len(coords) >= kernels.MIN_BATCH:
+            run = self.kernel()
+            if run is not None:
+                return kernels.convert_many(run, coords)
+        return [self(c) for c in coords]
+
+
+def linear_matrix(space: Space, attr: str, method: str) -> Matrix | None:
+    """
+    Get a linear space's conversion matrix if it is what the space's conversion method applies.
+
+    The matrix is only used if the conversion method is the exact function defined alongside the
+    matrix. If a subclass overrides the method, or the matrix, the method must be called instead.
+    """
+
+    cls = type(space)
+    for c in cls.__mro__:
+        if attr in c.__dict__:
+            return getattr(space, attr) if getattr(cls, method) is c.__dict__.get(method) else None
+    return None
+
+
+def compile_chain(
+    color: type[Color],
+    space: Space,
+    target: str,
+    cat: str
+) -> Converter:
+    """
+    Compile a conversion chain into a single callable.
+
+    Linear RGB spaces (those that provide `TO_XYZ` and `TO_RGB` matrices) and von Kries
+    based chromatic adaptation are translated to matrices, and consecutive matrices are
+    multiplied together so that they are applied as one.
+    """
+
+    chain = color._get_convert_chain(space, target)
+    adapter = color.CAT_MAP.get(cat)
+    if adapter is None:
+        raise ValueError(f"'{cat}' is not a supported CAT")
+    linear_cat = isinstance(adapter, VonKries) and type(adapter).adapt is VonKries.adapt
+
+    steps = []  # type: list[Matrix | Callable[[Vector], Vector]]
+
+    def add(step: Matrix | Callable[[Vector], Vector]) -> None:
+        """Add a step, combining it with the previous step if both are matrices."""
+
+        if isinstance(step, list) and steps and isinstance(steps[-1], list):
+            steps[-1] = alg.matmul_x3(step, steps[-1], dims=alg.D2)
+        else:
+            steps.append(step)
+
+    def add_adaptation(w1: VectorLike, w2: VectorLike) -> None:
+        """Add a chromatic adaptation step."""
+
+        if linear_cat:
+            if tuple(w1) != tuple(w2):
+                add(calc_adaptation_matrices(w1, w2, adapter.MATRIX))  # type: ignore[attr-defined, arg-type]
+        else:
+            add(functools.partial(color.chromatic_adaptation, w1, w2, method=cat))
+
+    for a, b, direction, adapt in chain:
+        if direction:
+            if adapt:
+                add_adaptation(a.WHITE, b.WHITE)
+            if type(b).from_base is XYZD65.from_base:
+                continue
+            m = linear_matrix(b, 'TO_RGB', 'from_base')
+            add(b.from_base if m is None else m)
+        else:
+            if type(a).to_base is not XYZD65.to_base:
+                m = linear_matrix(a, 'TO_XYZ', 'to_base')
+                add(a.to_base if m is None else m)
+            if adapt:
+                add_adaptation(a.WHITE, b.WHITE)
+
+    # Ensure matrices are not shared with the original space definitions.
+    return Converter(space.NAME, target, [([*map(list, s)] if isinstance(s, list) else s) for s in steps])
+
+
+def convert_many(
+    color: type[Color],
+    space: Space,
+    target: str,
+    coords: Iterable[Vector]
+) -> tuple[Space, list[Vector]]:
+    """
+    Convert many sets of coordinates from one color space to another.
+
+    Coordinates are expected to be free of undefined values (NaN). The compiled conversion
+    pipeline is resolved once for the entire batch instead of once per color.
+    """
+
+    if space.NAME == target:
+        return space, [c[:] for c in coords]
+
+    converter = color._get_converter(space, target, color.CHROMATIC_ADAPTATION)
+    return color.CS_MAP[target], converter.many(coords)
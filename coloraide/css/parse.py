@@ -2,17 +2,21 @@
 from __future__ import annotations
 import re
 import math
+from array import array
 from .. import algebra as alg
+from .. import cache
 from ..types import Vector
 from . import color_names
 from ..channels import Channel, FLG_ANGLE, ANGLE_DEG
 from typing import TYPE_CHECKING, Any
-import functools
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..spaces import Space
 
 RGB_CHANNEL_SCALE = 1.0 / 255.0
+# Decoded values of all 8 bit hex channels and of single digit hex channels (`f` is `ff`).
+HEX_DECODE = tuple(i * RGB_CHANNEL_SCALE for i in range(256))
+HEX_DIGIT = {d: HEX_DECODE[int(d, 16) * 17] for d in '0123456789abcdefABCDEF'}
 SCALE_PERCENT = 1 / 100.0
 MAX_CHANNELS = 16
 
@@ -32,6 +36,55 @@ RE_COMMA = re.compile(r'\s*(,)\s*')
 RE_SLASH = re.compile(r'\s*(/)\s*')
 RE_CSS_FUNC = re.compile(r'\b(color|rgba?|hsla?|hwb|(?:ok)?lab|(?:ok)?lch|jzazbz|jzczhz|ictcp)\b')
 
+# Prefilter to quickly find locations within a buffer that may contain a color.
+# Hex codes, CSS color functions, and CSS color names are considered. Candidates that can be longer
+# than the match window, opened functions and custom identifiers, are captured in named groups.
+PREFILTER = r'''
+(?:
+    # Hex codes
+    \#(?=[a-f0-9]{{3}})|
+    # CSS functions
+    (?P<func>\b(?<!-)(?:color|rgba?|hsla?|hwb|(?:ok)?lab|(?:ok)?lch|jzazbz|jzczhz|ictcp)\()|
+    # Color names
+    \b(?<!-)(?:{names})\b(?![-(])
+)
+'''.format(names='|'.join(sorted(color_names.name2val_map, key=len, reverse=True)))
+RE_PREFILTER = re.compile(PREFILTER, re.I | re.X)
+RE_PREFILTER_BYTES = re.compile(PREFILTER.encode('ascii'), re.I | re.X)
+
+# Window of a buffer, starting from a potential color, that is considered for a match.
+MAX_MATCH_WINDOW = 1024
+# Largest window a potential color that is cut off by the match window can be grown to.
+MAX_MATCH_LENGTH = 1 << 16
+
+
+@cache.memoize('prefilter', maxsize=20)
+def compile_prefilter(idents: tuple[str, ...]) -> tuple[re.Pattern[str], re.Pattern[bytes]]:
+    """
+    Compile a prefilter that also finds the given identifiers.
+
+    Identifiers are used to find colors of registered spaces that provide their own syntax.
+    """
+
+    if not idents:
+        return RE_PREFILTER, RE_PREFILTER_BYTES
+
+    # Match longer identifiers first.
+    idents = tuple(sorted(idents, key=len, reverse=True))
+    extra = r'|(?P<ident>(?<![-\w])(?:{})(?![-\w]))'
+    pattern = PREFILTER + extra.format('|'.join(re.escape(i) for i in idents))
+    encoded = []
+    for i in idents:
+        try:
+            encoded.append(re.escape(i.encode('latin-1')))
+        except UnicodeEncodeError:
+            # Buffers are decoded as Latin-1, so such identifiers can never be found in bytes.
+            continue
+    pattern_bytes = PREFILTER.encode('ascii')
+    if encoded:
+        pattern_bytes += extra.encode('ascii').replace(b'{}', b'|'.join(encoded))
+    return re.compile(pattern, re.I | re.X), re.compile(pattern_bytes, re.I | re.X)
+
 
 def norm_float(string: str) -> float:
     """Normalize a float value."""
@@ -138,6 +191,38 @@ def parse_hex(color: str) -> tuple[Vector, float]:
         )
 
 
+def decode_hex(color: str) -> array[float]:
+    """
+    Decode a hexadecimal color directly into sRGB coordinates and alpha.
+
+    No tokenizing is performed, the string must be exactly a hex color.
+    """
+
+    length = len(color)
+    if color[:1] == '#':
+        if length == 7 or length == 9:
+            try:
+                values = bytes.fromhex(color[1:])
+            except ValueError:
+                values = b''
+            # `fromhex` allows whitespace between bytes, so make sure all the digits were consumed.
+            if len(values) * 2 + 1 == length:
+                coords = array('d', [HEX_DECODE[v] for v in values])
+                if length == 7:
+                    coords.append(1.0)
+                return coords
+        elif length == 4 or length == 5:
+            try:
+                coords = array('d', [HEX_DIGIT[d] for d in color[1:]])
+            except KeyError:
+                pass
+            else:
+                if length == 4:
+                    coords.append(1.0)
+                return coords
+    raise ValueError(f"'{color}' is not a valid hex color")
+
+
 def parse_rgb_channels(color: list[str], boundry: tuple[Channel, ...]) -> tuple[Vector, float]:
     """Parse CSS RGB format."""
 
@@ -306,7 +391,7 @@ def validate_lch(tokens: dict[str, Any]) -> bool:
     return True
 
 
-@functools.lru_cache(maxsize=1)
+@cache.memoize('tokenize_css', maxsize=1)
 def tokenize_css(css: str, start: int = 0) -> dict[str, Any]:
     """Tokenize the CSS string."""
 
@@ -452,12 +537,22 @@ def parse_css(
 ) -> tuple[tuple[Vector, float], int] | None:
     """Match a CSS color string."""
 
+    return parse_tokens(cspace, tokenize_css(string, start=start), string, fullmatch, color)
+
+
+def parse_tokens(
+    cspace: Space,
+    tokens: dict[str, Any],
+    string: str,
+    fullmatch: bool = True,
+    color: bool = False
+) -> tuple[tuple[Vector, float], int] | None:
+    """Match already tokenized CSS color string."""
+
     target = cspace.SERIALIZE
     if not target:
         target = (cspace.NAME,)
 
-    tokens = tokenize_css(string, start=start)
-
     # Could we parse it?
     if not tokens:
         return None
@@ -7,13 +7,17 @@ from .. import algebra as alg
 from .color_names import to_name
 from ..channels import FLG_ANGLE, ANGLE_DEG, ANGLE_RAD, ANGLE_GRAD, ANGLE_TURN, ANGLE_RANGE
 from ..types import Vector
-from typing import Sequence, Any, TYPE_CHECKING
+from typing import Iterable, Sequence, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:  #pragma: no cover
     from ..color import Color
 
 RE_COMPRESS = re.compile(r'(?i)^#([a-f0-9])\1([a-f0-9])\2([a-f0-9])\3(?:([a-f0-9])\4)?$')
 
+# Hex digits of all 8 bit channel values.
+HEX_LOWER = tuple(f'{i:02x}' for i in range(256))
+HEX_UPPER = tuple(f'{i:02X}' for i in range(256))
+
 COMMA = ', '
 SLASH = ' / '
 SPACE = ' '
@@ -196,6 +200,42 @@ def hexadecimal(
         return value
 
 
+def hexadecimal_many(
+    colors: Iterable[Color],
+    alpha: bool | None = None,
+    fit: str | bool | dict[str, Any] = True,
+    upper: bool = False,
+    compress: bool = False
+) -> list[str]:
+    """
+    Get the hex `RGB` values of many sRGB colors.
+
+    Colors that are in gamut are quantized and encoded directly as gamut mapping would only clip
+    them. Other colors, or requests for gamut mapping with options, are serialized normally.
+    """
+
+    digits = HEX_UPPER if upper else HEX_LOWER
+    direct = not isinstance(fit, dict)
+    values = []
+    for obj in colors:
+        cs = obj._space
+        coords = obj.coords(nans=False)
+        if not direct or not all(0.0 <= c <= 1.0 for c in coords):
+            values.append(hexadecimal(obj.clone(), alpha, fit, upper, compress))
+            continue
+
+        channels = [int(c * 255.0 + 0.5) for c in coords]
+        a = cs.resolve_channel(-1, obj._coords)
+        if alpha is not False and (alpha is True or a < 1.0):
+            channels.append(int(a * 255.0 + 0.5))
+
+        if compress and all(c % 17 == 0 for c in channels):
+            values.append('#' + EMPTY.join([digits[c][0] for c in channels]))
+        else:
+            values.append('#' + EMPTY.join([digits[c] for c in channels]))
+    return values
+
+
 def serialize_css(
     obj: Color,
     func: str = '',
@@ -3,7 +3,8 @@ from __future__ import annotations
 import math
 from .. import algebra as alg
 from abc import ABCMeta, abstractmethod
-from ..types import ColorInput, Plugin, AnyColor
+from ..palette import Palette
+from ..types import ColorInput, Plugin, AnyColor, Vector
 from typing import Any, Sequence
 
 
@@ -17,6 +18,11 @@ def closest(color: AnyColor, colors: Sequence[ColorInput], method: str | None =
     if not algorithm:
         raise ValueError(f"'{method}' is not currently a supported distancing algorithm.")
 
+    # Methods related to Euclidean distance can use a spatial index to avoid comparing every color.
+    # Methods without a bound, such as delta E 2000, compare every color.
+    if type(algorithm).bound is not DeltaE.bound:
+        return Palette(type(color), colors, method=method, **kwargs).nearest(color)
+
     lowest = math.inf
     closest = None
     for c in colors:
@@ -69,3 +75,25 @@ class DeltaE(Plugin, metaclass=ABCMeta):
     @abstractmethod
     def distance(self, color: AnyColor, sample: AnyColor, **kwargs: Any) -> float:
         """Get distance between color and sample."""
+
+    def working_space(self, color: type[AnyColor], **kwargs: Any) -> tuple[str, Vector] | None:
+        """
+        Get the rectangular color space distances are calculated in along with per channel scales.
+
+        Spatial searches convert colors to this space and apply the scales to the coordinates.
+        `None` is returned if the space is not known.
+        """
+
+        return None
+
+    def bound(self, color: AnyColor, **kwargs: Any) -> tuple[float, bool]:
+        """
+        Relate the distance to Euclidean distance in the working space.
+
+        `color` will be in the working space. Returns a factor such that the factor multiplied by
+        the Euclidean distance between the scaled coordinates of `color` and any sample is a lower
+        bound of the distance between the two. Also returns whether the bound is exact, or in other
+        words, the distance is the scaled Euclidean distance. A factor of zero means no bound is known.
+        """
+
+        return 0.0, False
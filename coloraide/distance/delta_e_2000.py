@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 from . import DeltaE
 from ..spaces.lab import CIELab
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 
 
@@ -163,3 +163,12 @@ class DE2000(DeltaE):
             (dh / (kh * sh)) ** 2 +
             rt * (dc / (kc * sc)) * (dh / (kh * sh))
         )
+
+    def working_space(self, color: type[AnyColor], space: str | None = None, **kwargs: Any) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        if space is None:
+            space = self.space
+        if not isinstance(color.CS_MAP[space], CIELab):
+            raise ValueError("Distance color space must be a CIE Lab color space.")
+        return space, [1.0, 1.0, 1.0]
@@ -1,7 +1,7 @@
 """Delta E 76."""
 from __future__ import annotations
 from . import DeltaE, distance_euclidean
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 from ..spaces.lab import CIELab
 
@@ -38,3 +38,17 @@ class DE76(DeltaE):
 
         # Equation (1)
         return distance_euclidean(color, sample, space=space)
+
+    def working_space(self, color: type[AnyColor], space: str | None = None, **kwargs: Any) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        if space is None:
+            space = self.space
+        if not isinstance(color.CS_MAP[space], CIELab):
+            raise ValueError("Distance color space must be a CIE Lab color space.")
+        return space, [1.0, 1.0, 1.0]
+
+    def bound(self, color: AnyColor, **kwargs: Any) -> tuple[float, bool]:
+        """Distance is Euclidean."""
+
+        return 1.0, True
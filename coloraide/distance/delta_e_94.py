@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 from . import DeltaE
 from ..spaces.lab import CIELab
-from .. types import AnyColor
+from .. types import AnyColor, Vector
 from typing import Any
 
 
@@ -111,3 +111,38 @@ class DE94(DeltaE):
             # Square root just the denominator as `dh` is already squared.
             dh / ((kh * sh) ** 2)
         )
+
+    def working_space(self, color: type[AnyColor], space: str | None = None, **kwargs: Any) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        if space is None:
+            space = self.space
+        if not isinstance(color.CS_MAP[space], CIELab):
+            raise ValueError("Distance color space must be a CIE Lab color space.")
+        return space, [1.0, 1.0, 1.0]
+
+    def bound(
+        self,
+        color: AnyColor,
+        kl: float | None = None,
+        k1: float | None = None,
+        k2: float | None = None,
+        **kwargs: Any
+    ) -> tuple[float, bool]:
+        """
+        Weights only depend on the reference color.
+
+        As the squared chroma and hue differences sum to the squared difference of `a` and `b`,
+        the distance is at least the Euclidean distance divided by the largest weight.
+        """
+
+        if kl is None:
+            kl = self.kl
+        if k1 is None:
+            k1 = self.k1
+        if k2 is None:
+            k2 = self.k2
+
+        _, a1, b1 = color.coords(nans=False)
+        c1 = math.sqrt(a1 ** 2 + b1 ** 2)
+        return 1 / max(kl, 1 + k1 * c1, 1 + k2 * c1), False
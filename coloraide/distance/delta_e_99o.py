@@ -5,7 +5,7 @@ https://de.wikipedia.org/wiki/DIN99-Farbraum
 """
 from __future__ import annotations
 from . import DeltaE, distance_euclidean
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 
 
@@ -18,3 +18,13 @@ class DE99o(DeltaE):
         """Get delta E 99o."""
 
         return distance_euclidean(color, sample, space='din99o')
+
+    def working_space(self, color: type[AnyColor], **kwargs: Any) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        return 'din99o', [1.0, 1.0, 1.0]
+
+    def bound(self, color: AnyColor, **kwargs: Any) -> tuple[float, bool]:
+        """Distance is Euclidean."""
+
+        return 1.0, True
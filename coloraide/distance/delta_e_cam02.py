@@ -14,7 +14,7 @@ import math
 from . import DeltaE
 from ..spaces.cam02_ucs import CAM02UCS
 from ..spaces.cam16_ucs import COEFFICENTS
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 
 
@@ -47,3 +47,21 @@ class DECAM02(DeltaE):
         db = b1 - b2
 
         return math.sqrt((dj / kl) ** 2 + da ** 2 + db ** 2)
+
+    def working_space(
+        self,
+        color: type[AnyColor],
+        space: str = "cam02-ucs",
+        **kwargs: Any
+    ) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        cs = color.CS_MAP[space]
+        if not isinstance(cs, CAM02UCS):
+            raise ValueError("Distance color space must be derived from CAM02UCS.")
+        return space, [1 / COEFFICENTS[cs.MODEL][0], 1.0, 1.0]
+
+    def bound(self, color: AnyColor, **kwargs: Any) -> tuple[float, bool]:
+        """Distance is weighted Euclidean."""
+
+        return 1.0, True
@@ -7,7 +7,7 @@ from __future__ import annotations
 import math
 from . import DeltaE
 from ..spaces.cam16_ucs import COEFFICENTS, CAM16UCS
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 
 
@@ -40,3 +40,21 @@ class DECAM16(DeltaE):
         db = b1 - b2
 
         return math.sqrt((dj / kl) ** 2 + da ** 2 + db ** 2)
+
+    def working_space(
+        self,
+        color: type[AnyColor],
+        space: str = "cam16-ucs",
+        **kwargs: Any
+    ) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        cs = color.CS_MAP[space]
+        if not isinstance(cs, CAM16UCS):
+            raise ValueError("Distance color space must be derived from CAM16UCS.")
+        return space, [1 / COEFFICENTS[cs.MODEL][0], 1.0, 1.0]
+
+    def bound(self, color: AnyColor, **kwargs: Any) -> tuple[float, bool]:
+        """Distance is weighted Euclidean."""
+
+        return 1.0, True
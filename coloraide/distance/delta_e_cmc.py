@@ -3,7 +3,7 @@ from __future__ import annotations
 from . import DeltaE
 from ..spaces.lab import CIELab
 import math
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 
 
@@ -24,6 +24,45 @@ class DECMC(DeltaE):
         self.c = c
         self.space = space
 
+    def _weights(self, l1: float, a1: float, b1: float) -> tuple[float, float, float]:
+        """Calculate the lightness, chroma, and hue weights which only depend on the reference color."""
+
+        # Equation (3)
+        c1 = math.sqrt(a1 ** 2 + b1 ** 2)
+
+        # Equation (9)
+        if l1 < 16:
+            sl = 0.511
+        else:
+            sl = (0.040975 * l1) / (1 + 0.01765 * l1)
+
+        # Equation (10)
+        sc = ((0.0638 * c1) / (1 + 0.0131 * c1)) + 0.638
+
+        # Equation (14)
+        h = math.degrees(math.atan2(b1, a1))
+
+        # Equation (15)
+        if h >= 0:
+            h1 = h
+        else:
+            h1 = h + 360
+
+        # Equation (12)
+        if 164 <= h1 <= 345:
+            t = 0.56 + abs(0.2 * math.cos(math.radians(h1 + 168)))
+        else:
+            t = 0.36 + abs(0.4 * math.cos(math.radians(h1 + 35)))
+
+        # Equation (13)
+        c1_4 = c1 ** 4
+        f = math.sqrt(c1_4 / (c1_4 + 1900))
+
+        # Equation (11)
+        sh = sc * (f * t + 1 - f)
+
+        return sl, sc, sh
+
     def distance(
         self,
         color: AnyColor,
@@ -77,36 +116,7 @@ class DECMC(DeltaE):
         # algorithm. Instead we can just leave the result as is.
         dh = da ** 2 + db ** 2 - dc ** 2
 
-        # Equation (9)
-        if l1 < 16:
-            sl = 0.511
-        else:
-            sl = (0.040975 * l1) / (1 + 0.01765 * l1)
-
-        # Equation (10)
-        sc = ((0.0638 * c1) / (1 + 0.0131 * c1)) + 0.638
-
-        # Equation (14)
-        h = math.degrees(math.atan2(b1, a1))
-
-        # Equation (15)
-        if h >= 0:
-            h1 = h
-        else:
-            h1 = h + 360
-
-        # Equation (12)
-        if 164 <= h1 <= 345:
-            t = 0.56 + abs(0.2 * math.cos(math.radians(h1 + 168)))
-        else:
-            t = 0.36 + abs(0.4 * math.cos(math.radians(h1 + 35)))
-
-        # Equation (13)
-        c1_4 = c1 ** 4
-        f = math.sqrt(c1_4 / (c1_4 + 1900))
-
-        # Equation (11)
-        sh = sc * (f * t + 1 - f)
+        sl, sc, sh = self._weights(l1, a1, b1)
 
         # Equation (1)
         return math.sqrt(
@@ -115,3 +125,34 @@ class DECMC(DeltaE):
             # Square root just the denominator as `dh` is already squared.
             dh / (sh ** 2)
         )
+
+    def working_space(self, color: type[AnyColor], space: str | None = None, **kwargs: Any) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        if space is None:
+            space = self.space
+        if not isinstance(color.CS_MAP[space], CIELab):
+            raise ValueError("Distance color space must be a CIE Lab color space.")
+        return space, [1.0, 1.0, 1.0]
+
+    def bound(
+        self,
+        color: AnyColor,
+        l: float | None = None,
+        c: float | None = None,
+        **kwargs: Any
+    ) -> tuple[float, bool]:
+        """
+        Weights only depend on the reference color.
+
+        As the squared chroma and hue differences sum to the squared difference of `a` and `b`,
+        the distance is at least the Euclidean distance divided by the largest weight.
+        """
+
+        if l is None:
+            l = self.l
+        if c is None:
+            c = self.c
+
+        sl, sc, sh = self._weights(*color.coords(nans=False))
+        return 1 / max(l * sl, c * sc, sh), False
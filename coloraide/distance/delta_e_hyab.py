@@ -3,7 +3,7 @@ from __future__ import annotations
 from . import DeltaE
 import math
 from ..spaces import Labish
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 
 
@@ -38,3 +38,17 @@ class DEHyAB(DeltaE):
         l2, a2, b2 = sample.get(names, nans=False)
 
         return abs(l1 - l2) + math.sqrt((a1 - a2) ** 2 + (b1 - b2) ** 2)
+
+    def working_space(self, color: type[AnyColor], space: str | None = None, **kwargs: Any) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        if space is None:
+            space = self.space
+        if not isinstance(color.CS_MAP[space], Labish):
+            raise ValueError(f"The space '{space}' is not a 'lab-ish' color space and cannot use HyAB")
+        return space, [1.0, 1.0, 1.0]
+
+    def bound(self, color: AnyColor, **kwargs: Any) -> tuple[float, bool]:
+        """The sum of the lightness and chroma differences is never less than the Euclidean distance."""
+
+        return 1.0, False
@@ -6,7 +6,7 @@ https://kb.portrait.com/help/ictcp-color-difference-metric
 from __future__ import annotations
 import math
 from . import DeltaE
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 
 
@@ -31,3 +31,14 @@ class DEITP(DeltaE):
 
         # Equation (1)
         return scalar * math.sqrt((i1 - i2) ** 2 + 0.25 * (t1 - t2) ** 2 + (p1 - p2) ** 2)
+
+    def working_space(self, color: type[AnyColor], **kwargs: Any) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        # Equation (1) weights T by 0.25, which is a scale of 0.5 on the coordinate.
+        return 'ictcp', [1.0, 0.5, 1.0]
+
+    def bound(self, color: AnyColor, scalar: float | None = None, **kwargs: Any) -> tuple[float, bool]:
+        """Distance is scaled Euclidean."""
+
+        return (self.scalar if scalar is None else scalar), True
@@ -1,7 +1,7 @@
 """Delta E OK."""
 from __future__ import annotations
 from . import DeltaE, distance_euclidean
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 
 
@@ -26,3 +26,13 @@ class DEOK(DeltaE):
             scalar = self.scalar
 
         return scalar * distance_euclidean(color, sample, space='oklab')
+
+    def working_space(self, color: type[AnyColor], **kwargs: Any) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        return 'oklab', [1.0, 1.0, 1.0]
+
+    def bound(self, color: AnyColor, scalar: float | None = None, **kwargs: Any) -> tuple[float, bool]:
+        """Distance is scaled Euclidean."""
+
+        return (self.scalar if scalar is None else scalar), True
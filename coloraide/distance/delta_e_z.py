@@ -6,7 +6,7 @@ https://www.osapublishing.org/oe/fulltext.cfm?uri=oe-25-13-15131&id=368272
 from __future__ import annotations
 import math
 from . import DeltaE
-from ..types import AnyColor
+from ..types import AnyColor, Vector
 from typing import Any
 
 
@@ -32,3 +32,17 @@ class DEZ(DeltaE):
         dhz = 2 * math.sqrt(cz1 * cz2) * math.sin((hz1 - hz2) / 2)
 
         return math.sqrt(djz ** 2 + dcz ** 2 + dhz ** 2)
+
+    def working_space(self, color: type[AnyColor], **kwargs: Any) -> tuple[str, Vector]:
+        """Get the working space."""
+
+        return 'jzazbz', [1.0, 1.0, 1.0]
+
+    def bound(self, color: AnyColor, **kwargs: Any) -> tuple[float, bool]:
+        """
+        Distance is Euclidean.
+
+        The squared chroma and hue differences sum to the squared difference of `az` and `bz`.
+        """
+
+        return 1.0, True
@@ -66,6 +66,8 @@ __all__ = ('ColorAll', 'ColorMatch', 'stop', 'hint', 'NaN')
 class ColorAll(Base):
     """Color with all plugins."""
 
+    __slots__ = ()
+
 
 ColorAll.register(
     [
@@ -1,11 +1,20 @@
 """Provides a plugin system for filtering colors."""
 from __future__ import annotations
 from abc import ABCMeta, abstractmethod
-from ..types import Plugin, AnyColor
-from typing import Any, TYPE_CHECKING
+from functools import partial
+from .. import algebra as alg
+from ..types import Plugin, AnyColor, Matrix, Vector
+from typing import Any, Callable, Sequence, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:  #pragma: no cover
     from ..color import Color
+    from ..batch import ColorArray
+
+# A 3x3 matrix applied to the color channels, an offset added afterwards, and a factor alpha is scaled by.
+Affine = tuple[Matrix, Vector, float]
+
+# A filter request: a name, or a name with an amount and optional keyword arguments.
+FilterRequest = Union[str, Sequence[Any]]
 
 
 class Filter(Plugin, metaclass=ABCMeta):
@@ -19,17 +28,18 @@ class Filter(Plugin, metaclass=ABCMeta):
     def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
         """Filter the given color."""
 
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine | None:
+        """
+        Get the filter as an affine transform of the color channels, if possible.
 
-def filters(
-    color: AnyColor,
-    name: str,
-    amount: float | None = None,
-    space: str | None = None,
-    out_space: str | None = None,
-    in_place: bool = False,
-    **kwargs: Any
-) -> AnyColor:
-    """Filter."""
+        Filters that cannot be expressed as a matrix and offset should return `None`.
+        """
+
+        return None
+
+
+def resolve(color: type[Color], name: str, space: str | None) -> tuple[Filter, str]:
+    """Get the filter plugin and the space to filter in."""
 
     f = color.FILTER_MAP.get(name)
     if not f:
@@ -42,6 +52,21 @@ def filters(
         raise ValueError(
             f"The '{name}' only supports filtering in the {f.ALLOWED_SPACES!s} spaces, not '{space}'"
         )
+    return f, space
+
+
+def filters(
+    color: AnyColor,
+    name: str,
+    amount: float | None = None,
+    space: str | None = None,
+    out_space: str | None = None,
+    in_place: bool = False,
+    **kwargs: Any
+) -> AnyColor:
+    """Filter."""
+
+    f, space = resolve(type(color), name, space)
 
     if out_space is None:
         out_space = space
@@ -49,3 +74,132 @@ def filters(
     c = color.convert(space, in_place=in_place, norm=False).normalize()
     f.filter(c, amount, **kwargs)
     return c.convert(out_space, in_place=True)
+
+
+def affine(color: Color, transform: Affine) -> None:
+    """Apply an affine transform to a color."""
+
+    m, offset, alpha = transform
+    coords = alg.matmul_x3(m, color[:-1], dims=alg.D2_D1)
+    color[:-1] = [c + o for c, o in zip(coords, offset)]
+    if alpha != 1.0:
+        color[-1] = color[-1] * alpha
+
+
+def combine(first: Affine, second: Affine) -> Affine:
+    """Combine two affine transforms into one that applies the first and then the second."""
+
+    m1, offset1, alpha1 = first
+    m2, offset2, alpha2 = second
+    offset = alg.matmul_x3(m2, offset1, dims=alg.D2_D1)
+    return (
+        alg.matmul_x3(m2, m1, dims=alg.D2),
+        [a + b for a, b in zip(offset, offset2)],
+        alpha1 * alpha2
+    )
+
+
+class FilterChain:
+    """
+    A compiled series of filters.
+
+    Consecutive filters that are affine transforms in the same color space (e.g. sepia,
+    saturate, brightness, contrast, opacity, and Viénot or Machado CVD simulation) are
+    combined into a single matrix and offset. Other filters, like Brettel CVD simulation,
+    are applied as is.
+    """
+
+    __slots__ = ('steps',)
+
+    def __init__(self, steps: list[tuple[str, Affine | Callable[[Color], None]]]) -> None:
+        """Initialize."""
+
+        self.steps = steps
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """Representation."""
+
+        return f"FilterChain(steps={len(self.steps)})"
+
+    __str__ = __repr__
+
+    def __call__(self, color: AnyColor, *, out_space: str | None = None, in_place: bool = False) -> AnyColor:
+        """
+        Filter a color.
+
+        If `out_space` is not given, the color is returned in the space of the last filter.
+        """
+
+        c = color if in_place else color.clone()
+        for space, step in self.steps:
+            c.convert(space, in_place=True, norm=False).normalize()
+            if isinstance(step, tuple):
+                affine(c, step)
+            else:
+                step(c)
+        return c if out_space is None else c.convert(out_space, in_place=True)
+
+    def many(self, colors: ColorArray[AnyColor], *, out_space: str | None = None) -> ColorArray[AnyColor]:
+        """
+        Filter an array of colors in place.
+
+        Colors are converted once per filtering space for the whole batch.
+        """
+
+        for space, step in self.steps:
+            colors.convert(space, in_place=True, norm=False)
+            if isinstance(step, tuple) and colors._stride == 4:
+                _affine_many(colors, step)
+            elif isinstance(step, tuple):
+                colors._apply(lambda c, t=step: affine(c.normalize(), t))
+            else:
+                colors._apply(lambda c, f=step: f(c.normalize()))
+        return colors if out_space is None else colors.convert(out_space, in_place=True)
+
+
+def _affine_many(colors: ColorArray[Any], transform: Affine) -> None:
+    """Apply an affine transform to an array of colors with 3 channels."""
+
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = transform[0]
+    o0, o1, o2 = transform[1]
+    alpha = transform[2]
+    n0, n1, n2 = [c.nans for c in colors._space.CHANNELS]
+    data = colors.data
+    for i in range(0, len(data), 4):
+        r, g, b, a = data[i:i + 4]
+        if r != r:
+            r = n0
+        if g != g:
+            g = n1
+        if b != b:
+            b = n2
+        data[i] = m00 * r + m01 * g + m02 * b + o0
+        data[i + 1] = m10 * r + m11 * g + m12 * b + o1
+        data[i + 2] = m20 * r + m21 * g + m22 * b + o2
+        data[i + 3] = 0.0 if a != a else a * alpha
+
+
+def compile_filters(color: type[Color], requests: Sequence[FilterRequest]) -> FilterChain:
+    """
+    Compile a series of filters.
+
+    Each request is a filter name, or a sequence of a name, an amount, and a dictionary of
+    keyword arguments, which may include the `space` to filter in.
+    """
+
+    steps = []  # type: list[tuple[str, Affine | Callable[[Color], None]]]
+    for request in requests:
+        args = (request,) if isinstance(request, str) else request  # type: Sequence[Any]
+        name = args[0]  # type: str
+        amount = args[1] if len(args) > 1 else None  # type: float | None
+        kwargs = dict(args[2]) if len(args) > 2 else {}  # type: dict[str, Any]
+        f, space = resolve(color, name, kwargs.pop('space', None))
+
+        transform = f.matrix(amount, **kwargs)
+        if transform is None:
+            steps.append((space, partial(f.filter, amount=amount, **kwargs)))
+        elif steps and steps[-1][0] == space and isinstance(steps[-1][1], tuple):
+            steps[-1] = (space, combine(steps[-1][1], transform))
+        else:
+            steps.append((space, transform))
+    return FilterChain(steps)
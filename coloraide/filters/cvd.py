@@ -1,7 +1,7 @@
 """Color vision deficiency."""
 from __future__ import annotations
 from .. import algebra as alg
-from . import Filter
+from . import Filter, Affine
 from ..types import Vector, Matrix
 from typing import Any, Callable, TYPE_CHECKING
 
@@ -171,6 +171,30 @@ def vienot(color: Color, severity: float, transform: Matrix) -> None:
         color[:-1] = coords
 
 
+def vienot_matrix(severity: float, transform: Matrix) -> Matrix:
+    """Get the Viénot transform as a single matrix, interpolated against the identity matrix for lower severities."""
+
+    if severity < 1:
+        return [
+            [alg.lerp(1.0 if i == j else 0.0, v, severity) for j, v in enumerate(row)]
+            for i, row in enumerate(transform)
+        ]
+    return transform
+
+
+def machado_matrix(severity: float, matrices: dict[int, Matrix]) -> Matrix:
+    """Get the Machado transform as a single matrix, interpolating the matrices of the nearest severities."""
+
+    severity *= 10
+    severity1 = int(severity)
+    m1 = matrices[severity1]
+    if severity1 != severity and severity1 < 10:
+        weight = severity - severity1
+        m2 = matrices[severity1 + 1]
+        return [[alg.lerp(a, b, weight) for a, b in zip(r1, r2)] for r1, r2 in zip(m1, m2)]
+    return m1
+
+
 def machado(color: Color, severity: float, matrices: dict[int, Matrix]) -> None:
     """
     Machado approach to protanopia, deuteranopia, and tritanopia.
@@ -262,6 +286,18 @@ class Protan(Filter):
             method = self.severe if max_severity else self.anomalous
         return self.select_filter(method)
 
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine | None:
+        """Get the Viénot or Machado filter as a matrix, Brettel's two-plane approach cannot be expressed as one."""
+
+        method = kwargs.get('method')  # type: str | None
+        amount = alg.clamp(1 if amount is None else amount, 0, 1)
+        f = self.get_best_filter(method, amount == 1)
+        if f == self.vienot:
+            return vienot_matrix(amount, self.VIENOT), [0.0, 0.0, 0.0], 1.0
+        elif f == self.machado:
+            return machado_matrix(amount, self.MACHADO), [0.0, 0.0, 0.0], 1.0
+        return None
+
     def filter(self, color: Color, amount: float | None = None, **kwargs: Any) -> None:  # noqa: A003
         """Filter the color."""
 
@@ -1,7 +1,7 @@
 """Provide filters as described by the https://www.w3.org/TR/filter-effects-1/."""
 from __future__ import annotations
 import math
-from . import Filter
+from . import Filter, Affine
 from .. import algebra as alg
 from typing import Any, TYPE_CHECKING
 
@@ -19,14 +19,20 @@ def linear_transfer(value: float, slope: float = 1.0, intercept: float = 0.0) ->
     return value * slope + intercept
 
 
+def diagonal(slope: float, intercept: float = 0.0, alpha: float = 1.0) -> Affine:
+    """Get an affine transform that applies the same linear transfer function to each channel."""
+
+    return [[slope, 0.0, 0.0], [0.0, slope, 0.0], [0.0, 0.0, slope]], [intercept] * 3, alpha
+
+
 class Sepia(Filter):
     """Sepia filter."""
 
     NAME = 'sepia'
     ALLOWED_SPACES = ('srgb-linear', 'srgb')
 
-    def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
-        """Apply a sepia filter to the color."""
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine:
+        """Get the sepia matrix."""
 
         amount = 1 - alg.clamp(1 if amount is None else amount, 0, 1)
 
@@ -36,7 +42,12 @@ class Sepia(Filter):
             [0.272 - 0.272 * amount, 0.534 - 0.534 * amount, 0.131 + 0.869 * amount]
         ]
 
-        color[:-1] = alg.matmul_x3(m, color[:-1], dims=alg.D2_D1)
+        return m, [0.0, 0.0, 0.0], 1.0
+
+    def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
+        """Apply a sepia filter to the color."""
+
+        color[:-1] = alg.matmul_x3(self.matrix(amount)[0], color[:-1], dims=alg.D2_D1)
 
 
 class Grayscale(Filter):
@@ -45,8 +56,8 @@ class Grayscale(Filter):
     NAME = 'grayscale'
     ALLOWED_SPACES = ('srgb-linear', 'srgb')
 
-    def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
-        """Apply a grayscale filter to the color."""
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine:
+        """Get the grayscale matrix."""
 
         amount = 1 - alg.clamp(1 if amount is None else amount, 0, 1)
 
@@ -56,7 +67,12 @@ class Grayscale(Filter):
             [0.2126 - 0.2126 * amount, 0.7152 - 0.7152 * amount, 0.0722 + 0.9278 * amount]
         ]
 
-        color[:-1] = alg.matmul_x3(m, color[:-1], dims=alg.D2_D1)
+        return m, [0.0, 0.0, 0.0], 1.0
+
+    def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
+        """Apply a grayscale filter to the color."""
+
+        color[:-1] = alg.matmul_x3(self.matrix(amount)[0], color[:-1], dims=alg.D2_D1)
 
 
 class Saturate(Filter):
@@ -65,8 +81,8 @@ class Saturate(Filter):
     NAME = 'saturate'
     ALLOWED_SPACES = ('srgb-linear', 'srgb')
 
-    def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
-        """Apply a saturation filter to the color."""
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine:
+        """Get the saturation matrix."""
 
         amount = max(1 if amount is None else amount, 0)
 
@@ -76,7 +92,12 @@ class Saturate(Filter):
             [0.213 - 0.213 * amount, 0.715 - 0.715 * amount, 0.072 + 0.928 * amount]
         ]
 
-        color[:-1] = alg.matmul_x3(m, color[:-1], dims=alg.D2_D1)
+        return m, [0.0, 0.0, 0.0], 1.0
+
+    def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
+        """Apply a saturation filter to the color."""
+
+        color[:-1] = alg.matmul_x3(self.matrix(amount)[0], color[:-1], dims=alg.D2_D1)
 
 
 class Invert(Filter):
@@ -85,6 +106,12 @@ class Invert(Filter):
     NAME = 'invert'
     ALLOWED_SPACES = ('srgb-linear', 'srgb')
 
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine:
+        """Get the invert filter as a matrix and offset."""
+
+        amount = alg.clamp(1 if amount is None else amount, 0, 1)
+        return diagonal(1 - 2 * amount, amount)
+
     def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
         """Apply an invert filter."""
 
@@ -99,6 +126,11 @@ class Opacity(Filter):
     NAME = 'opacity'
     ALLOWED_SPACES = ('srgb-linear', 'srgb')
 
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine:
+        """Get the opacity filter as an alpha scale."""
+
+        return diagonal(1.0, alpha=alg.clamp(1 if amount is None else amount, 0, 1))
+
     def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
         """Apply an opacity filter."""
 
@@ -112,6 +144,11 @@ class Brightness(Filter):
     NAME = 'brightness'
     ALLOWED_SPACES = ('srgb-linear', 'srgb')
 
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine:
+        """Get the brightness filter as a matrix."""
+
+        return diagonal(max(1 if amount is None else amount, 0))
+
     def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
         """Apply a brightness filter."""
 
@@ -126,6 +163,12 @@ class Contrast(Filter):
     NAME = 'contrast'
     ALLOWED_SPACES = ('srgb-linear', 'srgb')
 
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine:
+        """Get the contrast filter as a matrix and offset."""
+
+        amount = max(1 if amount is None else amount, 0)
+        return diagonal(amount, (1 - amount) * 0.5)
+
     def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
         """Apply a contrast filter."""
 
@@ -140,8 +183,8 @@ class HueRotate(Filter):
     NAME = 'hue-rotate'
     ALLOWED_SPACES = ('srgb-linear', 'srgb')
 
-    def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
-        """Apply a hue rotation filter."""
+    def matrix(self, amount: float | None, **kwargs: Any) -> Affine:
+        """Get the hue rotation matrix."""
 
         rad = math.radians(0 if amount is None else amount)
         cos = math.cos(rad)
@@ -153,4 +196,9 @@ class HueRotate(Filter):
             [0.213 - cos * 0.213 - sin * 0.787, 0.715 - cos * 0.715 + sin * 0.715, 0.072 + cos * 0.928 + sin * 0.072]
         ]
 
-        color[:-1] = alg.matmul_x3(m, color[:-1], dims=alg.D2_D1)
+        return m, [0.0, 0.0, 0.0], 1.0
+
+    def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
+        """Apply a hue rotation filter."""
+
+        color[:-1] = alg.matmul_x3(self.matrix(amount)[0], color[:-1], dims=alg.D2_D1)
@@ -2,11 +2,11 @@
 from __future__ import annotations
 import math
 from abc import ABCMeta, abstractmethod
-from functools import lru_cache
 from . import pointer
 from . import visible_spectrum
 from .. import util
 from .. import algebra as alg
+from .. import cache
 from ..channels import FLG_ANGLE
 from ..types import Plugin, Vector, VectorLike
 from ..spaces import Prism, Luminant, Space, HSLish, HSVish, HWBish
@@ -49,7 +49,7 @@ def srgb_to_hwb(coords: Vector) -> Vector:  # pragma: no cover
     return hsv_to_hwb(srgb_to_hsv(coords))
 
 
-@lru_cache(maxsize=20, typed=True)
+@cache.memoize('coerce_to_rgb', maxsize=20, typed=True)
 def coerce_to_rgb(cs: Space) -> Space:
     """
     Coerce an HSL, HSV, or HWB color space to RGB to allow us to ray trace the gamut.
@@ -0,0 +1,35 @@
+"""Gamut mapping by interpolating a baked 3D lookup table."""
+from __future__ import annotations
+from . import Fit, clip_channels
+from .lut import FitLUT
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .. import Color
+
+
+class LUTFit(Fit):
+    """Gamut mapping with a 3D lookup table baked from another gamut mapping method."""
+
+    NAME = "lut"
+
+    def fit(
+        self,
+        color: Color,
+        space: str,
+        *,
+        lut: FitLUT | None = None,
+        interpolation: str = 'trilinear',
+        **kwargs: Any
+    ) -> None:
+        """Approximate the baked gamut mapping method by interpolating the LUT."""
+
+        if lut is None:
+            raise ValueError("The 'lut' gamut mapping method requires a LUT to be provided via 'lut'")
+        if lut.target != space:
+            raise ValueError(f"The LUT maps to '{lut.target}' and cannot be used to fit '{space}'")
+
+        coords = lut.apply(color.convert(lut.source, norm=False).coords(nans=False), interpolation)
+        mapcolor = color.new(space, coords, color.alpha(nans=False))
+        clip_channels(mapcolor)
+        color.update(mapcolor)
@@ -1,12 +1,13 @@
 """Fit by compressing chroma in LCh."""
 from __future__ import annotations
-import functools
 from . import Fit, clip_channels
 from ..cat import WHITES
 from .. import util
 import math
 from .. import algebra as alg
+from .. import cache
 from .tools import adaptive_hue_independent
+from ..spaces import Space
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:  #pragma: no cover
@@ -17,13 +18,126 @@ WHITE = util.xy_to_xyz(WHITES['2deg']['D65'])
 BLACK = [0.0, 0.0, 0.0]
 
 
-@functools.lru_cache(maxsize=10)
+@cache.memoize('minde_epsilon', maxsize=10)
 def calc_epsilon(jnd: float) -> float:
     """Calculate the epsilon to 2 degrees smaller than the specified JND."""
 
     return (1 * 10.0 ** (alg.order(jnd) - 2))
 
 
+class ChromaTable:
+    """
+    A table of mapped chroma over a lightness x hue grid.
+
+    Each entry is the chroma a maximally saturated color is reduced to for the given
+    lightness and hue, which, when the JND is zero, is simply the max in gamut chroma.
+    Lightness spans black to white in the perceptual space. Entries are calculated as
+    they are needed and are only meant to estimate where the chroma search will end.
+    """
+
+    __slots__ = ('gamut', 'jnd', 'de_options', 'size', 'polar', 'indexes', 'chroma', 'black', 'white', 'mapcolor',
+                 'gamutcolor', 'to_gamut', 'table')
+
+    def __init__(
+        self,
+        color_cls: type[Color],
+        gamut: Space,
+        pspace: Space,
+        jnd: float,
+        de_options: dict[str, Any],
+        size: tuple[int, int]
+    ) -> None:
+        """Initialize."""
+
+        self.gamut = gamut
+        self.jnd = jnd
+        self.de_options = de_options
+        self.size = size
+        self.polar = pspace.is_polar()
+        self.indexes = pspace.indexes()
+        l, a, b = self.indexes
+        self.chroma = pspace.CHANNELS[a].high if self.polar else max(pspace.CHANNELS[a].high, pspace.CHANNELS[b].high)
+
+        self.mapcolor = color_cls(XYZ, BLACK).convert(pspace.NAME, in_place=True)
+        self.black = self.mapcolor[l]
+        self.white = self.mapcolor.update(XYZ, WHITE)[l]
+        self.gamutcolor = color_cls(gamut.NAME, BLACK)
+        self.to_gamut = color_cls.converter(pspace.NAME, gamut.NAME)
+        self.table = {}  # type: dict[tuple[int, int], float]
+
+    def reduce(self, value: float, hue: float) -> bool:
+        """Set the chroma and return whether chroma must be reduced further."""
+
+        mapcolor = self.mapcolor
+        gamutcolor = self.gamutcolor
+        # For polar spaces, `a` and `b` are the chroma and hue indexes.
+        _, a, b = self.indexes
+        if self.polar:
+            mapcolor[a], mapcolor[b] = value, hue
+        else:
+            mapcolor[a], mapcolor[b] = alg.polar_to_rect(value, hue)
+        gamutcolor[:-1] = self.to_gamut(mapcolor[:-1])
+        if gamutcolor.in_gamut(tolerance=0):
+            return False
+        clip_channels(gamutcolor)
+        return not self.jnd or mapcolor.delta_e(gamutcolor, **self.de_options) >= self.jnd
+
+    def entry(self, i: int, j: int) -> float:
+        """Get the table entry for the given lightness and hue step."""
+
+        key = (i, j)
+        value = self.table.get(key)
+        if value is not None:
+            return value
+
+        lsteps, hsteps = self.size
+        self.mapcolor[self.indexes[0]] = alg.lerp(self.black, self.white, i / lsteps)
+        hue = j * 360 / hsteps
+        chroma = self.chroma
+        low = 0.0
+        high = chroma
+        # Widen the search if mapped colors extend beyond the channel's range.
+        while not self.reduce(high, hue) and high < chroma * 8:
+            low = high
+            high *= 2
+        precision = chroma * 1e-3
+        while (high - low) > precision:
+            value = (high + low) * 0.5
+            if self.reduce(value, hue):
+                high = value
+            else:
+                low = value
+        self.table[key] = low
+        return low
+
+    def estimate(self, lightness: float, hue: float) -> float:
+        """Estimate the mapped chroma by interpolating the table."""
+
+        lsteps, hsteps = self.size
+        x = alg.clamp((lightness - self.black) / (self.white - self.black), 0.0, 1.0) * lsteps
+        y = (hue % 360) / 360 * hsteps
+        i = min(int(x), lsteps - 1)
+        j = int(y) % hsteps
+        k = (j + 1) % hsteps
+        return alg.bilerp(
+            self.entry(i, j), self.entry(i, k), self.entry(i + 1, j), self.entry(i + 1, k), y - int(y), x - i
+        )
+
+
+@cache.memoize('minde_chroma_table', maxsize=20)
+def chroma_table(
+    color_cls: type[Color],
+    gamut: Space,
+    pspace: Space,
+    jnd: float,
+    de_options: tuple[tuple[str, Any], ...],
+    size: tuple[int, int]
+) -> ChromaTable:
+    """Get a cached chroma table."""
+
+    return ChromaTable(color_cls, gamut, pspace, jnd, dict(de_options), size)
+
+
 class MINDEChroma(Fit):
     """
     Chroma reduction with MINDE.
@@ -44,6 +158,40 @@ class MINDEChroma(Fit):
     DE_OPTIONS = {"method": "ok"}  # type: dict[str, Any]
     PSPACE = "oklch"
     MIN_CONVERGENCE = 0.0001
+    # Default size (lightness steps, hue steps) of the chroma table used to seed the chroma search.
+    CHROMA_TABLE = (32, 72)
+    # Relative distance from the estimated chroma to the seeded bounds.
+    CHROMA_MARGIN = 0.01
+    # Convergence, relative to the JND, once the seeded bounds have been verified.
+    JND_CONVERGENCE = 0.5
+
+    def chroma_bounds(
+        self,
+        color: Color,
+        space: str,
+        pspace: str,
+        lightness: float,
+        hue: float,
+        jnd: float,
+        de_options: dict[str, Any],
+        size: tuple[int, int]
+    ) -> tuple[float, float] | None:
+        """Get chroma bounds, estimated from the chroma table, that should contain the mapped chroma."""
+
+        if math.isnan(hue):
+            return None
+
+        # Options must be hashable to cache the table.
+        options = tuple(sorted(de_options.items()))
+        try:
+            hash(options)
+        except TypeError:
+            return None
+
+        estimate = chroma_table(
+            type(color), color.CS_MAP[space], color.CS_MAP[pspace], jnd, options, size
+        ).estimate(lightness, hue)
+        return estimate * (1 - self.CHROMA_MARGIN), estimate * (1 + self.CHROMA_MARGIN)
 
     def fit(
         self,
@@ -54,9 +202,15 @@ class MINDEChroma(Fit):
         jnd: float | None = None,
         de_options: dict[str, Any] | None = None,
         adaptive: float = 0.0,
+        chroma_table: bool | tuple[int, int] = False,
         **kwargs: Any
     ) -> None:
-        """Gamut mapping via CIELCh chroma."""
+        """
+        Gamut mapping via CIELCh chroma.
+
+        If `chroma_table` is enabled, the chroma search for SDR gamuts is seeded from a cached table of
+        mapped chroma, either of the default size or of the given (lightness steps, hue steps).
+        """
 
         # Identify the perceptual space and determine if it is rectangular or polar
         if pspace is None:
@@ -107,10 +261,21 @@ class MINDEChroma(Fit):
             # Perform "in gamut" checks until we know our lower bound is no longer in gamut.
             lower_in_gamut = True
 
+            # Seed the bounds with an estimate of where the chroma will land. Each seed is checked once,
+            # the lower first, and if both hold, only search until the result is within the JND.
+            seeds = []  # type: list[float]
+            if chroma_table is not False and sdr and not adaptive:
+                size = self.CHROMA_TABLE if chroma_table is True else chroma_table
+                bounds = self.chroma_bounds(color, space, pspace, lightness, hue, jnd, de_options, size)
+                if bounds is not None and low < bounds[0] and bounds[1] < high:
+                    seeds = [bounds[1], bounds[0]]
+            convergence = self.MIN_CONVERGENCE
+
             # If high and low get too close to converging,
             # we need to quit in order to prevent infinite looping.
-            while (high - low) > self.MIN_CONVERGENCE:
-                value = (high + low) * 0.5
+            while (high - low) > convergence:
+                seeded = bool(seeds)
+                value = seeds.pop() if seeds else (high + low) * 0.5
                 if not adaptive:
                     if polar:
                         mapcolor[c] = value
@@ -148,4 +313,13 @@ class MINDEChroma(Fit):
                         # We are still outside the gamut and outside the JND
                         high = value
 
+                if seeded:
+                    # Abandon the estimate if the lower seed turned out to be too high.
+                    if seeds:
+                        if value != low:
+                            seeds.clear()
+                    # Both seeds hold, so the result only needs to be found within the JND.
+                    elif value == high:
+                        convergence = max(convergence, jnd * self.JND_CONVERGENCE)
+
         color.update(gamutcolor)
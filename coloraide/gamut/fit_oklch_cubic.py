@@ -25,12 +25,12 @@ SOFTWARE.
 """
 from __future__ import annotations
 import math
-from functools import lru_cache
 from . import Fit, clip_channels
 from .fit_raytrace import get_conversion_matrices
 from .. import util
 from ..cat import WHITES, CAT
 from .. import algebra as alg
+from .. import cache
 from ..spaces import Space, RGBish
 from ..types import VectorLike, Matrix
 from ..spaces.oklab import OKLAB_TO_LMS3
@@ -118,7 +118,7 @@ def first_root(coeff: VectorLike, mn: float, mx: float) -> float:
     return best
 
 
-@lru_cache(maxsize=1024)
+@cache.memoize('oklch_cubic', maxsize=1024)
 def get_hue_data(name: str, cs: Space, cat: str, adapt: CAT, h: float) -> tuple[Matrix, float, list[float]]:
     """
     Get hue data.
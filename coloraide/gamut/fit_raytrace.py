@@ -5,19 +5,20 @@ This employs a faster approach than bisecting to reduce chroma.
 """
 from __future__ import annotations
 import math
-from functools import lru_cache
 from .. import util
 from .. import algebra as alg
+from .. import cache
 from . import Fit, coerce_to_rgb
 from .tools import adaptive_hue_independent
 from ..spaces import Space, Prism, Luminant
 from ..spaces.oklab import LMS_TO_XYZD65, OKLAB_TO_LMS3, LMS3_TO_OKLAB
 from ..cat import WHITES, calc_adaptation_matrices, Bradford, CAT, VonKries
 from ..types import Vector, VectorLike, Matrix
-from typing import Any, TYPE_CHECKING  # noqa: F401
+from typing import Any, Sequence, TYPE_CHECKING  # noqa: F401
 
 if TYPE_CHECKING:  #pragma: no cover
     from ..color import Color
+    from ..convert import Converter  # noqa: F401
 
 WHITE = util.xy_to_xyz(WHITES['2deg']['D65'])
 CSS_FAST_PATH = {'oklab', 'oklch'}
@@ -38,7 +39,7 @@ def to_polar(coords: Vector, c:int, h: int) -> Vector:
     return coords
 
 
-@lru_cache(maxsize=10)
+@cache.memoize('raytrace', maxsize=10)
 def get_conversion_matrices(name: str, space: Space, cat: str, adapt: CAT) -> tuple[Matrix, Matrix]:
     """Get and cache conversion matrices to convert from linear RGB to LMS (Oklab variant)."""
 
@@ -173,37 +174,26 @@ def raytrace_box(
     ]
 
 
-def css_fast_path(
-    color: Color,
-    cs: Space,
-    pspace: str,
+def trace_oklch(
+    mapcoords: Vector,
+    m: Matrix,
+    mi: Matrix,
     adaptive: float,
+    max_light: float,
     mn: float,
-    mx: float,
-    **kwargs: Any
-) -> None:
-    """Path that optimizes conversions for CSS defaults of an Oklab/OkLCh perceptual space and linear RGB target."""
+    mx: float
+) -> Vector:
+    """
+    Ray trace OkLCh coordinates to the linear RGB gamut and return the mapped linear RGB coordinates.
 
-    # RGB linear space
-    rspace = cs.NAME
+    `m` and `mi` convert between linear RGB and Oklab LMS and `max_light` is the lightness of white
+    which is only needed for adaptive lightness.
+    """
 
     # Set the minimum bounds
     bmax = [mx] * 3
     bmin = [mn] * 3
 
-    # Ensure we are in the proper perceptual space or normalize values
-    orig = color.space()
-    mapcolor = color.convert(pspace, norm=False) if orig != pspace else color.clone().normalize(nans=False)
-    mapcoords = mapcolor[:-1]
-
-    # Ensure we are working in OkLCh and
-    if pspace == 'oklab':
-        to_polar(mapcoords, 1, 2)
-
-    # Get Oklab conversion matrices from linear RGB -> Oklab LMS
-    adapt = color.CHROMATIC_ADAPTATION
-    m, mi = get_conversion_matrices(rspace, cs, adapt, color.CAT_MAP[adapt])
-
     # Calculate the achromatic version of the color
     achroma = mapcoords[:]
     achroma[1] = 0.0
@@ -212,7 +202,6 @@ def css_fast_path(
     # anchor point relative to the hue independent mid point. Scale lightness and
     # chroma by the max lightness to get lightness between 0 and 1.
     if adaptive:
-        max_light = color.new('xyz-d65', WHITE).convert(pspace, in_place=True)[0]
         achroma[0] = adaptive_hue_independent(
             mapcoords[0] / max_light,
             max(mapcoords[1], 0) / max_light,
@@ -231,58 +220,85 @@ def css_fast_path(
     # HDR colors currently use the RGB maximum lightness. We do not currently
     # clip HDR colors to SDR white, but that could be done if required.
     if anchor == bmax:
-        color.update(rspace, bmax, mapcolor[-1])
+        return bmax
     elif anchor == bmin:
-        color.update(rspace, bmin, mapcolor[-1])
-    else:
-        # Ensure we are handling coordinates in the polar space to better retain hue
-        start = mapcoords[:]
-        end = achroma[:]
+        return bmin
 
-        # Select an offset from the gamut surface according to unit type (64-bit for Python).
-        # 32-bit may require 1e-6
-        low = mn + alg.ATOL
-        high = mx + alg.ATOL
+    # Ensure we are handling coordinates in the polar space to better retain hue
+    start = mapcoords[:]
+    end = achroma[:]
 
-        # Use an iterative process of casting rays to find the intersect with the RGB gamut
-        # and correcting the intersection onto the LCh chroma reduction path.
-        mapcoords[:] = from_oklch(mapcoords, m)
-        last = mapcoords[:]
-        if any(mn > x or x > mx for x in last):
-            for i in range(4):
-                if i:
-                    coords = to_oklch(mapcoords, mi)
+    # Select an offset from the gamut surface according to unit type (64-bit for Python).
+    # 32-bit may require 1e-6
+    low = mn + alg.ATOL
+    high = mx + alg.ATOL
 
-                    # Project the point onto the desired interpolation path in LCh if applying adaptive luminance
-                    if adaptive:
-                        coords = project_onto(coords, start, end)
+    # Use an iterative process of casting rays to find the intersect with the RGB gamut
+    # and correcting the intersection onto the LCh chroma reduction path.
+    mapcoords = from_oklch(mapcoords, m)
+    last = mapcoords[:]
+    if any(mn > x or x > mx for x in last):
+        for i in range(4):
+            if i:
+                coords = to_oklch(mapcoords, mi)
 
-                    # For constant luminance, just correct lightness and hue in LCh
-                    else:
-                        coords[0] = start[0]
-                        coords[2] = start[2]
-                    mapcoords[:] = from_oklch(coords, m)
+                # Project the point onto the desired interpolation path in LCh if applying adaptive luminance
+                if adaptive:
+                    coords = project_onto(coords, start, end)
 
-                # Cast a ray and find the intersection with the gamut surface
-                coords = mapcoords[:]
-                intersection = raytrace_box(anchor, coords, bmin=bmin, bmax=bmax)
+                # For constant luminance, just correct lightness and hue in LCh
+                else:
+                    coords[0] = start[0]
+                    coords[2] = start[2]
+                mapcoords = from_oklch(coords, m)
 
-                # If we cannot find an intersection, reset to last good color and quit
-                if not intersection:
-                    mapcoords[:] = last
-                    break
+            # Cast a ray and find the intersection with the gamut surface
+            coords = mapcoords[:]
+            intersection = raytrace_box(anchor, coords, bmin=bmin, bmax=bmax)
 
-                # Adjust anchor point closer to surface to improve results.
-                if i and all(low < x < high for x in coords):
-                    anchor = coords
+            # If we cannot find an intersection, reset to last good color and quit
+            if not intersection:
+                mapcoords = last
+                break
 
-                # Update color with the intersection point on the RGB surface.
-                last = intersection
-                mapcoords[:] = last
-                continue
+            # Adjust anchor point closer to surface to improve results.
+            if i and all(low < x < high for x in coords):
+                anchor = coords
 
-        # Remove noise from floating point conversion.
-        color.update(rspace, [max(mn, min(mx, x)) for x in mapcoords], mapcolor[-1])
+            # Update color with the intersection point on the RGB surface.
+            last = intersection
+            mapcoords = last[:]
+
+    # Remove noise from floating point conversion.
+    return [max(mn, min(mx, x)) for x in mapcoords]
+
+
+def css_fast_path(
+    color: Color,
+    cs: Space,
+    pspace: str,
+    adaptive: float,
+    mn: float,
+    mx: float,
+    **kwargs: Any
+) -> None:
+    """Path that optimizes conversions for CSS defaults of an Oklab/OkLCh perceptual space and linear RGB target."""
+
+    # Ensure we are in the proper perceptual space or normalize values
+    orig = color.space()
+    mapcolor = color.convert(pspace, norm=False) if orig != pspace else color.clone().normalize(nans=False)
+    mapcoords = mapcolor[:-1]
+
+    # Ensure we are working in OkLCh and
+    if pspace == 'oklab':
+        to_polar(mapcoords, 1, 2)
+
+    # Get Oklab conversion matrices from linear RGB -> Oklab LMS
+    adapt = color.CHROMATIC_ADAPTATION
+    m, mi = get_conversion_matrices(cs.NAME, cs, adapt, color.CAT_MAP[adapt])
+    max_light = color.new('xyz-d65', WHITE).convert(pspace, in_place=True)[0] if adaptive else 1.0
+
+    color.update(cs.NAME, trace_oklch(mapcoords, m, mi, adaptive, max_light, mn, mx), mapcolor[-1])
 
 
 def generic_path(
@@ -425,19 +441,14 @@ class RayTrace(Fit):
     NAME = "raytrace"
     PSPACE = "oklch"
 
-    def fit(
-        self,
-        color: Color,
-        space: str,
-        *,
-        pspace: str | None = None,
-        adaptive: float = 0.0,
-        **kwargs: Any
-    ) -> None:
-        """Use ray tracing with a linear RGB space for a geometric approach to reducing chroma."""
+    def gamut(self, color: type[Color], space: str) -> tuple[Space, str, float, float, bool]:
+        """
+        Resolve the RGB space to trace within.
+
+        Returns the RGB space, the name of the space to convert to, the minimum and maximum
+        of the RGB cube, and whether the space was coerced into an RGB space.
+        """
 
-        if pspace is None:
-            pspace = self.PSPACE
         cs = color.CS_MAP[space]
 
         # Requires an RGB-ish or Prism space, preferably a linear space.
@@ -457,13 +468,29 @@ class RayTrace(Fit):
             subtractive = cs.SUBTRACTIVE
             cs = color.CS_MAP[linear]
             if subtractive != cs.SUBTRACTIVE:
-                mx = color.new(space, [cs.CHANNELS[0].low] * 3).convert(linear, in_place=True)[0]
+                mx = color(space, [cs.CHANNELS[0].low] * 3).convert(linear, in_place=True)[0]
             else:
-                mx = color.new(space, [mx] * 3).convert(linear, in_place=True)[0]
+                mx = color(space, [mx] * 3).convert(linear, in_place=True)[0]
             space = linear
 
         # Get minimum
         mn = cs.CHANNELS[0].low
+        return cs, space, mn, mx, coerced
+
+    def fit(
+        self,
+        color: Color,
+        space: str,
+        *,
+        pspace: str | None = None,
+        adaptive: float = 0.0,
+        **kwargs: Any
+    ) -> None:
+        """Use ray tracing with a linear RGB space for a geometric approach to reducing chroma."""
+
+        if pspace is None:
+            pspace = self.PSPACE
+        cs, rspace, mn, mx, coerced = self.gamut(type(color), space)
 
         # If we are gamut mapping using Oklab/OkLCh, per the CSS spec, and we are
         # gamut mapping within an linear RGB gamut, use the CSS fast path that
@@ -471,4 +498,54 @@ class RayTrace(Fit):
         if pspace in CSS_FAST_PATH and not coerced and hasattr(cs, TO_RGB):
             css_fast_path(color, cs, pspace, adaptive, mn, mx)
         else:
-            generic_path(color, space, cs, pspace, adaptive, mn, mx, coerced)
+            generic_path(color, rspace, cs, pspace, adaptive, mn, mx, coerced)
+
+    def fit_many(
+        self,
+        colors: Sequence[Color],
+        space: str,
+        *,
+        pspace: str | None = None,
+        adaptive: float = 0.0,
+        **kwargs: Any
+    ) -> list[Vector]:
+        """
+        Gamut map many colors and return their mapped coordinates in the given space.
+
+        The gamut, conversion matrices, and white point are resolved once for all the colors.
+        When tracing in Oklab/OkLCh within a linear RGB gamut, the rays are traced directly on the
+        coordinates without creating any intermediate colors.
+        """
+
+        if not colors:
+            return []
+
+        if pspace is None:
+            pspace = self.PSPACE
+        color = type(colors[0])
+        cs, rspace, mn, mx, coerced = self.gamut(color, color.CS_MAP[space].GAMUT_CHECK or space)
+
+        results = []  # type: list[Vector]
+        if pspace in CSS_FAST_PATH and not coerced and hasattr(cs, TO_RGB):
+            adapt = color.CHROMATIC_ADAPTATION
+            m, mi = get_conversion_matrices(cs.NAME, cs, adapt, color.CAT_MAP[adapt])
+            max_light = color('xyz-d65', WHITE).convert(pspace, in_place=True)[0] if adaptive else 1.0
+            to_space = color.converter(rspace, space)
+            to_pspace = {}  # type: dict[str, Converter]
+            for c in colors:
+                name = c.space()
+                if name == pspace:
+                    coords = c.clone().normalize(nans=False)[:-1]
+                else:
+                    if name not in to_pspace:
+                        to_pspace[name] = color.converter(name, pspace)
+                    coords = to_pspace[name](c.coords(nans=False))
+                if pspace == 'oklab':
+                    to_polar(coords, 1, 2)
+                results.append(to_space(trace_oklch(coords, m, mi, adaptive, max_light, mn, mx)))
+        else:
+            for c in colors:
+                mapcolor = c.clone()
+                generic_path(mapcolor, rspace, cs, pspace, adaptive, mn, mx, coerced)
+                results.append(mapcolor.convert(space, in_place=True, norm=False)[:-1])
+        return results
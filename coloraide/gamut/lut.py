@@ -0,0 +1,300 @@
+"""
+Gamut mapping 3D lookup tables.
+
+A `FitLUT` stores the results of gamut mapping a regular grid of colors sampled from a source
+color space. The results are stored in the target gamut's color space. Colors can then be mapped
+by interpolating the table which is much faster than running expensive gamut mapping methods,
+at the cost of some accuracy.
+
+Tables can be serialized to the `.cube` format, or a compact binary format that preserves the
+full precision of the table.
+"""
+from __future__ import annotations
+import math
+import struct
+from array import array
+from .. import algebra as alg
+from ..types import Vector, VectorLike
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:  #pragma: no cover
+    from ..color import Color
+
+MAGIC = b'CAFITLUT'
+VERSION = 1
+HEADER = struct.Struct('<8sHHHI6d')
+
+INTERPOLATION = ('trilinear', 'tetrahedral')
+
+
+def bake(
+    color_cls: type[Color],
+    source: str,
+    target: str,
+    method: str | None = None,
+    size: int = 33,
+    **kwargs: Any
+) -> FitLUT:
+    """
+    Bake a gamut mapping method into a 3D lookup table.
+
+    The source color space is sampled on a regular grid spanning its channel ranges. Each
+    sample is gamut mapped to the target and stored in the target's gamut space.
+    """
+
+    if size < 2:
+        raise ValueError(f'A LUT size of at least 2 is required, but received {size}')
+
+    cs = color_cls.CS_MAP.get(source)
+    if cs is None:
+        raise ValueError(f"'{source}' is not a registered color space")
+    if cs.is_polar() or len(cs.CHANNELS) != 3:
+        raise ValueError(f"'{source}' must be a rectangular color space with 3 channels")
+
+    ts = color_cls.CS_MAP.get(target)
+    if ts is None:
+        raise ValueError(f"'{target}' is not a registered color space")
+    target = ts.GAMUT_CHECK or ts.NAME
+    if color_cls.CS_MAP[target].is_polar():
+        raise ValueError(f"The gamut of '{target}' must be defined by a rectangular color space")
+
+    domain = [[chan.low, chan.high] for chan in cs.CHANNELS]
+    steps = [[alg.lerp(lo, hi, i / (size - 1)) for i in range(size)] for lo, hi in domain]
+
+    table = array('d')
+    color = color_cls(source, [0.0, 0.0, 0.0])
+    for z in steps[2]:
+        for y in steps[1]:
+            for x in steps[0]:
+                color.update(source, [x, y, z])
+                color.fit(target, method=method, **kwargs)
+                table.extend(color.convert(target, norm=False).coords(nans=False))
+
+    return FitLUT(source, target, size, domain, table)
+
+
+class FitLUT:
+    """A gamut mapping 3D lookup table."""
+
+    __slots__ = ('source', 'target', 'size', 'domain', 'table', '_scale')
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        size: int,
+        domain: VectorLike | list[Vector],
+        table: array[float]
+    ) -> None:
+        """
+        Initialize.
+
+        The table contains `size ** 3` colors ordered with the first channel changing the
+        fastest, which is the same as the `.cube` format.
+        """
+
+        if len(table) != size ** 3 * 3:
+            raise ValueError(f'Expected {size ** 3 * 3} table values, but received {len(table)}')
+
+        self.source = source
+        self.target = target
+        self.size = size
+        self.domain = [[float(lo), float(hi)] for lo, hi in domain]  # type: ignore[misc]
+        self.table = table
+        self._scale = [(size - 1) / (hi - lo) for lo, hi in self.domain]
+
+    def __repr__(self) -> str:
+        """Representation."""
+
+        return f'FitLUT(source={self.source!r}, target={self.target!r}, size={self.size})'
+
+    __str__ = __repr__
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equal."""
+
+        return (
+            isinstance(other, FitLUT) and
+            self.source == other.source and
+            self.target == other.target and
+            self.size == other.size and
+            self.domain == other.domain and
+            self.table == other.table
+        )
+
+    def _vertex(self, x: int, y: int, z: int) -> int:
+        """Get the table offset of a grid vertex."""
+
+        size = self.size
+        return (x + size * (y + size * z)) * 3
+
+    def apply(self, coords: VectorLike, interpolation: str = 'trilinear') -> Vector:
+        """
+        Map the coordinates of a source color to the target gamut.
+
+        Coordinates outside the table's domain are clamped to the domain.
+        """
+
+        last = self.size - 1
+        index = []  # type: list[int]
+        frac = []  # type: Vector
+        for value, (lo, _), scale in zip(coords, self.domain, self._scale):
+            p = alg.clamp((0.0 if math.isnan(value) else value - lo) * scale, 0, last)
+            i = min(int(p), last - 1)
+            index.append(i)
+            frac.append(p - i)
+
+        x, y, z = index
+        table = self.table
+        vertex = self._vertex
+
+        if interpolation == 'trilinear':
+            # Vertices in column form ordered as `x + 2y + 4z`.
+            offsets = [
+                vertex(x + dx, y + dy, z + dz)
+                for dz in (0, 1) for dy in (0, 1) for dx in (0, 1)
+            ]
+            return alg.lerp3d([[table[o + i] for o in offsets] for i in range(3)], frac)
+
+        elif interpolation == 'tetrahedral':
+            fx, fy, fz = frac
+            c000 = vertex(x, y, z)
+            c111 = vertex(x + 1, y + 1, z + 1)
+            if fx >= fy:
+                if fy >= fz:
+                    path = ((vertex(x + 1, y, z), fx), (vertex(x + 1, y + 1, z), fy), (c111, fz))
+                elif fx >= fz:
+                    path = ((vertex(x + 1, y, z), fx), (vertex(x + 1, y, z + 1), fz), (c111, fy))
+                else:
+                    path = ((vertex(x, y, z + 1), fz), (vertex(x + 1, y, z + 1), fx), (c111, fy))
+            elif fz >= fy:
+                path = ((vertex(x, y, z + 1), fz), (vertex(x, y + 1, z + 1), fy), (c111, fx))
+            elif fz >= fx:
+                path = ((vertex(x, y + 1, z), fy), (vertex(x, y + 1, z + 1), fz), (c111, fx))
+            else:
+                path = ((vertex(x, y + 1, z), fy), (vertex(x + 1, y + 1, z), fx), (c111, fz))
+
+            result = [table[c000 + i] for i in range(3)]
+            prev = c000
+            for o, f in path:
+                for i in range(3):
+                    result[i] += f * (table[o + i] - table[prev + i])
+                prev = o
+            return result
+
+        raise ValueError(f"'{interpolation}' is not a supported LUT interpolation method")
+
+    def to_cube(self, title: str | None = None) -> str:
+        """
+        Serialize to the `.cube` format.
+
+        The source and target color spaces are stored in comments.
+        """
+
+        lines = [
+            f'TITLE "{title if title is not None else f"{self.source} to {self.target}"}"',
+            f'# source: {self.source}',
+            f'# target: {self.target}',
+            f'LUT_3D_SIZE {self.size}',
+            'DOMAIN_MIN {} {} {}'.format(*(repr(lo) for lo, _ in self.domain)),
+            'DOMAIN_MAX {} {} {}'.format(*(repr(hi) for _, hi in self.domain))
+        ]
+        table = self.table
+        lines.extend(f'{table[i]!r} {table[i + 1]!r} {table[i + 2]!r}' for i in range(0, len(table), 3))
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def from_cube(cls, text: str, source: str | None = None, target: str | None = None) -> FitLUT:
+        """
+        Deserialize from the `.cube` format.
+
+        Source and target color spaces are read from the comments written by `to_cube`,
+        but they can be provided if they are missing.
+        """
+
+        size = 0
+        domain = [[0.0, 1.0], [0.0, 1.0], [0.0, 1.0]]
+        table = array('d')
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('#'):
+                key, _, value = line[1:].partition(':')
+                key = key.strip()
+                if key == 'source' and source is None:
+                    source = value.strip()
+                elif key == 'target' and target is None:
+                    target = value.strip()
+                continue
+
+            parts = line.split()
+            keyword = parts[0]
+            if keyword == 'LUT_3D_SIZE':
+                size = int(parts[1])
+            elif keyword == 'DOMAIN_MIN':
+                for i in range(3):
+                    domain[i][0] = float(parts[i + 1])
+            elif keyword == 'DOMAIN_MAX':
+                for i in range(3):
+                    domain[i][1] = float(parts[i + 1])
+            elif keyword[0].isalpha():
+                # Ignore other keywords such as `TITLE` and `LUT_1D_SIZE`.
+                continue
+            else:
+                table.extend(float(p) for p in parts[:3])
+
+        if not size:
+            raise ValueError('Only 3D .cube LUTs are supported')
+        if source is None or target is None:
+            raise ValueError('The source and target color spaces must be specified')
+        return cls(source, target, size, domain, table)
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a compact binary format."""
+
+        source = self.source.encode('utf-8')
+        target = self.target.encode('utf-8')
+        if len(source) > 0xFFFF or len(target) > 0xFFFF:
+            raise ValueError(f'Color space names must not exceed {0xFFFF} bytes')
+        data = array('d', self.table)
+        if struct.pack('=H', 1) != struct.pack('<H', 1):  # pragma: no cover
+            data.byteswap()
+        return b''.join(
+            [
+                HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    len(source),
+                    len(target),
+                    self.size,
+                    *(v for lo_hi in self.domain for v in lo_hi)
+                ),
+                source,
+                target,
+                data.tobytes()
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> FitLUT:
+        """Deserialize from the binary format."""
+
+        if len(data) < HEADER.size:
+            raise ValueError('Invalid LUT data')
+        magic, version, slen, tlen, size, *bounds = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Invalid LUT data')
+
+        offset = HEADER.size
+        source = data[offset:offset + slen].decode('utf-8')
+        offset += slen
+        target = data[offset:offset + tlen].decode('utf-8')
+        offset += tlen
+
+        table = array('d')
+        table.frombytes(data[offset:])
+        if struct.pack('=H', 1) != struct.pack('<H', 1):  # pragma: no cover
+            table.byteswap()
+        domain = [bounds[i:i + 2] for i in range(0, 6, 2)]
+        return cls(source, target, size, domain, table)
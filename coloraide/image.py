@@ -0,0 +1,306 @@
+"""
+Pixel buffer pipelines.
+
+A pipeline decodes raw, interleaved pixel buffers, runs a declared series of steps (convert,
+filter, fit, and composite) over the pixels in batches, and encodes the results into an output
+buffer. Buffers can be anything that supports the buffer protocol, such as `bytes`, `memoryview`,
+or `array`, and can hold 8 bit (`B`), 16 bit (`H`), or floating point (`f` and `d`) channels,
+with or without alpha.
+
+Only unique pixels are processed, and results are remembered across runs, so images with large
+areas of flat color, or sequences of similar frames, are processed quickly. Consecutive filters
+are compiled into a single filter chain, and compositing operates directly on the packed
+coordinates.
+"""
+from __future__ import annotations
+from array import array
+from itertools import chain
+from . import util
+from .batch import ColorArray
+from .compositing import apply_compositing, blend_modes, porter_duff
+from .filters import FilterChain, FilterRequest
+from .spaces import Space, RGBish
+from .types import ColorInput, AnyColor
+from typing import Any, Callable, Generic
+
+TYPECODES = ('B', 'H', 'f', 'd')
+
+# Bit depths of integer typecodes.
+BITS = {'B': 8, 'H': 16}
+
+
+def _convert(colors: ColorArray[Any], space: str, norm: bool) -> ColorArray[Any]:
+    """Convert colors."""
+
+    return colors.convert(space, in_place=True, norm=norm)
+
+
+def _filter(colors: ColorArray[Any], chain: FilterChain, requests: list[FilterRequest]) -> ColorArray[Any]:
+    """Filter colors with a compiled filter chain."""
+
+    return chain.many(colors)
+
+
+def _fit(colors: ColorArray[Any], space: str | None, method: str | None, kwargs: dict[str, Any]) -> ColorArray[Any]:
+    """Fit colors."""
+
+    return colors.fit(space, method=method, **kwargs)
+
+
+def _composite(
+    colors: ColorArray[Any],
+    backdrop: ColorInput,
+    blend: str | None,
+    operator: str | None,
+    space: str | None
+) -> ColorArray[Any]:
+    """Composite colors over a backdrop, operating on the packed coordinates of the whole batch."""
+
+    color = colors._color
+    if space is None:
+        space = 'srgb'
+    cs = color.CS_MAP[space]
+    nans = [c.nans for c in cs.CHANNELS]
+    normalize = cs.normalize if type(cs).normalize is not Space.normalize else None
+    if not isinstance(cs, RGBish):
+        raise ValueError(f"Can only compose in an RGBish color space, not {type(cs)}")
+    blender = None if blend is None else blend_modes.get_blender(blend)
+    op = None if operator is None else porter_duff.compositor(operator)
+    bg = color._handle_color_input(backdrop).convert(space).normalize(nans=False)[:]
+    colors.convert(space, in_place=True, norm=False)
+
+    stride = colors._stride
+    data = colors.data
+
+    # Normal blending with source over is the common case and reduces to simple arithmetic.
+    if stride == 4 and (blender is None or type(blender) is blend_modes.BlendNormal) and op is porter_duff.SourceOver:
+        b0, b1, b2, cba = bg
+        n0, n1, n2 = nans
+        for i in range(0, len(data), 4):
+            r, g, b, csa = data[i:i + 4]
+            if normalize is not None:
+                r, g, b = normalize([n0 if r != r else r, n1 if g != g else g, n2 if b != b else b])
+            if csa != csa:
+                csa = 0.0
+            fb = cba * (1.0 - csa)
+            cra = csa + fb
+            cra = 0.0 if cra < 0.0 else 1.0 if cra > 1.0 else cra
+            r = csa * (n0 if r != r else r) + fb * b0
+            g = csa * (n1 if g != g else g) + fb * b1
+            b = csa * (n2 if b != b else b) + fb * b2
+            if cra not in (0, 1):
+                r /= cra
+                g /= cra
+                b /= cra
+            data[i:i + 4] = array('d', (r, g, b, cra))
+        return colors
+
+    end = stride - 1
+    for i in range(0, len(data), stride):
+        src = data[i:i + stride].tolist()
+        coords = [n if v != v else v for n, v in zip(nans, src[:end])]
+        src[:end] = coords if normalize is None else normalize(coords)
+        if src[end] != src[end]:
+            src[end] = 0.0
+        data[i:i + stride] = array('d', apply_compositing(src, bg, blender, op))
+    return colors
+
+
+class Pipeline(Generic[AnyColor]):
+    """
+    A pipeline that processes pixel buffers.
+
+    Integer channels are decoded and encoded via cached transfer function lookup tables.
+    Floating point channels are used as is.
+    """
+
+    def __init__(
+        self,
+        color: type[AnyColor],
+        space: str = 'srgb',
+        typecode: str = 'B',
+        *,
+        alpha: bool = False,
+        out_space: str | None = None,
+        out_typecode: str | None = None,
+        out_alpha: bool | None = None,
+        cache_size: int = 1 << 20
+    ) -> None:
+        """Initialize."""
+
+        if typecode not in TYPECODES:
+            raise ValueError(f"'{typecode}' is not a supported typecode")
+        if out_space is None:
+            out_space = space
+        if out_typecode is None:
+            out_typecode = typecode
+        elif out_typecode not in TYPECODES:
+            raise ValueError(f"'{out_typecode}' is not a supported typecode")
+        if out_alpha is None:
+            out_alpha = alpha
+        for s, t in ((space, typecode), (out_space, out_typecode)):
+            cs = color.CS_MAP.get(s)
+            if cs is None:
+                raise ValueError(f"'{s}' is not a registered color space")
+            if t in BITS and not isinstance(cs, RGBish):
+                raise ValueError(f"Integer channels can only be used with RGB spaces, not '{s}'")
+
+        self._color = color
+        self.space = space
+        self.typecode = typecode
+        self.alpha = alpha
+        self.out_space = out_space
+        self.out_typecode = out_typecode
+        self.out_alpha = out_alpha
+        self.cache_size = cache_size
+        self._channels = len(color.CS_MAP[space].CHANNELS) + alpha
+        self._out_channels = len(color.CS_MAP[out_space].CHANNELS) + out_alpha
+        self._steps = []  # type: list[tuple[Callable[..., ColorArray[AnyColor]], tuple[Any, ...]]]
+        self._cache = {}  # type: dict[tuple[float, ...], bytes]
+
+    def _add(self, func: Callable[..., ColorArray[AnyColor]], *args: Any) -> Pipeline[AnyColor]:
+        """Add a step, discarding cached results."""
+
+        self._steps.append((func, args))
+        self._cache.clear()
+        return self
+
+    def convert(self, space: str, *, norm: bool = True) -> Pipeline[AnyColor]:
+        """Convert the pixels to the given color space."""
+
+        return self._add(_convert, space, norm)
+
+    def filter(  # noqa: A003
+        self,
+        name: str,
+        amount: float | None = None,
+        *,
+        space: str | None = None,
+        **kwargs: Any
+    ) -> Pipeline[AnyColor]:
+        """
+        Filter the pixels.
+
+        Consecutive filters are compiled together so that they can be combined where possible.
+        """
+
+        request = (name, amount, kwargs if space is None else {**kwargs, 'space': space})  # type: FilterRequest
+        if self._steps and self._steps[-1][0] is _filter:
+            requests = [*self._steps.pop()[1][1], request]
+        else:
+            requests = [request]
+        return self._add(_filter, self._color.filter_chain(requests), requests)
+
+    def fit(self, space: str | None = None, *, method: str | None = None, **kwargs: Any) -> Pipeline[AnyColor]:
+        """Gamut map the pixels."""
+
+        return self._add(_fit, space, method, kwargs)
+
+    def composite(
+        self,
+        backdrop: ColorInput,
+        *,
+        blend: str | None = 'normal',
+        operator: str | None = 'source-over',
+        space: str | None = None
+    ) -> Pipeline[AnyColor]:
+        """Composite the pixels over a backdrop color."""
+
+        return self._add(_composite, backdrop, blend, operator, space)
+
+    def clear_cache(self) -> None:
+        """Discard remembered results."""
+
+        self._cache.clear()
+
+    def _process(self, pixels: list[tuple[float, ...]]) -> list[bytes]:
+        """Process unique pixels and return the encoded results as packed bytes."""
+
+        color = self._color
+        channels = self._channels
+        values = list(chain.from_iterable(pixels))  # type: list[Any]
+        bits = BITS.get(self.typecode)
+        if bits is not None:
+            colors = ColorArray.from_ints(color, self.space, values, bits, alpha=self.alpha)
+        else:
+            cs = color.CS_MAP[self.space]
+            stride = len(cs.channels)
+            data = array('d', [util.DEF_ALPHA]) * (len(pixels) * stride)
+            for i in range(channels):
+                data[i::stride] = array('d', values[i::channels])
+            colors = ColorArray._from_space(color, cs, data)
+
+        for func, args in self._steps:
+            colors = func(colors, *args)
+
+        typecode = self.out_typecode
+        bits = BITS.get(typecode)
+        if bits is not None:
+            packed = array(typecode, colors.to_ints(self.out_space, bits, alpha=self.out_alpha)).tobytes()
+            size = self._out_channels * (bits // 8)
+            return [packed[i:i + size] for i in range(0, len(packed), size)]
+
+        colors.convert(self.out_space, in_place=True)
+
+        # Select the output channels, dropping alpha if it is not needed.
+        stride = colors._stride
+        data = colors.data
+        out = [data[i::stride].tolist() for i in range(stride - 1)]  # type: list[list[Any]]
+        if self.out_alpha:
+            out.append(data[stride - 1::stride].tolist())
+        return [array(typecode, p).tobytes() for p in zip(*out)]
+
+    def run(self, src: Any, dst: Any = None) -> Any:
+        """
+        Process the pixels of the source buffer and write them to the destination buffer.
+
+        If no destination buffer is given, an `array` is created. The destination buffer is returned.
+        """
+
+        view = memoryview(src)
+        if view.format != self.typecode:
+            view = view.cast('B').cast(self.typecode)  # type: ignore[call-overload]
+        channels = self._channels
+        total = len(view)
+        if total % channels:
+            raise ValueError(f'Expected a multiple of {channels} channels, but received {total}')
+        count = total // channels
+
+        out_size = count * self._out_channels
+        if dst is None:
+            dst = array(self.out_typecode, bytes(out_size * array(self.out_typecode).itemsize))
+        out_view = memoryview(dst).cast('B')
+        itemsize = array(self.out_typecode).itemsize
+        if len(out_view) != out_size * itemsize:
+            raise ValueError(
+                f'Expected an output buffer of {out_size} channels, but received {len(out_view) // itemsize}'
+            )
+        size = self._out_channels * itemsize
+
+        # Gather unique pixels and resolve any that have not been seen before.
+        pixels = list(zip(*[view[i::channels] for i in range(channels)]))
+        unique = dict.fromkeys(pixels)  # type: dict[tuple[float, ...], bytes | None]
+        cache = self._cache
+        missing = []
+        for p in unique:
+            result = cache.get(p)
+            if result is None:
+                missing.append(p)
+            else:
+                unique[p] = result
+        if missing:
+            results = self._process(missing)
+            unique.update(zip(missing, results))
+            if len(cache) + len(missing) > self.cache_size:
+                cache.clear()
+            if len(missing) <= self.cache_size:
+                cache.update(zip(missing, results))
+
+        # Write the packed results of each pixel directly into the destination buffer.
+        get = unique.__getitem__
+        start = 0
+        for p in pixels:
+            end = start + size
+            out_view[start:end] = get(p)  # type: ignore[assignment]
+            start = end
+        return dst
@@ -16,13 +16,17 @@ License: MIT (As noted in https://github.com/LeaVerou/color.js/blob/master/packa
 from __future__ import annotations
 import math
 import bisect
+import heapq
 import functools
 import itertools as it
+from array import array
 from abc import ABCMeta, abstractmethod
 from .. import util
 from .. import algebra as alg
 from .. spaces import HSVish, HSLish, RGBish, LChish, Labish, HWBish
 from ..types import Matrix, Vector, ColorInput, Plugin, AnyColor
+from .lut import GradientLUT
+from ..batch import ColorArray
 from typing import Callable, Sequence, Mapping, Any, Generic, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:  #pragma: no cover
@@ -129,15 +133,11 @@ def multi_mix(
     if cs.is_polar():
         hue_index = cs.hue_index()  # type: ignore[attr-defined]
         hue_max = cs.channels[hue_index].high
-        is_hwb = isinstance(cs, HWBish)
         to_rad = math.tau / hue_max
-        to_hue = hue_max / math.tau
     else:
         hue_index = -1
         hue_max = 0.0
-        is_hwb = False
         to_rad = 0.0
-        to_hue = 0.0
 
     obj = color_cls(space, [])
     channels = cs.channels
@@ -226,6 +226,40 @@ def multi_mix(
     if not count:
         raise ValueError('At least one color must be provided in order to mix colors')
 
+    return mix_result(obj, avgs, counts, sin, cos, wavg, premultiplied, average)
+
+
+def mix_result(
+    obj: AnyColor,
+    avgs: Vector,
+    counts: list[int],
+    sin: float,
+    cos: float,
+    wavg: float,
+    premultiplied: bool,
+    average: bool
+) -> AnyColor:
+    """
+    Resolve the averaged channels of a mix into the color object.
+
+    `avgs` holds the weighted channel averages, with the hue average replaced by the averaged
+    sine and cosine components when `average` is enabled.
+    """
+
+    cs = obj._space
+    space = cs.NAME
+    chan_count = len(cs.channels)
+    if cs.is_polar():
+        hue_index = cs.hue_index()  # type: ignore[attr-defined]
+        hue_max = cs.channels[hue_index].high
+        is_hwb = isinstance(cs, HWBish)
+        to_hue = hue_max / math.tau
+    else:
+        hue_index = -1
+        hue_max = 0.0
+        is_hwb = False
+        to_hue = 0.0
+
     # Undo premultiplication and weighting to get the final color.
     # Adjust a channel to be undefined if all values in channel were undefined or if it is an achromatic hue channel.
     if not wavg:
@@ -358,13 +392,14 @@ class Interpolator(Generic[AnyColor], metaclass=ABCMeta):
         max_delta_e: float = 0,
         delta_e: str | None = None,
         delta_e_args: dict[str, Any] | None = None,
+        adaptive: bool = False
     ) -> Interpolator[AnyColor]:
         """Make the interpolation a discretized interpolation."""
 
         from .linear import Linear
 
         # Get the discrete steps for the new discrete interpolation
-        colors = self.steps(steps, max_steps, max_delta_e, delta_e, delta_e_args)  # type: list[AnyColor]
+        colors = self.steps(steps, max_steps, max_delta_e, delta_e, delta_e_args, adaptive)  # type: list[AnyColor]
 
         if not colors:
             raise ValueError('Discrete interpolation requires at least 1 discrete step.')
@@ -467,6 +502,7 @@ class Interpolator(Generic[AnyColor], metaclass=ABCMeta):
         max_delta_e: float = 0,
         delta_e: str | None = None,
         delta_e_args: dict[str, Any] | None = None,
+        adaptive: bool = False
     ) -> list[AnyColor]:
         """Steps."""
 
@@ -492,10 +528,13 @@ class Interpolator(Generic[AnyColor], metaclass=ABCMeta):
                 p = i * step
                 ret.append((p, self(p)))
 
+        if max_delta_e > 0 and adaptive:
+            ret = self._refine(ret, max_steps, max_delta_e, delta_e, delta_e_args)
+
         # Iterate over all the stops inserting stops in between all colors
         # if we have any two colors with a max delta greater than what was requested.
         # We inject between every stop to ensure the midpoint does not shift.
-        if max_delta_e > 0:
+        elif max_delta_e > 0:
             # Initial check to see if we need to insert more stops
             m_delta = 0.0
             for i in range(1, len(ret)):
@@ -514,11 +553,8 @@ class Interpolator(Generic[AnyColor], metaclass=ABCMeta):
             while m_delta > max_delta_e and (total * 2 - 1 <= max_steps):
                 # Inject stops while measuring again to see if it was sufficient
                 m_delta = 0.0
-                i = 1
-                index = 1
-                while index < total:
-                    prev = ret[index - 1]
-                    cur = ret[index]
+                injected = [ret[0]]
+                for prev, cur in it.pairwise(ret):
                     p = (cur[0] + prev[0]) / 2
                     color = self(p)
                     m_delta = max(
@@ -526,12 +562,95 @@ class Interpolator(Generic[AnyColor], metaclass=ABCMeta):
                         color.delta_e(prev[1], method=delta_e, **delta_e_args),
                         color.delta_e(cur[1], method=delta_e, **delta_e_args)
                     )
-                    ret.insert(index, (p, color))
-                    total += 1
-                    index += 2
+                    injected.append((p, color))
+                    injected.append(cur)
+                ret = injected
+                total = len(ret)
 
         return [ri[1] for ri in ret]
 
+    def _refine(
+        self,
+        ret: list[tuple[float, AnyColor]],
+        max_steps: int | None,
+        max_delta_e: float,
+        delta_e: str | None,
+        delta_e_args: dict[str, Any]
+    ) -> list[tuple[float, AnyColor]]:
+        """
+        Split only the segments that exceed the maximum delta E, largest delta E first.
+
+        Segments are always split at their midpoint, so existing steps never shift. Segments with
+        the same delta E are split together, and if they cannot all be split within the maximum
+        steps, refinement halts so that the result is not lopsided.
+        """
+
+        queue = []  # type: list[tuple[float, float, float, AnyColor, AnyColor]]
+        for (p0, c0), (p1, c1) in it.pairwise(ret):
+            de = c0.delta_e(c1, method=delta_e, **delta_e_args)
+            if de > max_delta_e:
+                queue.append((-de, p0, p1, c0, c1))
+        heapq.heapify(queue)
+
+        total = len(ret)
+        while queue:
+            # Gather all segments that share the largest delta E.
+            group = [heapq.heappop(queue)]
+            while queue and math.isclose(queue[0][0], group[0][0], rel_tol=1e-9, abs_tol=1e-12):
+                group.append(heapq.heappop(queue))
+
+            # Segments too small to split any further (discontinuities) are left as is.
+            splits = [(p0, (p0 + p1) / 2, p1, c0, c1) for p0, p1, c0, c1 in (g[1:] for g in group)]
+            splits = [sp for sp in splits if sp[0] != sp[1] != sp[2]]
+            if max_steps is not None and total + len(splits) > max_steps:
+                break
+
+            for p0, p, p1, c0, c1 in splits:
+                color = self(p)
+                ret.append((p, color))
+                total += 1
+                for start, end, first, last in ((p0, p, c0, color), (p, p1, color, c1)):
+                    de = first.delta_e(last, method=delta_e, **delta_e_args)
+                    if de > max_delta_e:
+                        heapq.heappush(queue, (-de, start, end, first, last))
+
+        ret.sort(key=lambda r: r[0])
+        return ret
+
+    def to_lut(
+        self,
+        n: int = 256,
+        space: str | None = None,
+        fit: bool | str | dict[str, Any] = False
+    ) -> GradientLUT[AnyColor]:
+        """
+        Sample the interpolation into an immutable lookup table.
+
+        Samples are taken evenly across the domain, or 0 - 1 if no domain is set.
+        """
+
+        if n < 2:
+            raise ValueError(f'A gradient LUT requires at least 2 samples, but received {n}')
+
+        if space is None:
+            space = self._out_space
+        elif space not in self.color_cls.CS_MAP:
+            raise ValueError(f"'{space}' is not a valid color space")
+
+        start, end = (self._domain[0], self._domain[-1]) if self._domain else (0.0, 1.0)
+        samples = []
+        for i in range(n):
+            color = self(alg.lerp(start, end, i / (n - 1))).convert(space, in_place=True)
+            if fit:
+                if fit is True:
+                    color.fit()
+                elif isinstance(fit, str):
+                    color.fit(method=fit)
+                else:
+                    color.fit(**fit)
+            samples.append(color[:])
+        return GradientLUT(self.color_cls, space, samples, start, end)
+
     def premultiply(self, coords: Vector, alpha: float | None = None) -> None:
         """Apply premultiplication to semi-transparent colors."""
 
@@ -577,24 +696,8 @@ class Interpolator(Generic[AnyColor], metaclass=ABCMeta):
         - Return a color
         """
 
-        # Adjust stop to be relative to the given stops
-        r = last - first
-        if point < first:
-            adjusted_time = point - first if self.extrapolate else 0
-        elif point > last:
-            adjusted_time = 1 + point - last if self.extrapolate else 1
-        else:
-            adjusted_time = (point - first) / r if r else 1
-
-        # Do we have an easing function between these stops?
-        self.current_easing = self.easings[index - 1]
-        if self.current_easing is None:
-            self.current_easing = self.progress
-
         # Interpolate color and return it
-        coords = self.interpolate(adjusted_time, index)
-        if self.premultiplied:
-            self.postdivide(coords)
+        coords = self.segment(self.relative(point, first, last), index)
 
         # Create the color and ensure it is in the correct color space.
         color = self.color_cls(self.space, coords[:-1], coords[-1])
@@ -643,17 +746,78 @@ class Interpolator(Generic[AnyColor], metaclass=ABCMeta):
             p = size * index + (adjusted * size)
         return p
 
+    def handle_padding(self, p: float) -> float:
+        """Scale a point from a domain of 0 to 1 into the padded range."""
+
+        if self._padding:
+            slope = (self._padding[1] - self._padding[0])
+            p = self._padding[0] + slope * p
+            if not self.extrapolate:
+                p = min(max(p, self._padding[0]), self._padding[1])
+        return p
+
+    def relative(self, point: float, first: float, last: float) -> float:
+        """Get the point relative to the given stops."""
+
+        r = last - first
+        if point < first:
+            return point - first if self.extrapolate else 0
+        elif point > last:
+            return 1 + point - last if self.extrapolate else 1
+        return (point - first) / r if r else 1
+
+    def segment(self, t: float, index: int) -> Vector:
+        """Interpolate a point relative to the segment ending at the given stop index, undoing premultiplication."""
+
+        # Do we have an easing function between these stops?
+        self.current_easing = self.easings[index - 1]
+        if self.current_easing is None:
+            self.current_easing = self.progress
+
+        coords = self.interpolate(t, index)
+        if self.premultiplied:
+            self.postdivide(coords)
+        return coords
+
+    def sample_coords(self, points: Iterable[float]) -> list[Vector]:
+        """
+        Interpolate many points, returning the coordinates, including alpha, in the interpolation space.
+
+        Each point's segment is found with a binary search, and interpolators may reuse setup that is
+        specific to a segment across points.
+        """
+
+        length = self.length
+        stops = [self.stops[i] for i in range(length)]
+        results = []
+        for point in points:
+            if self._domain:
+                point = self.handle_domain(point)
+            point = self.handle_padding(point)
+
+            # Find the first stop that the point does not exceed, points past the end use the last segment
+            index = bisect.bisect_left(stops, point, 1, length - 1)
+            results.append(self.segment(self.relative(point, stops[index - 1], stops[index]), index))
+        return results
+
+    def sample(self, points: Iterable[float]) -> ColorArray[AnyColor]:
+        """Interpolate many points, returning a color array in the output space."""
+
+        cs = self.color_cls.CS_MAP[self.space]
+        channels = cs.channels
+        data = array('d')
+        for coords in self.sample_coords(points):
+            data.extend([c.limit(v) for c, v in zip(channels, coords)])
+        colors = ColorArray._from_space(self.color_cls, cs, data)
+        return colors.convert(self._out_space, in_place=True)
+
     def __call__(self, point: float) -> AnyColor:
         """Find which leg of the interpolation the request is between."""
 
         if self._domain:
             point = self.handle_domain(point)
 
-        if self._padding:
-            slope = (self._padding[1] - self._padding[0])
-            point = self._padding[0] + slope * point
-            if not self.extrapolate:
-                point = min(max(point, self._padding[0]), self._padding[1])
+        point = self.handle_padding(point)
 
         # See if point extends past either the first or last stop
         if point < self.start:
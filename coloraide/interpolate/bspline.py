@@ -20,6 +20,7 @@ class InterpolatorBSpline(InterpolatorContinuous[AnyColor]):
         """Initialize."""
 
         self.end_cond = kwargs.get('end_cond', None)  # type: str | None
+        self._coefficients = {}  # type: dict[int, list[Vector]]
         super().__init__(*args, **kwargs)
 
     def setup(self) -> None:
@@ -37,18 +38,16 @@ class InterpolatorBSpline(InterpolatorContinuous[AnyColor]):
     ) -> Vector:
         """Interpolate."""
 
-        # Prepare in-boundary coordinates
-        coords = [*zip(*self.coordinates[index - 1:index + 3])]
+        # Calculate the spline coefficients of each channel for the segment once.
+        coefficients = self._coefficients.get(index)
+        if coefficients is None:
+            spline = self.spline
+            coefficients = [spline.coefficients(*c) for c in zip(*self.coordinates[index - 1:index + 3])]
+            self._coefficients[index] = coefficients
 
         # Apply interpolation to each channel
-        channels = []
-        for i in range(len(self.coordinates[0])):
-
-            t = self.ease(point, i)
-
-            # If `t` ends up spilling out past our boundaries, we need to extrapolate
-            p0, p1, p2, p3 = coords[i]
-            channels.append(self.spline.interpolate(p0, p1, p2, p3, t))
+        evaluate = self.spline.evaluate
+        channels = [evaluate(c, self.ease(point, i)) for i, c in enumerate(coefficients)]
 
         # Small adjustment for floating point math and alpha channels
         if 1 - channels[-1] < 1e-6:
@@ -0,0 +1,175 @@
+"""
+Gradient lookup tables.
+
+A `GradientLUT` holds colors sampled at evenly spaced points along an interpolation.
+Lookups simply find the nearest sample or linearly interpolate between the two closest
+samples, which avoids the cost of evaluating the full interpolation for every point.
+Samples can be exported as packed arrays for direct use as colormaps.
+"""
+from __future__ import annotations
+import math
+from array import array
+from .. import algebra as alg
+from ..types import Vector, AnyColor
+from typing import Generic, Iterator
+
+MODES = ('linear', 'nearest')
+
+
+class GradientLUT(Generic[AnyColor]):
+    """An immutable table of colors sampled from an interpolation."""
+
+    __slots__ = ('_color', '_space', '_stride', '_data', '_size', '_start', '_end', '_hue_index', '_max_hue')
+
+    def __init__(
+        self,
+        color: type[AnyColor],
+        space: str,
+        samples: list[Vector],
+        start: float = 0.0,
+        end: float = 1.0
+    ) -> None:
+        """
+        Initialize.
+
+        Samples are the coordinates, including alpha, of colors evenly spaced from `start` to `end`.
+        """
+
+        if len(samples) < 2:
+            raise ValueError('A gradient LUT requires at least 2 samples')
+
+        cs = color.CS_MAP[space]
+        self._color = color
+        self._space = space
+        self._stride = len(cs.channels)
+        self._size = len(samples)
+        self._start = start
+        self._end = end
+        self._data = array('d')
+        for coords in samples:
+            self._data.extend(coords)
+        if cs.is_polar():
+            self._hue_index = cs.hue_index()  # type: ignore[attr-defined]
+            self._max_hue = cs.channels[self._hue_index].high
+        else:
+            self._hue_index = -1
+            self._max_hue = 0.0
+
+    def __len__(self) -> int:
+        """Number of samples."""
+
+        return self._size
+
+    def __getitem__(self, i: int) -> AnyColor:
+        """Get a sample."""
+
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError('Gradient LUT index out of range')
+        coords = self._data[i * self._stride:(i + 1) * self._stride].tolist()
+        return self._color(self._space, coords[:-1], coords[-1])
+
+    def __iter__(self) -> Iterator[AnyColor]:
+        """Iterate the samples."""
+
+        for i in range(self._size):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        """Representation."""
+
+        return f'GradientLUT(space={self._space!r}, size={self._size})'
+
+    __str__ = __repr__
+
+    def space(self) -> str:
+        """The color space of the samples."""
+
+        return self._space
+
+    def coords(self, point: float, mode: str = 'linear') -> Vector:
+        """
+        Get the coordinates, including alpha, for the given point.
+
+        Points outside the sampled range are clamped to the first or last sample.
+        """
+
+        last = self._size - 1
+        span = self._end - self._start
+        p = alg.clamp((point - self._start) / span * last if span else 0.0, 0.0, last)
+        stride = self._stride
+        data = self._data
+
+        if mode == 'nearest':
+            i = int(p + 0.5) * stride
+            return data[i:i + stride].tolist()
+
+        elif mode == 'linear':
+            index = min(int(p), last - 1)
+            t = p - index
+            i = index * stride
+            c1 = data[i:i + stride].tolist()
+            c2 = data[i + stride:i + stride * 2].tolist()
+            hi = self._hue_index
+            for j in range(stride):
+                a = c1[j]
+                b = c2[j]
+                # Use whichever value is defined if one is undefined.
+                if math.isnan(a):
+                    c1[j] = b
+                    continue
+                elif math.isnan(b):
+                    continue
+                # Take the shortest path between sampled hues.
+                if j == hi:
+                    mx = self._max_hue
+                    if b - a > mx / 2:
+                        a += mx
+                    elif a - b > mx / 2:
+                        b += mx
+                    c1[j] = alg.lerp(a, b, t) % mx
+                else:
+                    c1[j] = alg.lerp(a, b, t)
+            return c1
+
+        raise ValueError(f"'{mode}' is not a supported lookup mode")
+
+    def __call__(self, point: float, mode: str = 'linear') -> AnyColor:
+        """Get the color for the given point."""
+
+        coords = self.coords(point, mode)
+        return self._color(self._space, coords[:-1], coords[-1])
+
+    def to_array(self, typecode: str = 'B', *, alpha: bool = True) -> array[int] | array[float]:
+        """
+        Export the samples as a packed array.
+
+        `B` scales the channels to 8-bit integers relative to each channel's range,
+        while `f` and `d` export the raw values as 32-bit and 64-bit floats respectively.
+        Undefined values are exported as zero.
+        """
+
+        cs = self._color.CS_MAP[self._space]
+        stride = self._stride
+        size = stride if alpha else stride - 1
+        data = self._data
+
+        if typecode == 'B':
+            ranges = [(chan.low, chan.high - chan.low) for chan in cs.channels]
+            result = array('B')
+            for i in range(0, len(data), stride):
+                for j in range(size):
+                    value = data[i + j]
+                    low, span = ranges[j]
+                    value = 0.0 if math.isnan(value) else (value - low) / span
+                    result.append(int(alg.clamp(value, 0.0, 1.0) * 255 + 0.5))
+            return result
+
+        elif typecode in ('f', 'd'):
+            floats = array(typecode)  # type: array[float]
+            for i in range(0, len(data), stride):
+                floats.extend(0.0 if math.isnan(v) else v for v in data[i:i + size])
+            return floats
+
+        raise ValueError(f"'{typecode}' is not a supported array type")
@@ -32,6 +32,8 @@ Modified by Isaac Muse
   1 and calculate residual XYZ difference between what the concentration can produce
   and actual value. Add the interpolated residual back in after blending the reflectance
   curves.
+- Cache the K/S curves and residuals of each interpolation segment so that only the
+  mixing is performed for each interpolated point.
 """
 from __future__ import annotations
 import math
@@ -51,6 +53,9 @@ EPSILON = alg.EPS
 
 SPACE = 'xyz-d65'
 
+# A color decomposed for mixing: K/S curve, residual XYZ, and luminance
+SpectralStop = tuple[Vector, Vector, float]
+
 X_BAR = [
     6.4691998957636e-05, 0.00021940989981324543, 0.0011205743509342526, 0.003766613411711093,
     0.011880553603799004, 0.023286442419177128, 0.034559418196974744, 0.03722379011620067,
@@ -183,6 +188,8 @@ REF_W = [
 
 SIZE = len(X_BAR)
 REFLECTANCE = [REF_W, REF_C, REF_M, REF_Y, REF_R, REF_G, REF_B]
+# Reflectance curves transposed so that the weights of each wavelength are contiguous
+REFLECTANCE_T = [list(w) for w in zip(*REFLECTANCE)]
 
 
 def calculate_mixing_concentration(t: float, l1: float, l2: float) -> tuple[float, float]:
@@ -258,7 +265,7 @@ def single_constant_xyz_to_reflectance(xyz: Vector) -> tuple[Vector, Vector]:
     """
 
     c = xyz_to_concentration(xyz)
-    r = [alg.clamp(sum([c[j] * p[i] for j, p in enumerate(REFLECTANCE)]), EPSILON, 1.0) for i in range(SIZE)]
+    r = [alg.clamp(alg.vdot(c, w), EPSILON, 1.0) for w in REFLECTANCE_T]
     xyz2 = reflectance_to_xyz(r)
     return r, [xyz[0] - xyz2[0], xyz[1] - xyz2[1], xyz[2] - xyz2[2]]
 
@@ -269,18 +276,29 @@ def reflectance_to_xyz(r: Vector) -> Vector:
     return [alg.vdot(r, X_BAR), alg.vdot(r, Y_BAR), alg.vdot(r, Z_BAR)]
 
 
-def spectral_mix(xyz1: Vector, xyz2: Vector, t: float) -> Vector:
-    """Interpolate two colors applying Kubelka-Munk theory."""
+def xyz_to_ks(xyz: Vector) -> SpectralStop:
+    """
+    Decompose an XYZ color into what is needed to mix it.
+
+    Returns the absorption/scattering (K/S) curve, the residual XYZ, and the luminance.
+    """
+
+    r, res = single_constant_xyz_to_reflectance(xyz)
+    return [km_to_ks(v) for v in r], res, xyz[1]
+
+
+def ks_mix(stop1: SpectralStop, stop2: SpectralStop, t: float) -> Vector:
+    """Interpolate two decomposed colors applying Kubelka-Munk theory."""
+
+    ks1, res1, l1 = stop1
+    ks2, res2, l2 = stop2
 
-    # Convert the colors into a reflectance curve
-    r1, res1 = single_constant_xyz_to_reflectance(xyz1)
-    r2, res2 = single_constant_xyz_to_reflectance(xyz2)
     # Calculate weighting for the given interpolation factor using luminance.
     # This gives more weight to high luminance colors.
-    c1, c2 = calculate_mixing_concentration(t, xyz1[1], xyz2[1])
+    c1, c2 = calculate_mixing_concentration(t, l1, l2)
 
     # Apply the Kubelka-Munk mixing.
-    r = [km_to_r(km_to_ks(r1[i]) * c1 + km_to_ks(r2[i]) * c2) for i in range(SIZE)]
+    r = [km_to_r(a * c1 + b * c2) for a, b in zip(ks1, ks2)]
 
     # Convert the reflection back to XYZ and add back in any residual
     xyz1 = reflectance_to_xyz(r)
@@ -288,9 +306,29 @@ def spectral_mix(xyz1: Vector, xyz2: Vector, t: float) -> Vector:
     return [xyz1[0] + xyz2[0], xyz1[1] + xyz2[1], xyz1[2] + xyz2[2]]
 
 
+def spectral_mix(xyz1: Vector, xyz2: Vector, t: float) -> Vector:
+    """Interpolate two colors applying Kubelka-Munk theory."""
+
+    return ks_mix(xyz_to_ks(xyz1), xyz_to_ks(xyz2), t)
+
+
+def spectral_mix_many(xyz1: Vector, xyz2: Vector, points: Iterable[float]) -> list[Vector]:
+    """Interpolate two colors at many points applying Kubelka-Munk theory, decomposing the colors only once."""
+
+    stop1 = xyz_to_ks(xyz1)
+    stop2 = xyz_to_ks(xyz2)
+    return [ks_mix(stop1, stop2, t) for t in points]
+
+
 class InterpolatorSpectralContinuous(InterpolatorContinuous[AnyColor]):
     """Interpolate with continuous piecewise."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize."""
+
+        self._stops = {}  # type: dict[int, tuple[SpectralStop, SpectralStop]]
+        super().__init__(*args, **kwargs)
+
     def interpolate(
         self,
         point: float,
@@ -302,13 +340,18 @@ class InterpolatorSpectralContinuous(InterpolatorContinuous[AnyColor]):
         channels = []
         idx = index - 2 if index == self.length else index - 1
 
-        # Handle spectral interpolation
+        # Decompose the colors of the segment once
         c1, c2 = self.coordinates[idx:idx + 2]
-        channels = spectral_mix(
-            [0.0 if math.isnan(i) else i for i in c1[:-1]],
-            [0.0 if math.isnan(i) else i for i in c2[:-1]],
-            self.ease(point, 0)
-        )
+        stops = self._stops.get(idx)
+        if stops is None:
+            stops = (
+                xyz_to_ks([0.0 if math.isnan(i) else i for i in c1[:-1]]),
+                xyz_to_ks([0.0 if math.isnan(i) else i for i in c2[:-1]])
+            )
+            self._stops[idx] = stops
+
+        # Handle spectral interpolation
+        channels = ks_mix(*stops, self.ease(point, 0))
         channels.append(alg.lerp(c1[-1], c2[-1], self.ease(point, len(c1) - 1)))
         return channels
 
@@ -332,6 +375,12 @@ class InterpolatorSpectralContinuous(InterpolatorContinuous[AnyColor]):
 class InterpolatorSpectralLinear(InterpolatorLinear[AnyColor]):
     """Interpolate multiple ranges of colors using linear, Piecewise interpolation."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize."""
+
+        self._stops = {}  # type: dict[int, tuple[SpectralStop, SpectralStop]]
+        super().__init__(*args, **kwargs)
+
     def interpolate(
             self,
             point: float,
@@ -341,19 +390,25 @@ class InterpolatorSpectralLinear(InterpolatorLinear[AnyColor]):
 
             i = (index - 1) * 2
 
-            # Apply spectral interpolation
+            # Resolve undefined values and decompose the colors of the segment once
             c1, c2 = self.coordinates[i:i + 2]
             aidx = len(c1) - 1
-            for i in range(len(c1)):
-                a, b = c1[i], c2[i]
-                if math.isnan(a) and math.isnan(b):
-                    if i != aidx:
-                        c1[i], c2[i] = 0.0, 0.0
-                elif math.isnan(a):
-                    c1[i] = b
-                elif math.isnan(b):
-                    c2[i] = a
-            coords = spectral_mix(c1[:-1], c2[:-1], self.ease(point, 0))
+            stops = self._stops.get(i)
+            if stops is None:
+                for j in range(len(c1)):
+                    a, b = c1[j], c2[j]
+                    if math.isnan(a) and math.isnan(b):
+                        if j != aidx:
+                            c1[j], c2[j] = 0.0, 0.0
+                    elif math.isnan(a):
+                        c1[j] = b
+                    elif math.isnan(b):
+                        c2[j] = a
+                stops = (xyz_to_ks(c1[:-1]), xyz_to_ks(c2[:-1]))
+                self._stops[i] = stops
+
+            # Apply spectral interpolation
+            coords = ks_mix(*stops, self.ease(point, 0))
             coords.append(alg.lerp(c1[aidx], c2[aidx], self.ease(point, aidx)))
             return coords
 
@@ -460,8 +515,8 @@ class Spectral(Interpolate):
             if premultiplied:
                 coords = [x * alpha for x in coords]
 
-            # Calculate the reflectance and residual XYZ value
-            r, res = single_constant_xyz_to_reflectance(coords)
+            # Calculate the absorption/scattering coefficients and residual XYZ value
+            ks_curve, res, _ = xyz_to_ks(coords)
 
             # Adjust the weight for the spectral mixing based on the luminance
             lfactor = w ** 2 * coords[1]
@@ -471,10 +526,8 @@ class Spectral(Interpolate):
             cavg += (lfactor - cavg) / count
 
             # Apply mixing
-            ks = 0.0
-            for i in range(SIZE):
+            for i, ks in enumerate(ks_curve):
                 # Mix the scattering and absorption coefficients
-                ks = (1 - r[i]) ** 2 / (2 * r[i])
                 counts[i] += 1
                 n = counts[i]
                 avgs[i] += (ks * lfactor - avgs[i]) / n
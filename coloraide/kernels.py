@@ -0,0 +1,346 @@
+"""
+Optional NumPy kernels for batched color conversion.
+
+ColorAide is pure Python, but when NumPy is available, batched conversions can be dispatched
+to array based kernels. Kernels are registered against a space's `to_base` or `from_base`
+function and operate on an `(N, 3)` array of coordinates. If a space overrides the function
+the kernel was registered for, the kernel will not be used for that space.
+
+A compiled conversion pipeline is only vectorized if every step in it has a kernel, otherwise
+the normal, per color path is used. Results of kernels are expected to match the per color
+path within floating point tolerance.
+"""
+from __future__ import annotations
+import functools
+from array import array
+from . import util
+from .spaces import Space
+from .spaces.srgb import sRGB
+from .spaces.display_p3 import DisplayP3
+from .spaces.rec2020 import Rec2020, GAMMA as BT1886_GAMMA, IGAMMA as BT1886_IGAMMA
+from .spaces.lab import Lab, EPSILON, EPSILON3, KAPPA, KE
+from .spaces.lch import LCh
+from .spaces import oklab
+from .spaces import ictcp
+from .spaces import jzazbz
+from .types import Vector, VectorLike, Matrix
+from typing import Any, Callable, Sequence
+
+# NumPy is imported on first use so that it does not slow down importing ColorAide.
+# `HAS_NUMPY` is resolved lazily via the module's `__getattr__`.
+np = None  # type: Any
+_HAS_NUMPY = None  # type: bool | None
+
+# Allow users to disable the NumPy path if desired.
+USE_NUMPY = True
+
+# Batches smaller than this are not worth the overhead of NumPy.
+MIN_BATCH = 32
+
+# Kernels keyed by the space's `to_base` or `from_base` function.
+KERNELS = {}  # type: dict[Callable[..., Vector], Callable[[Any, Any], Any]]
+
+
+def _numpy() -> bool:
+    """Import NumPy if it has not been imported yet and report whether it is available."""
+
+    global np, _HAS_NUMPY
+
+    if _HAS_NUMPY is None:
+        try:
+            import numpy
+            np = numpy
+            _HAS_NUMPY = True
+        except ImportError:  # pragma: no cover
+            _HAS_NUMPY = False
+    return _HAS_NUMPY
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve `HAS_NUMPY` lazily."""
+
+    if name == 'HAS_NUMPY':
+        return _numpy()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def register(func: Callable[..., Vector], kernel: Callable[[Any, Any], Any]) -> None:
+    """
+    Register an array kernel for a space's `to_base` or `from_base` function.
+
+    The kernel is called with the space instance and an `(N, 3)` array and must return
+    an `(N, 3)` array.
+    """
+
+    KERNELS[func] = kernel
+
+
+def available() -> bool:
+    """Check if the NumPy backend is available and enabled."""
+
+    return USE_NUMPY and _numpy()
+
+
+def kernel(func: Callable[..., Vector]) -> Callable[[Callable[[Any, Any], Any]], Callable[[Any, Any], Any]]:
+    """Decorator to register a kernel."""
+
+    def _register(k: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+        register(func, k)
+        return k
+
+    return _register
+
+
+def compile_steps(steps: Sequence[Matrix | Callable[[Vector], Vector]]) -> Callable[[Any], Any] | None:
+    """
+    Translate compiled conversion steps into a single array function.
+
+    If any step does not have a kernel, `None` is returned.
+    """
+
+    if not _numpy():  # pragma: no cover
+        return None
+
+    funcs = []  # type: list[Callable[[Any], Any]]
+    for step in steps:
+        if isinstance(step, list):
+            funcs.append(functools.partial(_matmul, step))
+            continue
+
+        func = getattr(step, '__func__', None)
+        space = getattr(step, '__self__', None)
+        k = KERNELS.get(func) if func is not None and isinstance(space, Space) else None
+        if k is None:
+            return None
+        funcs.append(functools.partial(k, space))
+
+    def run(a: Any) -> Any:
+        """Run the array steps."""
+
+        for f in funcs:
+            a = f(a)
+        return a
+
+    return run
+
+
+def convert_many(run: Callable[[Any], Any], coords: Sequence[VectorLike]) -> list[Vector]:
+    """Convert a sequence of coordinates using an array function."""
+
+    _numpy()
+    return run(np.asarray(coords, dtype=np.float64)).tolist()  # type: ignore[no-any-return]
+
+
+def convert_buffer(
+    run: Callable[[Any], Any],
+    data: array[float],
+    stride: int,
+    nans: Sequence[float]
+) -> array[float]:
+    """
+    Convert a packed buffer of colors with alpha using an array function.
+
+    Undefined values are resolved to the provided defaults before conversion.
+    """
+
+    _numpy()
+    src = np.frombuffer(data, dtype=np.float64).reshape(-1, stride)
+    coords = src[:, :-1]
+    coords = np.where(np.isnan(coords), np.asarray(nans, dtype=np.float64), coords)
+    converted = run(coords)
+    out = np.empty((src.shape[0], converted.shape[1] + 1), dtype=np.float64)
+    out[:, :-1] = converted
+    out[:, -1] = src[:, -1]
+    result = array('d')
+    result.frombytes(out.tobytes())
+    return result
+
+
+def encode(table: array[float], values: array[float]) -> list[int]:
+    """Quantize linear light values with a table from `transfer.encode_table`."""
+
+    _numpy()
+    a = np.frombuffer(values, dtype=np.float64)
+    result = np.searchsorted(np.frombuffer(table, dtype=np.float64), a, side='right')
+    result[np.isnan(a)] = 0
+    return result.tolist()  # type: ignore[no-any-return]
+
+
+def _spow(a: Any, p: float) -> Any:
+    """Signed power."""
+
+    return np.copysign(np.abs(a) ** p, a)
+
+
+def _matmul(m: Matrix, a: Any) -> Any:
+    """Apply a 3x3 matrix to an `(N, 3)` array."""
+
+    return a @ np.asarray(m, dtype=np.float64).T
+
+
+def _eotf_srgb(a: Any) -> Any:
+    """Apply the sRGB EOTF."""
+
+    abs_a = np.abs(a)
+    return np.where(abs_a > 0.04045, np.copysign(((abs_a + 0.055) / 1.055) ** 2.4, a), a / 12.92)
+
+
+def _inverse_eotf_srgb(a: Any) -> Any:
+    """Apply the sRGB inverse EOTF."""
+
+    abs_a = np.abs(a)
+    return np.where(abs_a > 0.0031308, np.copysign(1.055 * abs_a ** (2.4 ** -1) - 0.055, a), 12.92 * a)
+
+
+def _inverse_eotf_st2084(a: Any, m2: float = util.M2) -> Any:
+    """Perceptual quantizer (SMPTE ST 2084) - inverse EOTF."""
+
+    c = _spow(a / 10000.0, util.M1)
+    return _spow((util.C1 + util.C2 * c) / (1.0 + util.C3 * c), m2)
+
+
+def _eotf_st2084(a: Any, m2: float = util.M2) -> Any:
+    """Perceptual quantizer (SMPTE ST 2084) - EOTF."""
+
+    c = _spow(a, 1.0 / m2)
+    return 10000.0 * _spow(np.maximum(c - util.C1, 0.0) / (util.C2 - util.C3 * c), 1.0 / util.M1)
+
+
+@kernel(sRGB.to_base)
+@kernel(DisplayP3.to_base)
+def srgb_to_base(space: Space, a: Any) -> Any:
+    """Gamma encoded sRGB and Display P3 to linear."""
+
+    return _eotf_srgb(a)
+
+
+@kernel(sRGB.from_base)
+@kernel(DisplayP3.from_base)
+def srgb_from_base(space: Space, a: Any) -> Any:
+    """Linear sRGB and Display P3 to gamma encoded."""
+
+    return _inverse_eotf_srgb(a)
+
+
+@kernel(Rec2020.to_base)
+def rec2020_to_base(space: Space, a: Any) -> Any:
+    """Rec. 2020 to linear."""
+
+    return _spow(a, BT1886_GAMMA)
+
+
+@kernel(Rec2020.from_base)
+def rec2020_from_base(space: Space, a: Any) -> Any:
+    """Linear Rec. 2020 to gamma encoded."""
+
+    return _spow(a, BT1886_IGAMMA)
+
+
+@kernel(oklab.Oklab.to_base)
+def oklab_to_base(space: Space, a: Any) -> Any:
+    """Oklab to XYZ D65."""
+
+    return _matmul(oklab.LMS_TO_XYZD65, _matmul(oklab.OKLAB_TO_LMS3, a) ** 3)
+
+
+@kernel(oklab.Oklab.from_base)
+def oklab_from_base(space: Space, a: Any) -> Any:
+    """XYZ D65 to Oklab."""
+
+    return _matmul(oklab.LMS3_TO_OKLAB, np.cbrt(_matmul(oklab.XYZD65_TO_LMS, a)))
+
+
+@kernel(Lab.to_base)
+def lab_to_base(space: Space, a: Any) -> Any:
+    """Lab to XYZ."""
+
+    white = np.asarray(util.xy_to_xyz(space.white()), dtype=np.float64)
+    l = a[:, 0]
+    fy = (l + 16) / 116
+    fx = a[:, 1] / 500 + fy
+    fz = fy - a[:, 2] / 200
+    xyz = np.stack(
+        [
+            np.where(fx > EPSILON3, fx ** 3, (116 * fx - 16) / KAPPA),
+            np.where(l > KE, fy ** 3, l / KAPPA),
+            np.where(fz > EPSILON3, fz ** 3, (116 * fz - 16) / KAPPA)
+        ],
+        axis=1
+    )
+    return xyz * white
+
+
+@kernel(Lab.from_base)
+def lab_from_base(space: Space, a: Any) -> Any:
+    """XYZ to Lab."""
+
+    white = np.asarray(util.xy_to_xyz(space.white()), dtype=np.float64)
+    xyz = a / white
+    f = np.where(xyz > EPSILON, np.cbrt(xyz), (KAPPA * xyz + 16) / 116)
+    fx, fy, fz = f[:, 0], f[:, 1], f[:, 2]
+    return np.stack([(116.0 * fy) - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)], axis=1)
+
+
+@kernel(LCh.to_base)
+def lch_to_base(space: Space, a: Any) -> Any:
+    """LCh to Lab."""
+
+    c = a[:, 1]
+    h = np.radians(a[:, 2])
+    return np.stack([a[:, 0], c * np.cos(h), c * np.sin(h)], axis=1)
+
+
+@kernel(LCh.from_base)
+def lch_from_base(space: Space, a: Any) -> Any:
+    """Lab to LCh."""
+
+    x, y = a[:, 1], a[:, 2]
+    return np.stack([a[:, 0], np.sqrt(x ** 2 + y ** 2), np.degrees(np.arctan2(y, x)) % 360], axis=1)
+
+
+@kernel(ictcp.ICtCp.to_base)
+def ictcp_to_base(space: Space, a: Any) -> Any:
+    """ICtCp to XYZ D65."""
+
+    lms = _eotf_st2084(_matmul(ictcp.ictcp_to_lms_p_mi, a))
+    return _matmul(ictcp.lms_to_xyz_mi, lms) / ictcp.YW
+
+
+@kernel(ictcp.ICtCp.from_base)
+def ictcp_from_base(space: Space, a: Any) -> Any:
+    """XYZ D65 to ICtCp."""
+
+    pqlms = _inverse_eotf_st2084(_matmul(ictcp.xyz_to_lms_m, a * ictcp.YW))
+    return _matmul(ictcp.lms_p_to_ictcp_m, pqlms)
+
+
+@kernel(jzazbz.Jzazbz.to_base)
+def jzazbz_to_base(space: Space, a: Any) -> Any:
+    """Jzazbz to XYZ D65."""
+
+    jz = a[:, 0] + jzazbz.D0
+    d = 1 + jzazbz.D - jzazbz.D * jz
+    iz = np.divide(jz, d, out=np.zeros_like(jz), where=d != 0)
+    izazbz = np.stack([iz, a[:, 1], a[:, 2]], axis=1)
+    lms = _eotf_st2084(_matmul(jzazbz.IZAZBZ_TO_LMS_P, izazbz), jzazbz.M2)
+    xyzm = _matmul(jzazbz.LMS_TO_XYZ, lms)
+    xm, ym, za = xyzm[:, 0], xyzm[:, 1], xyzm[:, 2]
+    xa = (xm + ((jzazbz.B - 1) * za)) / jzazbz.B
+    ya = (ym + ((jzazbz.G - 1) * xa)) / jzazbz.G
+    return np.stack([xa, ya, za], axis=1) / jzazbz.YW
+
+
+@kernel(jzazbz.Jzazbz.from_base)
+def jzazbz_from_base(space: Space, a: Any) -> Any:
+    """XYZ D65 to Jzazbz."""
+
+    absxyz = a * jzazbz.YW
+    xa, ya, za = absxyz[:, 0], absxyz[:, 1], absxyz[:, 2]
+    xm = (jzazbz.B * xa) - ((jzazbz.B - 1) * za)
+    ym = (jzazbz.G * ya) - ((jzazbz.G - 1) * xa)
+    lms = _matmul(jzazbz.XYZ_TO_LMS, np.stack([xm, ym, za], axis=1))
+    izazbz = _matmul(jzazbz.LMS_P_TO_IZAZBZ, _inverse_eotf_st2084(lms, jzazbz.M2))
+    iz = izazbz[:, 0]
+    izazbz[:, 0] = ((1 + jzazbz.D) * iz) / (1 + (jzazbz.D * iz)) - jzazbz.D0
+    return izazbz
+
@@ -0,0 +1,197 @@
+"""
+Palette spatial index.
+
+`Palette` converts a collection of colors, once, to the working space of a color distancing
+algorithm and builds a KD-tree over them to answer nearest color queries.
+
+Distancing algorithms relate their distance to Euclidean distance in their working space via
+`DeltaE.bound`. Euclidean metrics are calculated directly, while other metrics are calculated
+exactly, only using the Euclidean bound to skip parts of the tree that cannot contain a closer
+color. If no bound is known, all colors are compared, but colors are still only converted once.
+"""
+from __future__ import annotations
+import heapq
+import math
+from .types import ColorInput, Vector, AnyColor
+from typing import Any, Generic, Iterable
+
+
+class Palette(Generic[AnyColor]):
+    """A spatial index of colors for nearest color queries."""
+
+    __slots__ = ('_color', '_colors', '_delta', '_kwargs', '_space', '_scales', '_converted', '_points', '_tree')
+
+    def __init__(
+        self,
+        color: type[AnyColor],
+        colors: Iterable[ColorInput],
+        *,
+        method: str | None = None,
+        **kwargs: Any
+    ) -> None:
+        """Initialize."""
+
+        if method is None:
+            method = color.DELTA_E
+
+        delta = color.DE_MAP.get(method)
+        if not delta:
+            raise ValueError(f"'{method}' is not currently a supported distancing algorithm.")
+
+        self._color = color
+        self._delta = delta
+        self._kwargs = kwargs
+        self._colors = [color._handle_color_input(c).clone() for c in colors]
+        self._points = []  # type: list[Vector]
+        self._tree = []  # type: list[tuple[int, int, int, int]]
+
+        ws = delta.working_space(color, **kwargs)
+        if ws is None or color.CS_MAP[ws[0]].is_polar():
+            self._space = None  # type: str | None
+            self._scales = []  # type: Vector
+            self._converted = self._colors
+            return
+
+        self._space, self._scales = ws
+        self._converted = [c.convert(self._space, norm=False) for c in self._colors]
+        self._points = [self._scale(c) for c in self._converted]
+        self._build(list(range(len(self._points))))
+
+    def __len__(self) -> int:
+        """Number of colors in the palette."""
+
+        return len(self._colors)
+
+    def __getitem__(self, i: int) -> AnyColor:
+        """Get a color from the palette."""
+
+        return self._colors[i].clone()
+
+    def __repr__(self) -> str:
+        """Representation."""
+
+        return f'Palette(method={self._delta.NAME!r}, size={len(self)})'
+
+    __str__ = __repr__
+
+    def _scale(self, color: AnyColor) -> Vector:
+        """Get the scaled coordinates of a color in the working space."""
+
+        return [c * s for c, s in zip(color.coords(nans=False), self._scales)]
+
+    def _build(self, indexes: list[int]) -> int:
+        """
+        Build the KD-tree and return the root node.
+
+        Nodes are stored as `(point index, axis, left node, right node)` with `-1` specifying no node.
+        Nodes are split along the axis with the largest spread.
+        """
+
+        if not indexes:
+            return -1
+
+        points = self._points
+        axis = 0
+        spread = -1.0
+        for i in range(len(points[indexes[0]])):
+            values = [points[j][i] for j in indexes]
+            s = max(values) - min(values)
+            if s > spread:
+                axis = i
+                spread = s
+
+        indexes.sort(key=lambda j: points[j][axis])
+        mid = len(indexes) // 2
+        node = len(self._tree)
+        self._tree.append((indexes[mid], axis, -1, -1))
+        left = self._build(indexes[:mid])
+        right = self._build(indexes[mid + 1:])
+        self._tree[node] = (indexes[mid], axis, left, right)
+        return node
+
+    def query(self, color: ColorInput, k: int = 1, radius: float = math.inf) -> list[tuple[int, float]]:
+        """
+        Find the `k` closest colors within the given radius.
+
+        Returns a list of palette indexes and distances sorted by distance. Ties are sorted
+        by palette index.
+        """
+
+        if k < 1 or not self._colors:
+            return []
+
+        delta = self._delta
+        kwargs = self._kwargs
+        sample = self._color._handle_color_input(color)
+        if self._space is not None:
+            sample = sample.convert(self._space, norm=False)
+        converted = self._converted
+
+        factor, exact = delta.bound(sample, **kwargs) if self._space is not None else (0.0, False)
+
+        # Without a bound, compare against all colors.
+        if factor <= 0:
+            results = []
+            for i, c in enumerate(converted):
+                d = delta.distance(sample, c, **kwargs)
+                if d <= radius:
+                    results.append((i, d))
+            results.sort(key=lambda r: (r[1], r[0]))
+            return results[:k]
+
+        point = self._scale(sample)
+        points = self._points
+        tree = self._tree
+
+        # Max heap of the best results so far stored as `(-distance, -index)`.
+        best = []  # type: list[tuple[float, int]]
+
+        def limit() -> float:
+            """The largest distance worth considering."""
+
+            return min(radius, -best[0][0]) if len(best) == k else radius
+
+        def search(node: int) -> None:
+            """Search the tree."""
+
+            if node == -1:
+                return
+
+            i, axis, left, right = tree[node]
+            if exact:
+                d = factor * math.sqrt(sum((a - b) ** 2 for a, b in zip(point, points[i])))
+            else:
+                d = delta.distance(sample, converted[i], **kwargs)
+
+            if d <= radius:
+                if len(best) < k:
+                    heapq.heappush(best, (-d, -i))
+                elif (-d, -i) > best[0]:
+                    heapq.heapreplace(best, (-d, -i))
+
+            diff = point[axis] - points[i][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            search(near)
+            if factor * abs(diff) <= limit():
+                search(far)
+
+        search(0)
+        return sorted(((-i, -d) for d, i in best), key=lambda r: (r[1], r[0]))
+
+    def nearest(self, color: ColorInput) -> AnyColor:
+        """Get the closest color in the palette."""
+
+        results = self.query(color)
+        if not results:
+            raise ValueError('No colors to compare')
+        return self[results[0][0]]
+
+    def k_nearest(self, color: ColorInput, k: int) -> list[AnyColor]:
+        """Get the `k` closest colors in the palette sorted by distance."""
+
+        return [self[i] for i, _ in self.query(color, k)]
+
+    def within_radius(self, color: ColorInput, radius: float) -> list[AnyColor]:
+        """Get all colors in the palette within the given distance sorted by distance."""
+
+        return [self[i] for i, _ in self.query(color, len(self._colors), radius)]
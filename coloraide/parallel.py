@@ -0,0 +1,189 @@
+"""
+Parallel batch conversion.
+
+Colors are split into chunks that are converted by a pool of workers. Chunks are sent to
+workers as packed coordinate arrays instead of color objects. Process workers receive the
+color class once, when the worker starts, so the class must be importable by the workers,
+i.e. defined at the top level of a module. Results are reassembled in order.
+
+Thread workers share the color class directly. On free-threaded builds of Python, threads
+can run in parallel, otherwise, process workers should be used.
+"""
+from __future__ import annotations
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from .batch import ColorArray
+from .types import AnyColor
+from typing import Any, Iterator, Sequence, overload, TYPE_CHECKING
+
+if TYPE_CHECKING:  #pragma: no cover
+    from .color import Color
+
+BACKENDS = ('process', 'thread')
+
+# Chunks smaller than this are not worth the overhead of sending them to a worker.
+MIN_CHUNK = 256
+
+# The color class of a process worker.
+_worker_color = None  # type: type[Color] | None
+
+
+def _init_worker(color: type[Color]) -> None:
+    """Store the color class for a process worker."""
+
+    global _worker_color
+
+    _worker_color = color
+
+
+def convert_chunk(
+    color: type[Color] | None,
+    source: str,
+    target: str,
+    data: array[float],
+    fit: bool | str | dict[str, Any],
+    norm: bool
+) -> array[float]:
+    """Convert a chunk of packed colors and optionally gamut map them."""
+
+    if color is None:
+        color = _worker_color
+        assert color is not None
+
+    colors = ColorArray._from_space(color, color.CS_MAP[source], data)
+    colors.convert(target, in_place=True, norm=norm)
+    if fit:
+        if fit is True:
+            colors.fit()
+        elif isinstance(fit, str):
+            colors.fit(method=fit)
+        else:
+            colors.fit(**fit)
+    return colors.data
+
+
+def chunks(
+    colors: ColorArray[AnyColor] | Sequence[AnyColor],
+    size: int
+) -> Iterator[tuple[str, array[float]]]:
+    """Split colors into chunks of packed coordinates, each containing colors of a single color space."""
+
+    if isinstance(colors, ColorArray):
+        space = colors.space()
+        step = size * len(colors._space.channels)
+        data = colors.data
+        for i in range(0, len(data), step):
+            yield space, data[i:i + step]
+        return
+
+    space = ''
+    chunk = array('d')
+    count = 0
+    for c in colors:
+        s = c.space()
+        if count and (s != space or count == size):
+            yield space, chunk
+            chunk = array('d')
+            count = 0
+        space = s
+        chunk.extend(c._coords)
+        count += 1
+    if count:
+        yield space, chunk
+
+
+@overload
+def map_convert(
+    colors: ColorArray[AnyColor],
+    space: str,
+    *,
+    fit: bool | str | dict[str, Any] = False,
+    norm: bool = True,
+    workers: int | None = None,
+    backend: str = 'process',
+    chunksize: int | None = None
+) -> ColorArray[AnyColor]:
+    ...
+
+
+@overload
+def map_convert(
+    colors: Sequence[AnyColor],
+    space: str,
+    *,
+    fit: bool | str | dict[str, Any] = False,
+    norm: bool = True,
+    workers: int | None = None,
+    backend: str = 'process',
+    chunksize: int | None = None
+) -> list[AnyColor]:
+    ...
+
+
+def map_convert(
+    colors: ColorArray[AnyColor] | Sequence[AnyColor],
+    space: str,
+    *,
+    fit: bool | str | dict[str, Any] = False,
+    norm: bool = True,
+    workers: int | None = None,
+    backend: str = 'process',
+    chunksize: int | None = None
+) -> ColorArray[AnyColor] | list[AnyColor]:
+    """
+    Convert colors to the given color space in parallel, optionally gamut mapping the results.
+
+    `fit` accepts the same values as `to_string`. A `ColorArray` is returned for a `ColorArray`,
+    otherwise, a list of colors is returned.
+    """
+
+    if backend not in BACKENDS:
+        raise ValueError(f"'{backend}' is not a supported backend")
+
+    if isinstance(colors, ColorArray):
+        color = colors._color
+        total = len(colors)
+    else:
+        if not colors:
+            return []
+        color = type(colors[0])
+        total = len(colors)
+
+    if space not in color.CS_MAP:
+        raise ValueError(f"'{space}' is not a valid color space")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(MIN_CHUNK, -(-total // (workers * 4)))
+
+    tasks = list(chunks(colors, chunksize))
+    if workers <= 1 or len(tasks) <= 1:
+        results = [convert_chunk(color, s, space, data, fit, norm) for s, data in tasks]
+    else:
+        pool = (
+            ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(color,))
+            if backend == 'process' else
+            ThreadPoolExecutor(workers)
+        )
+        shared = None if backend == 'process' else color
+        with pool:
+            results = list(
+                pool.map(
+                    convert_chunk,
+                    [shared] * len(tasks),
+                    [s for s, _ in tasks],
+                    [space] * len(tasks),
+                    [data for _, data in tasks],
+                    [fit] * len(tasks),
+                    [norm] * len(tasks)
+                )
+            )
+
+    cs = color.CS_MAP[space]
+    data = array('d')
+    for r in results:
+        data.extend(r)
+    converted = ColorArray._from_space(color, cs, data)
+    return converted if isinstance(colors, ColorArray) else converted.to_colors()
@@ -190,7 +190,7 @@ class Space(Plugin, metaclass=SpaceMeta):
         idx = self._chan_index.get(self.CHANNEL_ALIASES.get(name, name))
         return int(name) if idx is None else idx
 
-    def resolve_channel(self, index: int, coords: Vector) -> float:
+    def resolve_channel(self, index: int, coords: VectorLike) -> float:
         """Resolve channels."""
 
         value = coords[index]
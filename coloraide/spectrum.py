@@ -5,8 +5,8 @@ Handle spectral related things.
 """
 from __future__ import annotations
 import math
-from functools import lru_cache
 from . import algebra as alg
+from . import cache
 from . import util
 from .types import Vector, VectorLike
 from . import cat
@@ -15,7 +15,7 @@ from . import cmfs
 WHITE = cat.WHITES['2deg']['E']
 
 
-@lru_cache(maxsize=1)
+@cache.memoize('locus_angles', maxsize=1)
 def get_locus_angles(cmfs: cmfs.CMFs, white: VectorLike) -> tuple[Vector, float]:
     """Get the angles of the points and return list of angles and the offset we adjust the angles."""
 
@@ -5,9 +5,11 @@ https://www.researchgate.net/publication/263373260_Practical_Use_and_Calculation
 """
 from __future__ import annotations
 import math
+from array import array
 from . import planck
 from .. import cat
 from .. import cmfs
+from .. import cache
 from .. import util
 from .. import algebra as alg
 from . import CCT
@@ -17,13 +19,17 @@ from typing import Any, TYPE_CHECKING
 if TYPE_CHECKING:  #pragma: no cover
     from ..color import Color
 
+# Temperature ranges of the blackbody splines: start, end, and steps.
+# For improved accuracy, low and high temperatures use separate splines.
+RANGES = ((1000, 20000, 100), (20000, 100000, 150))
+
 
 class BlackBodyCurve:
     """
     Setup a spline that represents the black body curve.
 
     Points between steps are approximated, but actual points can always be
-    acquired via `exact`.
+    acquired via `exact`. The splines are not generated until they are first needed.
 
     For improved accuracy, we split spline data for low temps and high temps
     and assign the number of required data points accordingly.
@@ -41,45 +47,48 @@ class BlackBodyCurve:
         self.cmfs = cmfs
         self.white = util.xy_to_xyz(white)
         self.planck_step = planck_step
+        self.chromaticity = chromaticity
         self.to_uv = util.xy_to_uv_1960 if chromaticity == 'uv-1960' else util.xy_to_uv
 
-        # Low temperature range
-        start = 1000
-        end = 20000
-        step = 100
-        inc = (end - start) / step
-        count = step + 1
-        points = []
-        domain = []
-        for r in range(count):
-            k = r * inc + start
-            u, v = self.to_uv(
-                planck.temp_to_xy_planckian_locus(
-                    k, self.cmfs, self.white, self.cmfs.start, self.cmfs.end, self.planck_step
-                )
-            )
-            domain.append(k)
-            points.append([u, v])
-        self.spline = alg.interpolate(points, domain=domain, method='sprague')
-
-        # High temperature range
-        start = end
-        end = 100000
-        step = 150
-        inc = (end - start) / step
-        count = step + 1
-        points = []
-        domain.clear()
-        for r in range(count):
-            k = r * inc + start
-            u, v = self.to_uv(
-                planck.temp_to_xy_planckian_locus(
-                    k, self.cmfs, self.white, self.cmfs.start, self.cmfs.end, self.planck_step
+        self.splines = None  # type: tuple[alg.Interpolator, alg.Interpolator] | None
+
+    def generate_samples(self) -> array[float]:
+        """Sample the locus, as flattened uv pairs, for the low and high temperature ranges."""
+
+        samples = array('d')
+        for start, end, step in RANGES:
+            inc = (end - start) / step
+            for r in range(step + 1):
+                k = r * inc + start
+                samples.extend(
+                    self.to_uv(
+                        planck.temp_to_xy_planckian_locus(
+                            k, self.cmfs, self.white, self.cmfs.start, self.cmfs.end, self.planck_step
+                        )
+                    )
                 )
-            )
-            domain.append(k)
-            points.append([u, v])
-        self.spline2 = alg.interpolate(points, domain=domain, method='sprague')
+        return samples
+
+    def generate_splines(self) -> tuple[alg.Interpolator, alg.Interpolator]:
+        """
+        Generate the splines for the low and high temperature ranges.
+
+        Sampling the locus is expensive, so samples are loaded from the persistent cache when possible.
+        """
+
+        key = cache.fingerprint('blackbody', self.chromaticity, self.cmfs, self.white, self.planck_step, RANGES)
+        samples = cache.load('blackbody', key, self.generate_samples)
+
+        splines = []
+        offset = 0
+        for start, end, step in RANGES:
+            inc = (end - start) / step
+            count = step + 1
+            points = [samples[i:i + 2].tolist() for i in range(offset, offset + count * 2, 2)]
+            domain = [r * inc + start for r in range(count)]
+            splines.append(alg.interpolate(points, domain=domain, method='sprague'))
+            offset += count * 2
+        return splines[0], splines[1]
 
     def __call__(self, temp: float, exact: bool = False) -> Vector:
         """Get the uv for the given temp."""
@@ -91,9 +100,11 @@ class BlackBodyCurve:
                 )
             )
         else:
-            if temp <= 20000:
-                return self.spline(temp)
-            return self.spline2(temp)
+            # Splines are generated on first use as sampling the locus is expensive.
+            splines = self.splines
+            if splines is None:
+                splines = self.splines = self.generate_splines()
+            return splines[0](temp) if temp <= 20000 else splines[1](temp)
 
 
 class Ohno2013(CCT):
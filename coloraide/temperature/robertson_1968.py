@@ -8,11 +8,13 @@ Uses Robertson 1968 method.
 """
 from __future__ import annotations
 import math
+from array import array
 from . import planck
 from .. import algebra as alg
 from .. import util
 from .. import cat
 from .. import cmfs
+from .. import cache
 from . import CCT
 from ..types import Vector, VectorLike
 from typing import Any, TYPE_CHECKING, NamedTuple
@@ -55,7 +57,41 @@ class Robertson1968(CCT):
         """Initialize."""
 
         self.white = white
-        self.table = self.generate_table(cmfs, white, mired, sigfig, planck_step)
+        self.cmfs = cmfs
+        self.mired = mired
+        self.sigfig = sigfig
+        self.planck_step = planck_step
+        self._table = None  # type: list[CCTEntry] | None
+
+    @property
+    def table(self) -> list[CCTEntry]:
+        """
+        Get the table, generating it on first use.
+
+        Generating the table requires integrating the Planckian locus for every mired entry,
+        so it is deferred to avoid paying the cost when the plugin is merely registered.
+        """
+
+        if self._table is None:
+            self._table = self.load_table()
+        return self._table
+
+    def load_table(self) -> list[CCTEntry]:
+        """Load the table from the persistent cache, generating it if it is not cached."""
+
+        key = cache.fingerprint(
+            self.NAME, self.CHROMATICITY, self.cmfs, self.white, self.mired, self.sigfig, self.planck_step
+        )
+        data = cache.load(
+            self.NAME,
+            key,
+            lambda: array(
+                'd',
+                [v for entry in self.generate_table(self.cmfs, self.white, self.mired, self.sigfig, self.planck_step)
+                 for v in entry]
+            )
+        )
+        return [CCTEntry(*data[i:i + 7]) for i in range(0, len(data), 7)]
 
     def generate_table(
         self,
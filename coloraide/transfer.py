@@ -0,0 +1,99 @@
+"""
+Transfer function lookup tables for integer encoded colors.
+
+Integer channels of a given bit depth have a limited number of values, at most 65536 for
+16 bit channels. Instead of evaluating a color space's transfer function for every channel
+of every color, the linear light value of every possible integer is calculated once and
+then looked up. Encoding works the same way in reverse: the linear light values halfway
+between every pair of adjacent integers are calculated once, and linear light values are
+quantized by searching for where they fall between them.
+
+Tables are provided for any color space that reports its base space as its linear version,
+e.g. sRGB, Display P3, A98 RGB, ProPhoto RGB, Rec. 709, Rec. 2020, Rec. 2100 PQ and HLG.
+"""
+from __future__ import annotations
+from array import array
+from bisect import bisect_right
+from . import cache
+from typing import Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:  #pragma: no cover
+    from .spaces import Space
+
+MAX_BITS = 16
+
+
+def max_value(bits: int) -> int:
+    """Get the maximum integer value for a bit depth."""
+
+    if not 1 <= bits <= MAX_BITS:
+        raise ValueError(f'Bit depth must be between 1 and {MAX_BITS}, not {bits}')
+    return (1 << bits) - 1
+
+
+@cache.memoize('quantization_table', maxsize=MAX_BITS)
+def quantization_table(bits: int) -> array[float]:
+    """Get a table that maps integers of the given bit depth to values between 0 and 1."""
+
+    mx = max_value(bits)
+    return array('d', [i / mx for i in range(mx + 1)])
+
+
+def has_transfer(cs: Space) -> bool:
+    """Check whether the color space is a transfer function applied to its linear base space."""
+
+    linear = cs.linear()
+    return bool(linear) and linear == cs.BASE and linear != cs.NAME
+
+
+@cache.memoize('transfer_table', maxsize=64)
+def decode_table(cs: Space, bits: int) -> array[float]:
+    """
+    Get a table that maps integers of the given bit depth to linear light values.
+
+    The color space's `to_base` must apply its transfer function to each channel independently.
+    """
+
+    return _to_linear(cs, quantization_table(bits))
+
+
+@cache.memoize('encode_table', maxsize=64)
+def encode_table(cs: Space, bits: int) -> array[float]:
+    """
+    Get a table of the linear light values halfway between adjacent integers of the given bit depth.
+
+    Use with `encode` to quantize linear light values. The transfer function must be increasing.
+    """
+
+    mx = max_value(bits)
+    return _to_linear(cs, array('d', [(i + 0.5) / mx for i in range(mx)]))
+
+
+def encode(table: array[float], values: Iterable[float]) -> list[int]:
+    """
+    Quantize linear light values with a table from `encode_table`.
+
+    Values are clamped to the range of the bit depth, values halfway between integers round up,
+    and undefined values are treated as zero.
+    """
+
+    return [bisect_right(table, v) if v == v else 0 for v in values]
+
+
+def _to_linear(cs: Space, values: array[float]) -> array[float]:
+    """Apply the color space's transfer function to get linear light values."""
+
+    if not has_transfer(cs):
+        raise ValueError(f"'{cs.NAME}' does not have a transfer function")
+
+    # Evaluate the transfer function a color's worth of channels at a time.
+    size = len(cs.CHANNELS)
+    total = len(values)
+    table = array('d')
+    for i in range(0, total, size):
+        chunk = values[i:i + size].tolist()
+        count = len(chunk)
+        if count < size:
+            chunk.extend([0.0] * (size - count))
+        table.extend(cs.to_base(chunk)[:count])
+    return table
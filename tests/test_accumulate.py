@@ -0,0 +1,112 @@
+"""Test streaming color averages."""
+import unittest
+from coloraide import Color
+from coloraide.accumulate import ColorAccumulator
+from . import util
+
+
+class TestColorAccumulator(util.ColorAsserts, unittest.TestCase):
+    """Test color accumulators."""
+
+    COLORS = [
+        'red', 'rgb(0 0 255 / 0.5)', 'hsl(none 0% 50%)', 'oklch(0.5 0.1 none / none)',
+        'transparent', 'green', 'color(srgb 1 1 0 / 0.25)', 'white'
+    ]
+    WEIGHTS = [1, 0.5, 2, 1, 3, -1]
+
+    def test_average(self):
+        """Test that results match averaging."""
+
+        for space in ('srgb-linear', 'oklch', 'hsl', 'hwb'):
+            for premultiplied in (True, False):
+                acc = ColorAccumulator(Color, space, premultiplied=premultiplied)
+                for c in self.COLORS:
+                    acc.add(c)
+                self.assertEqual(len(acc), len(self.COLORS))
+                self.assertColorEqual(
+                    acc.result(),
+                    Color.average(self.COLORS, space=space, premultiplied=premultiplied)
+                )
+
+    def test_weights(self):
+        """Test weighted averages."""
+
+        acc = ColorAccumulator(Color, 'oklab').add_many(self.COLORS, self.WEIGHTS)
+        self.assertColorEqual(acc.result(), Color.average(self.COLORS, self.WEIGHTS, space='oklab'))
+        acc = ColorAccumulator(Color, 'oklab').add_many(self.COLORS[:2], self.WEIGHTS)
+        self.assertColorEqual(acc.result(), Color.average(self.COLORS[:2], self.WEIGHTS, space='oklab'))
+
+    def test_empty_weights(self):
+        """Test that empty weights average without weights like `Color.average`."""
+
+        for space in ('srgb', 'oklch', 'hsl'):
+            acc = ColorAccumulator(Color, space).add_many(self.COLORS, [])
+            self.assertColorEqual(acc.result(), Color.average(self.COLORS, [], space=space))
+            self.assertColorEqual(acc.result(), ColorAccumulator(Color, space).add_many(self.COLORS).result())
+
+    def test_default_space(self):
+        """Test the default averaging space and output space."""
+
+        acc = ColorAccumulator(Color).add_many(['red', 'blue'])
+        self.assertEqual(acc.space, Color.AVERAGE)
+        self.assertColorEqual(acc.result(out_space='srgb'), Color.average(['red', 'blue'], out_space='srgb'))
+
+    def test_carryforward(self):
+        """Test carrying forward undefined values."""
+
+        colors = ['lch(50 none 30)', 'oklch(0.7 0.1 180)']
+        acc = ColorAccumulator(Color, 'oklch', carryforward=True).add_many(colors)
+        self.assertColorEqual(acc.result(), Color.average(colors, space='oklch', carryforward=True))
+
+    def test_achromatic(self):
+        """Test averaging only achromatic colors."""
+
+        acc = ColorAccumulator(Color, 'hsl').add_many(['white', 'black', 'hsl(90 0% 50%)'])
+        self.assertColorEqual(acc.result(), Color('hsl(none 0% 50%)'))
+
+    def test_merge(self):
+        """Test merging accumulators."""
+
+        for space in ('srgb-linear', 'oklch', 'hwb'):
+            expected = Color.average(self.COLORS, space=space)
+            for split in range(len(self.COLORS) + 1):
+                acc1 = ColorAccumulator(Color, space).add_many(self.COLORS[:split])
+                acc2 = ColorAccumulator(Color, space).add_many(self.COLORS[split:])
+                self.assertColorEqual(acc1.merge(acc2).result(), expected)
+
+    def test_serialize(self):
+        """Test serializing and restoring state."""
+
+        acc = ColorAccumulator(Color, 'oklch', premultiplied=False, powerless=False).add_many(self.COLORS[:4])
+        restored = ColorAccumulator.from_bytes(Color, acc.to_bytes())
+        self.assertEqual(restored.space, 'oklch')
+        self.assertFalse(restored.premultiplied)
+        self.assertFalse(restored.powerless)
+        self.assertEqual(len(restored), 4)
+        self.assertColorEqual(restored.result(), acc.result())
+
+        restored.add_many(self.COLORS[4:])
+        self.assertColorEqual(
+            restored.result(),
+            ColorAccumulator(Color, 'oklch', premultiplied=False, powerless=False).add_many(self.COLORS).result()
+        )
+
+    def test_errors(self):
+        """Test bad inputs."""
+
+        with self.assertRaises(ValueError):
+            ColorAccumulator(Color, 'bad')
+        with self.assertRaises(ValueError):
+            ColorAccumulator(Color).result()
+        with self.assertRaises(ValueError):
+            ColorAccumulator(Color, 'oklab').merge(ColorAccumulator(Color, 'srgb-linear'))
+        with self.assertRaises(ValueError):
+            ColorAccumulator(Color).merge(ColorAccumulator(Color, premultiplied=False))
+
+        data = ColorAccumulator(Color).add('red').to_bytes()
+        with self.assertRaises(ValueError):
+            ColorAccumulator.from_bytes(Color, data[:-1])
+        with self.assertRaises(ValueError):
+            ColorAccumulator.from_bytes(Color, b'')
+        with self.assertRaises(ValueError):
+            ColorAccumulator.from_bytes(Color, b'\x02' + data[1:])
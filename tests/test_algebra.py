@@ -2703,6 +2703,59 @@ class TestAlgebra(unittest.TestCase):
             b = alg.reshape([1] * 24, (3, 4, 2))
             alg.solve(m, b)
 
+    def test_solve_banded(self):
+        """Test solving of banded linear equations."""
+
+        # Tridiagonal
+        m = [[4, 1, 0, 0, 0],
+             [2, 5, 1, 0, 0],
+             [0, 1, 6, 3, 0],
+             [0, 0, 2, 7, 1],
+             [0, 0, 0, 1, 3]]
+        ab = [[0, 1, 1, 3, 1],
+              [4, 5, 6, 7, 3],
+              [2, 1, 2, 1, 0]]
+        b = [1, -2, 3, 5, 0]
+        self.assertTrue(alg.allclose(alg.solve_banded((1, 1), ab, b), alg.solve(m, b), abs_tol=1e-15))
+
+        sm = [[1, 2], [-2, 0], [3, 1], [5, -4], [0, 2]]
+        self.assertTrue(alg.allclose(alg.solve_banded((1, 1), ab, sm), alg.solve(m, sm), abs_tol=1e-15))
+
+        # Two lower diagonals, one upper diagonal
+        m = [[5, 1, 0, 0],
+             [2, 6, 2, 0],
+             [1, 1, 7, 3],
+             [0, 2, 1, 8]]
+        ab = [[0, 1, 2, 3],
+              [5, 6, 7, 8],
+              [2, 1, 1, 0],
+              [1, 2, 0, 0]]
+        b = [3, 1, -4, 2]
+        self.assertTrue(alg.allclose(alg.solve_banded((2, 1), ab, b), alg.solve(m, b), abs_tol=1e-15))
+
+        # Diagonal
+        self.assertEqual(alg.solve_banded((0, 0), [[2, 4, 8]], [1, 2, 4]), [0.5, 0.5, 0.5])
+
+        # Singular
+        with self.assertRaises(ValueError):
+            alg.solve_banded((1, 1), [[0, 1, 1], [0, 4, 4], [1, 1, 0]], [1, 2, 3])
+
+        # Wrong number of diagonals
+        with self.assertRaises(ValueError):
+            alg.solve_banded((1, 1), [[4, 4, 4], [1, 1, 0]], [1, 2, 3])
+
+        # Negative diagonal count
+        with self.assertRaises(ValueError):
+            alg.solve_banded((-1, 1), [[4, 4, 4]], [1, 2, 3])
+
+        # Mismatched diagonals
+        with self.assertRaises(ValueError):
+            alg.solve_banded((1, 1), [[0, 1, 1], [4, 4], [1, 1, 0]], [1, 2, 3])
+
+        # Mismatched `b`
+        with self.assertRaises(ValueError):
+            alg.solve_banded((1, 1), [[0, 1, 1], [4, 4, 4], [1, 1, 0]], [1, 2])
+
     def test_lu(self):
         """Test `LU` decomposition."""
 
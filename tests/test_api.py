@@ -126,6 +126,28 @@ class TestMisc(util.ColorAsserts, unittest.TestCase):
         c1[:] = c2[:]
         self.assertColorEqual(c1, c2)
 
+    def test_compact_storage(self):
+        """Test that colors are slotted and store coordinates compactly."""
+
+        c1 = ColorAll('color(srgb 1 0.5 none / 0.5)')
+        self.assertFalse(hasattr(c1, '__dict__'))
+        self.assertFalse(hasattr(Color.freeze()('red'), '__dict__'))
+        self.assertIsInstance(c1[:], list)
+        self.assertIsInstance(c1.coords(), list)
+        self.assertEqual(c1[:-2], c1.coords()[:-1])
+        self.assertTrue(math.isnan(c1[2]))
+
+        c2 = c1.clone()
+        c2[:] = [0, 0, 0, 1]
+        self.assertEqual(c1[:-2], [1, 0.5])
+        self.assertTrue(c1.is_nan('blue'))
+        self.assertEqual(c1.alpha(), 0.5)
+        self.assertEqual(c2[:], [0, 0, 0, 1])
+
+        c3 = c1.convert('cmyk')
+        self.assertEqual(len(c3[:]), 5)
+        self.assertColorEqual(c3.convert('srgb'), c1.clone().set('blue', 0))
+
     def test_none(self):
         """Test none."""
 
@@ -667,6 +689,112 @@ class TestMisc(util.ColorAsserts, unittest.TestCase):
         self.assertEqual(obj.start, 21)
         self.assertEqual(obj.end, 35)
 
+    def test_finditer(self):
+        """Test finding all colors in a buffer."""
+
+        text = 'a { color: red; --red: #0000FF; b: var(--red) lch(50% 30 20) color(display-p3 1 0 0) #zzz darkred; }'
+        results = [(m.color, text[m.start:m.end]) for m in Color.finditer(text)]
+        self.assertEqual(
+            results,
+            [
+                (Color('red'), 'red'),
+                (Color('blue'), '#0000FF'),
+                (Color('lch(50% 30 20)'), 'lch(50% 30 20)'),
+                (Color('display-p3', [1, 0, 0]), 'color(display-p3 1 0 0)'),
+                (Color('darkred'), 'darkred')
+            ]
+        )
+
+    def test_finditer_bounds(self):
+        """Test finding colors within a region of a buffer."""
+
+        text = 'red green blue'
+        self.assertEqual([m.color for m in Color.finditer(text, 1)], [Color('green'), Color('blue')])
+        self.assertEqual([m.color for m in Color.finditer(text, 0, 12)], [Color('red'), Color('green')])
+        self.assertEqual(list(Color.finditer(text, 0, 2)), [])
+
+    def test_finditer_bytes(self):
+        """Test finding all colors in byte buffers."""
+
+        import mmap
+        import tempfile
+
+        text = 'red green #00F rgb(1 2 3)'
+        expected = [(m.color, m.start, m.end) for m in Color.finditer(text)]
+        self.assertEqual(len(expected), 4)
+        self.assertEqual([(m.color, m.start, m.end) for m in Color.finditer(text.encode('ascii'))], expected)
+
+        with tempfile.TemporaryFile() as f:
+            f.write(text.encode('ascii'))
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                self.assertEqual([(m.color, m.start, m.end) for m in Color.finditer(buf)], expected)
+
+    def test_finditer_long_color(self):
+        """Test finding colors that are longer than the match window."""
+
+        text = 'x color(srgb 1 0 0' + ' ' * 2000 + ') blue'
+        for buf in (text, text.encode('ascii')):
+            results = [(m.color, m.start, m.end) for m in Color.finditer(buf)]
+            self.assertEqual(results, [(Color('red'), 2, len(text) - 5), (Color('blue'), len(text) - 4, len(text))])
+
+    def test_finditer_bounded_windows(self):
+        """Test that failed candidates in a long buffer without a closing parenthesis do not rescan the buffer."""
+
+        from coloraide.css import parse
+
+        sizes = []
+
+        class Custom(Color):
+            @classmethod
+            def _match(cls, string, start=0, fullmatch=False):
+                sizes.append(len(string))
+                return super()._match(string, start, fullmatch)
+
+        tail = 'x' * (parse.MAX_MATCH_LENGTH * 4)
+        for buf in ('#12345 rgb(1 2 ' * 200 + tail, ('#12345 rgb(1 2 ' * 200 + tail).encode('ascii')):
+            sizes.clear()
+            self.assertEqual(list(Custom.finditer(buf)), [])
+            self.assertEqual(len(sizes), 400)
+            self.assertTrue(max(sizes) <= parse.MAX_MATCH_WINDOW)
+
+        # Functions are only grown to their end, and never past the maximum length.
+        sizes.clear()
+        self.assertEqual(list(Custom.finditer('rgb(1 2' + ' ' * parse.MAX_MATCH_LENGTH + ')')), [])
+        self.assertEqual(sizes, [parse.MAX_MATCH_WINDOW])
+        sizes.clear()
+        self.assertEqual(len(list(Custom.finditer('rgb(1 2 3' + ' ' * 1500 + ') ' + tail))), 1)
+        self.assertEqual(sizes, [parse.MAX_MATCH_WINDOW, 1510])
+
+    def test_finditer_custom_syntax(self):
+        """Test finding colors of registered spaces that provide their own syntax."""
+
+        import re
+        from coloraide.spaces.srgb import sRGB
+
+        class Brackets(sRGB):
+            NAME = 'brackets'
+            SERIALIZE = ('--brackets',)
+
+            def match(self, string, start=0, fullmatch=True):
+                m = re.compile(r'brackets\[([\d.]+),([\d.]+),([\d.]+)\]').match(string, start)
+                if m is None or (fullmatch and m.end() != len(string)):
+                    return None
+                return ([float(v) for v in m.groups()], 1.0), m.end()
+
+        class Custom(Color):
+            pass
+
+        Custom.register(Brackets())
+
+        text = 'a brackets[1,0,0] b red c xbrackets[0,0,1]'
+        self.assertEqual(
+            [(m.color, text[m.start:m.end]) for m in Custom.finditer(text)],
+            [(Custom('brackets', [1, 0, 0]), 'brackets[1,0,0]'), (Custom('red'), 'red')]
+        )
+        self.assertEqual(next(m.color for m in Custom.finditer(text.encode('ascii'))), Custom('brackets', [1, 0, 0]))
+        self.assertEqual([m.color for m in Color.finditer(text)], [Color('red')])
+
     def test_mask_in_place(self):
         """Test masking "in place"."""
 
@@ -0,0 +1,244 @@
+"""Test batch color handling."""
+import math
+import unittest
+from coloraide import Color
+from coloraide.batch import ColorArray
+from . import util
+
+
+class TestColorArray(util.ColorAsserts, unittest.TestCase):
+    """Test color arrays."""
+
+    COLORS = [
+        [1.0, 0.0, 0.0],
+        [0.5, 0.5, 0.5],
+        [0.0, 0.0, 1.0],
+        [0.25, 1.2, -0.1]
+    ]
+
+    def test_create(self):
+        """Test creation."""
+
+        a = ColorArray(Color, 'srgb', self.COLORS, [1.0, 0.5, 0.25, 0.0])
+        self.assertEqual(len(a), 4)
+        self.assertEqual(a.space(), 'srgb')
+        self.assertEqual(a.coords(), self.COLORS)
+        self.assertEqual(a.alpha(), [1.0, 0.5, 0.25, 0.0])
+        self.assertEqual(len(a.data), 16)
+
+    def test_bad_space(self):
+        """Test bad space."""
+
+        with self.assertRaises(ValueError):
+            ColorArray(Color, 'bad', self.COLORS)
+
+    def test_bad_channels(self):
+        """Test bad channel count."""
+
+        with self.assertRaises(ValueError):
+            ColorArray(Color, 'srgb', [[1, 0]])
+
+    def test_from_colors(self):
+        """Test creation from colors."""
+
+        a = ColorArray.from_colors(
+            Color,
+            ['red', Color('display-p3', [0, 1, 0]), {'space': 'srgb', 'coords': [0, 0, 1]}]
+        )
+        self.assertEqual(a.space(), 'srgb')
+        self.assertColorEqual(a[0], Color('red'))
+        self.assertColorEqual(a[1], Color('display-p3', [0, 1, 0]).convert('srgb'))
+        self.assertColorEqual(a[2], Color('blue'))
+
+        with self.assertRaises(ValueError):
+            ColorArray.from_colors(Color, [])
+
+        self.assertEqual(len(ColorArray.from_colors(Color, [], 'srgb')), 0)
+
+    def test_from_ints(self):
+        """Test creation from integer channels."""
+
+        data = bytes([255, 128, 0, 0, 64, 255])
+        a = ColorArray.from_ints(Color, 'srgb', data)
+        self.assertEqual(a.space(), 'srgb-linear')
+        self.assertEqual(a[0], Color('srgb', [1, 128 / 255, 0]).convert('srgb-linear'))
+        self.assertEqual(a[1], Color('srgb', [0, 64 / 255, 1]).convert('srgb-linear'))
+
+        a = ColorArray.from_ints(Color, 'srgb', data, linear=False)
+        self.assertEqual(a.space(), 'srgb')
+        self.assertEqual(a.coords(), [[1, 128 / 255, 0], [0, 64 / 255, 1]])
+
+        a = ColorArray.from_ints(Color, 'srgb', data[:4], alpha=True)
+        self.assertEqual(len(a), 1)
+        self.assertEqual(a.alpha(), [0.0])
+
+        a = ColorArray.from_ints(Color, 'srgb-linear', data)
+        self.assertEqual(a.space(), 'srgb-linear')
+        self.assertEqual(a.coords(), [[1, 128 / 255, 0], [0, 64 / 255, 1]])
+
+    def test_from_ints_bits(self):
+        """Test creation from integer channels of different bit depths."""
+
+        for space in ('srgb', 'display-p3', 'a98-rgb', 'prophoto-rgb', 'rec2020', 'rec2100-pq', 'rec2100-hlg'):
+            for bits in (10, 16):
+                mx = (1 << bits) - 1
+                data = [0, mx // 3, mx, mx // 7, mx // 2, 1]
+                a = ColorArray.from_ints(Color, space, data, bits)
+                self.assertEqual(a.space(), Color.CS_MAP[space].linear())
+                for i, c in enumerate(a):
+                    self.assertEqual(c, Color(space, [v / mx for v in data[i * 3:i * 3 + 3]]).convert(a.space()))
+
+    def test_to_ints(self):
+        """Test encoding to integer channels."""
+
+        data = [255, 128, 0, 0, 64, 255, 1, 254, 3]
+        for space in ('srgb', 'display-p3', 'a98-rgb', 'prophoto-rgb', 'rec2020', 'rec2100-pq', 'rec2100-hlg'):
+            for bits in (8, 10, 16):
+                a = ColorArray.from_ints(Color, space, data, bits)
+                self.assertEqual(a.to_ints(space, bits), data)
+                self.assertEqual(a.to_ints(space, bits, linear=False), data)
+
+        # Channels are clamped and undefined values are treated as zero.
+        coords = [[1.0, 0.0, 0.31], [0.61, 0.47, 0.93], [0.21, 1.2, -0.1], [math.nan, 0.71, 0.2]]
+        colors = [Color('srgb', c) for c in coords]
+        expected = [
+            (255 if v >= 1.0 else int(v * 255 + 0.5)) if v > 0.0 else 0
+            for c in colors for v in c.coords()
+        ]
+        a = ColorArray.from_colors(Color, colors).convert('oklch')
+        self.assertEqual(a.to_ints('srgb'), expected)
+        self.assertEqual(a.to_ints('srgb', linear=False), expected)
+
+        a = ColorArray.from_colors(Color, [Color('srgb', [1, 0, 0], 0.5), 'blue'])
+        self.assertEqual(a.to_ints('srgb', alpha=True), [255, 0, 0, 128, 0, 0, 255, 255])
+        self.assertEqual(a.to_ints('srgb', 16, alpha=True), [65535, 0, 0, 32768, 0, 0, 65535, 65535])
+
+    def test_to_ints_kernels(self):
+        """Test that encoding with and without NumPy gives the same results."""
+
+        from coloraide import kernels
+
+        data = [(i * 37) % 65536 for i in range(3 * kernels.MIN_BATCH)]
+        a = ColorArray.from_ints(Color, 'srgb', data, 16)
+        try:
+            kernels.USE_NUMPY = False
+            expected = a.to_ints('srgb', 16)
+        finally:
+            kernels.USE_NUMPY = True
+        self.assertEqual(expected, data)
+        self.assertEqual(a.to_ints('srgb', 16), expected)
+
+    def test_to_ints_bad(self):
+        """Test bad integer output."""
+
+        a = ColorArray.from_colors(Color, ['red'])
+        with self.assertRaises(ValueError):
+            a.to_ints('srgb', 17)
+        with self.assertRaises(ValueError):
+            a.to_ints('hsl')
+        with self.assertRaises(ValueError):
+            a.to_ints('bad')
+
+    def test_from_ints_bad(self):
+        """Test bad integer input."""
+
+        with self.assertRaises(ValueError):
+            ColorArray.from_ints(Color, 'srgb', [255, 255])
+        with self.assertRaises(ValueError):
+            ColorArray.from_ints(Color, 'srgb', [255, 256, 0])
+        with self.assertRaises(ValueError):
+            ColorArray.from_ints(Color, 'srgb', [255, 255, 0], 17)
+        with self.assertRaises(ValueError):
+            ColorArray.from_ints(Color, 'hsl', [255, 255, 0])
+        with self.assertRaises(ValueError):
+            ColorArray.from_ints(Color, 'bad', [255, 255, 0])
+
+    def test_indexing(self):
+        """Test indexing."""
+
+        a = ColorArray(Color, 'srgb', self.COLORS)
+        self.assertColorEqual(a[-1], Color('srgb', self.COLORS[-1]))
+        a[0] = 'green'
+        self.assertColorEqual(a[0], Color('green'))
+        a[-1] = Color('oklch', [0.5, 0.1, 30])
+        self.assertColorEqual(a[3], Color('oklch', [0.5, 0.1, 30]).convert('srgb'))
+        self.assertEqual(a[1:3].coords(), self.COLORS[1:3])
+        self.assertEqual(len(list(a)), 4)
+
+        with self.assertRaises(IndexError):
+            a[4]
+
+        with self.assertRaises(IndexError):
+            a[4] = 'red'
+
+    def test_append(self):
+        """Test appending colors."""
+
+        a = ColorArray(Color, 'srgb')
+        a.append('red')
+        a.append(Color('oklab', [0.5, 0.1, -0.1]))
+        self.assertEqual(len(a), 2)
+        self.assertColorEqual(a[1], Color('oklab', [0.5, 0.1, -0.1]).convert('srgb'))
+
+    def test_convert(self):
+        """Test that batch conversion matches individual conversion."""
+
+        a = ColorArray(Color, 'srgb', self.COLORS, [1.0, 0.5, 0.25, 0.0])
+        for space in ('oklch', 'prophoto-rgb', 'lab', 'xyz-d50', 'jzczhz', 'hwb', 'srgb'):
+            b = a.convert(space)
+            self.assertEqual(b.space(), space)
+            for c1, c2 in zip(a, b):
+                self.assertColorEqual(c1.convert(space), c2)
+
+    def test_convert_in_place(self):
+        """Test in place conversion."""
+
+        a = ColorArray(Color, 'srgb', self.COLORS)
+        b = a.convert('oklab', in_place=True)
+        self.assertIs(a, b)
+        self.assertEqual(a.space(), 'oklab')
+        self.assertIs(a.convert('oklab', in_place=True), a)
+
+    def test_convert_achromatic(self):
+        """Test achromatic normalization during conversion."""
+
+        a = ColorArray(Color, 'srgb', [[0.5, 0.5, 0.5]])
+        self.assertTrue(math.isnan(a.convert('oklch')[0]['hue']))
+        self.assertFalse(math.isnan(a.convert('oklch', norm=False)[0]['hue']))
+
+    def test_convert_nans(self):
+        """Test that undefined values are resolved during conversion."""
+
+        a = ColorArray(Color, 'srgb', [[math.nan, 0.5, 0.5]])
+        self.assertColorEqual(a.convert('oklab')[0], Color('srgb', [math.nan, 0.5, 0.5]).convert('oklab'))
+        self.assertEqual(a.coords(nans=False), [[0.0, 0.5, 0.5]])
+
+    def test_fit_and_clip(self):
+        """Test gamut mapping."""
+
+        a = ColorArray(Color, 'display-p3', [[1, 0, 0], [0, 1.1, 0], [0.5, 0.5, 0.5]])
+        self.assertEqual(a.in_gamut('srgb'), [False, False, True])
+        fitted = a.clone().fit('srgb', method='minde-chroma')
+        clipped = a.clone().clip('srgb')
+        for c, f, cl in zip(a, fitted, clipped):
+            self.assertColorEqual(c.clone().fit('srgb', method='minde-chroma'), f)
+            self.assertColorEqual(c.clone().clip('srgb'), cl)
+        self.assertEqual(fitted.in_gamut('srgb'), [True, True, True])
+
+    def test_delta_e(self):
+        """Test distancing."""
+
+        a = ColorArray(Color, 'srgb', self.COLORS)
+        b = a.convert('oklab')
+        results = a.delta_e('red', method='2000')
+        for c, de in zip(a, results):
+            self.assertCompare(c.delta_e('red', method='2000'), de)
+        for de in a.delta_e(b):
+            self.assertCompare(de, 0.0)
+        self.assertEqual(a.delta_e(['red'] * 4)[0], 0.0)
+
+        with self.assertRaises(ValueError):
+            a.delta_e(['red'])
+
+        with self.assertRaises(ValueError):
+            a.delta_e('red', method='bad')
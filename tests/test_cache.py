@@ -0,0 +1,210 @@
+"""Test persistent table cache."""
+import os
+import tempfile
+import unittest
+from array import array
+from coloraide import cache
+from coloraide import cmfs
+from coloraide.everything import ColorAll as Color
+from coloraide.temperature.robertson_1968 import Robertson1968
+from coloraide.temperature.ohno_2013 import Ohno2013
+from . import util
+
+
+class TestCache(util.ColorAsserts, unittest.TestCase):
+    """Test the persistent table cache."""
+
+    def setUp(self):
+        """Setup."""
+
+        self.previous = cache.directory()
+        self.tmp = tempfile.TemporaryDirectory()
+        cache.enable(self.tmp.name)
+        self.builds = 0
+
+    def tearDown(self):
+        """Tear down."""
+
+        if self.previous is None:
+            cache.disable()
+        else:
+            cache.enable(self.previous)
+        self.tmp.cleanup()
+
+    def build(self):
+        """Build a table."""
+
+        self.builds += 1
+        return array('d', [1.5, -2.0, 3.25])
+
+    def files(self):
+        """Get the cached files."""
+
+        return sorted(os.listdir(self.tmp.name))
+
+    def test_load(self):
+        """Test that tables are only built once."""
+
+        key = cache.fingerprint('test', 1, [2.0, 3.0])
+        self.assertEqual(cache.load('test', key, self.build).tolist(), [1.5, -2.0, 3.25])
+        self.assertEqual(cache.load('test', key, self.build).tolist(), [1.5, -2.0, 3.25])
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(len(self.files()), 1)
+
+        # Different parameters are stored separately
+        key2 = cache.fingerprint('test', 1, [2.0, 3.5])
+        self.assertNotEqual(key, key2)
+        cache.load('test', key2, self.build)
+        self.assertEqual(self.builds, 2)
+        self.assertEqual(len(self.files()), 2)
+
+        cache.clear()
+        self.assertEqual(self.files(), [])
+
+    def test_disabled(self):
+        """Test that nothing is stored when the cache is disabled."""
+
+        cache.disable()
+        key = cache.fingerprint('test')
+        cache.load('test', key, self.build)
+        cache.load('test', key, self.build)
+        self.assertEqual(self.builds, 2)
+        self.assertIsNone(cache.path('test', key))
+        self.assertEqual(self.files(), [])
+        cache.clear()
+
+    def test_corrupt(self):
+        """Test that corrupt or mismatched files are rebuilt."""
+
+        key = cache.fingerprint('test')
+        cache.load('test', key, self.build)
+        filename = cache.path('test', key)
+
+        with open(filename, 'rb') as f:
+            data = bytearray(f.read())
+
+        # Flip a bit in the data
+        data[-1] ^= 1
+        with open(filename, 'wb') as f:
+            f.write(data)
+        self.assertEqual(cache.load('test', key, self.build).tolist(), [1.5, -2.0, 3.25])
+        self.assertEqual(self.builds, 2)
+
+        # Truncate the file
+        with open(filename, 'wb') as f:
+            f.write(data[:10])
+        cache.load('test', key, self.build)
+        self.assertEqual(self.builds, 3)
+
+        # A file for a different key
+        self.assertIsNone(cache.read(filename, cache.fingerprint('other')))
+
+    def test_fingerprint(self):
+        """Test fingerprints of parameters."""
+
+        self.assertEqual(cache.fingerprint(cmfs.CIE_1931_2DEG), cache.fingerprint(cmfs.CIE_1931_2DEG))
+        self.assertNotEqual(cache.fingerprint(cmfs.CIE_1931_2DEG, 1), cache.fingerprint(cmfs.CIE_1931_2DEG, 1.5))
+        self.assertEqual(cache.fingerprint({'a': (1, 2)}), cache.fingerprint([('a', [1, 2])]))
+        with self.assertRaises(TypeError):
+            cache.fingerprint(object())
+
+    def test_cct_tables(self):
+        """Test that CCT tables are cached and loaded from the cache."""
+
+        class Custom(Color):
+            CCT = 'robertson-1968'
+
+        for _ in range(2):
+            Custom.register([Robertson1968(), Ohno2013()], overwrite=True)
+            self.assertEqual(Custom('orange').cct(), Color('orange').cct())
+            self.assertEqual(Custom('orange').cct(method='ohno-2013'), Color('orange').cct(method='ohno-2013'))
+            self.assertEqual(len(self.files()), 2)
+
+
+class TestMemoryCache(util.ColorAsserts, unittest.TestCase):
+    """Test in memory caches."""
+
+    def test_lru_cache(self):
+        """Test resizable LRU caches."""
+
+        calls = []
+
+        def func(x):
+            calls.append(x)
+            return x * 2
+
+        cached = cache.LRUCache(func, 2)
+        self.assertEqual([cached(1), cached(2), cached(1), cached(3), cached(2)], [2, 4, 2, 6, 4])
+        self.assertEqual(calls, [1, 2, 3, 2])
+        self.assertEqual(cached.cache_info(), cache.CacheInfo(1, 4, 2, 2, 2))
+
+        cached.resize(None)
+        self.assertEqual(cached.cache_info(), cache.CacheInfo(0, 0, 0, None, 0))
+        cached(1)
+        cached.cache_clear()
+        self.assertEqual(cached.cache_info().misses, 0)
+        self.assertEqual(cached.__name__, 'func')
+
+    def test_named_caches(self):
+        """Test named caches."""
+
+        info = cache.info()
+        self.assertIn('cat', info)
+        self.assertEqual(info['cat'].maxsize, 20)
+        try:
+            cache.resize('cat', 64)
+            self.assertEqual(cache.info()['cat'].maxsize, 64)
+            self.assertColorEqual(Color('red').convert('xyz-d50'), Color('color(xyz-d50 0.43607 0.22249 0.01392)'))
+        finally:
+            cache.resize('cat', 20)
+
+        with self.assertRaises(ValueError):
+            cache.resize('bad', 10)
+
+    def test_color_cache_info(self):
+        """Test cache info of a color class."""
+
+        class Custom(Color):
+            CONVERT_CACHE_SIZE = 2
+
+        info = Custom.cache_info()
+        self.assertEqual(info['converter'].maxsize, 2)
+        self.assertIn('cat', info)
+
+        for space in ('lab', 'oklch', 'hsl'):
+            Custom('red').convert(space)
+        self.assertEqual(Custom.cache_info()['convert_chain'].evictions, 1)
+
+        Custom.set_cache_size(16)
+        self.assertEqual(Custom.CONVERT_CACHE_SIZE, 16)
+        self.assertEqual(Custom.cache_info()['convert_chain'], cache.CacheInfo(0, 0, 0, 16, 0))
+
+        # The parent class is unaffected
+        self.assertEqual(Color.cache_info()['converter'].maxsize, 256)
+
+    def test_precompute(self):
+        """Test precomputing conversions between all color spaces."""
+
+        class Custom(Color):
+            pass
+
+        Custom.precompute()
+        total = len(Custom.CS_MAP) ** 2
+        info = Custom.cache_info()['converter']
+        self.assertEqual(info.currsize, total)
+        self.assertEqual(info.maxsize, total)
+
+        Custom('red').converter('srgb', 'oklab')
+        self.assertEqual(Custom.cache_info()['converter'].hits, 1)
+
+        class Custom2(Color):
+            CONVERT_CACHE_SIZE = None
+
+        from coloraide.spaces.hsv import HSV
+
+        Custom2.deregister('space:hsv')
+        Custom2.register(HSV(), precompute=True)
+        info = Custom2.cache_info()['converter']
+        self.assertEqual(info.currsize, len(Custom2.CS_MAP) ** 2)
+        self.assertIsNone(info.maxsize)
+        self.assertColorEqual(Custom2('red').convert('hsv'), Color('red').convert('hsv'))
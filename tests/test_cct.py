@@ -213,3 +213,23 @@ class TestCCTSpecificCases(util.ColorAsserts, unittest.TestCase):
         assert math.isclose(cct, cct2, rel_tol=0.00001, abs_tol=0.00001)
         assert math.isclose(duv, duv2, rel_tol=0.00001, abs_tol=0.00001)
 
+
+    def test_lazy_tables(self):
+        """Test that CCT tables are not generated until they are needed."""
+
+        from coloraide.temperature.robertson_1968 import Robertson1968
+        from coloraide.temperature.ohno_2013 import Ohno2013
+
+        class Custom(Color):
+            CCT = 'robertson-1968'
+
+        robertson = Robertson1968()
+        ohno = Ohno2013()
+        Custom.register([robertson, ohno], overwrite=True)
+        assert robertson._table is None
+        assert ohno.blackbody.splines is None
+
+        self.assertEqual(Custom('orange').cct(), Color('orange').cct())
+        assert robertson._table is not None
+        self.assertEqual(Custom('orange').cct(method='ohno-2013'), Color('orange').cct(method='ohno-2013'))
+        assert ohno.blackbody.splines is not None
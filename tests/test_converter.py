@@ -0,0 +1,266 @@
+"""Test compiled conversion pipelines."""
+import unittest
+from coloraide import Color
+from coloraide.everything import ColorAll
+from coloraide.cat import CAT02, VonKries
+from coloraide.spaces.srgb_linear import sRGBLinear
+from coloraide import convert
+from . import util
+
+
+class TestConverter(util.ColorAsserts, unittest.TestCase):
+    """Test compiled converters."""
+
+    def test_matches_convert(self):
+        """Test that compiled conversions match regular conversions."""
+
+        coords = [0.2, 0.5, 0.8]
+        for src, dst in (
+            ('srgb', 'prophoto-rgb'),
+            ('prophoto-rgb-linear', 'srgb-linear'),
+            ('display-p3', 'lab'),
+            ('oklch', 'hsl'),
+            ('xyz-d50', 'xyz-d65'),
+            ('rec2020', 'jzczhz')
+        ):
+            c1 = Color(src, coords).convert(dst)
+            c2 = Color(dst, Color.converter(src, dst)(coords))
+            self.assertColorEqual(c1, c2)
+
+    def test_fused_linear_steps(self):
+        """Test that linear steps are collapsed into a single matrix."""
+
+        # sRGB Linear -> XYZ D65 -> XYZ D50 (Bradford) -> ProPhoto Linear
+        converter = Color.converter('srgb-linear', 'prophoto-rgb-linear')
+        self.assertEqual(len(converter.steps), 1)
+        self.assertIsInstance(converter.steps[0], list)
+
+        # Transfer functions remain separate steps
+        self.assertEqual(len(Color.converter('srgb', 'prophoto-rgb').steps), 3)
+
+    def test_same_space(self):
+        """Test that converting to the same space is a no-op."""
+
+        converter = Color.converter('srgb', 'srgb')
+        self.assertEqual(converter.steps, [])
+        self.assertEqual(converter([0.1, 0.2, 0.3]), [0.1, 0.2, 0.3])
+
+    def test_many(self):
+        """Test converting many coordinates."""
+
+        converter = Color.converter('srgb', 'oklab')
+        results = converter.many([[1, 0, 0], [0, 1, 0]])
+        self.assertColorEqual(Color('oklab', results[0]), Color('red').convert('oklab'))
+        self.assertColorEqual(Color('oklab', results[1]), Color('srgb', [0, 1, 0]).convert('oklab'))
+
+    def test_input_not_modified(self):
+        """Test that input coordinates are not modified."""
+
+        coords = [0.5, 0.2, 0.1]
+        ColorAll.converter('srgb', 'cmyk')(coords)
+        self.assertEqual(coords, [0.5, 0.2, 0.1])
+
+    def test_cached(self):
+        """Test that converters are cached."""
+
+        self.assertIs(Color.converter('srgb', 'lab'), Color.converter('srgb', 'lab'))
+
+    def test_bad_space(self):
+        """Test bad spaces."""
+
+        with self.assertRaises(ValueError):
+            Color.converter('bad', 'srgb')
+
+        with self.assertRaises(ValueError):
+            Color.converter('srgb', 'bad')
+
+    def test_cat_change(self):
+        """Test that a different CAT is respected."""
+
+        class Custom(Color):
+            CHROMATIC_ADAPTATION = 'cat02'
+
+        Custom.register(CAT02())
+        coords = [0.2, 0.5, 0.8]
+        self.assertColorEqual(
+            Custom('srgb', coords).convert('xyz-d50'),
+            Custom('xyz-d50', Custom.converter('srgb', 'xyz-d50')(coords))
+        )
+        self.assertNotEqual(
+            Custom.converter('srgb', 'xyz-d50')(coords),
+            Color.converter('srgb', 'xyz-d50')(coords)
+        )
+
+    def test_non_linear_cat(self):
+        """Test a CAT that cannot be expressed as a matrix."""
+
+        class Scaled(VonKries):
+            NAME = 'scaled'
+
+            def adapt(self, w1, w2, xyz):
+                return [c * 2 for c in super().adapt(w1, w2, xyz)]
+
+        class Custom(Color):
+            CHROMATIC_ADAPTATION = 'scaled'
+
+        Custom.register(Scaled())
+        coords = [0.2, 0.5, 0.8]
+        self.assertEqual(
+            Custom.converter('xyz-d65', 'xyz-d50')(coords),
+            Custom('xyz-d65', coords).convert('xyz-d50')[:-1]
+        )
+
+    def test_overridden_linear_space(self):
+        """Test that a linear space whose conversion methods are overridden does not use its matrices."""
+
+        class Scaled(sRGBLinear):
+            NAME = 'scaled-linear'
+            SERIALIZE = ('--scaled-linear',)
+
+            def to_base(self, coords):
+                return super().to_base([c * 2 for c in coords])
+
+            def from_base(self, coords):
+                return [c / 2 for c in super().from_base(coords)]
+
+        class Custom(Color):
+            pass
+
+        Custom.register(Scaled())
+        coords = [0.2, 0.5, 0.8]
+        xyz = Custom('scaled-linear', coords).convert('xyz-d65')[:-1]
+        self.assertEqual(Custom.converter('scaled-linear', 'xyz-d65')(coords), xyz)
+        self.assertColorEqual(
+            Custom('scaled-linear', Custom.converter('xyz-d65', 'scaled-linear')(xyz)),
+            Custom('scaled-linear', coords)
+        )
+
+        # Overriding only the matrix must also be respected
+        class Matrix(sRGBLinear):
+            NAME = 'matrix-linear'
+            SERIALIZE = ('--matrix-linear',)
+            TO_XYZ = [[2 * c for c in row] for row in sRGBLinear.TO_XYZ]
+
+        Custom.register(Matrix())
+        self.assertEqual(
+            Custom.converter('matrix-linear', 'xyz-d65')(coords),
+            Custom('matrix-linear', coords).convert('xyz-d65')[:-1]
+        )
+
+    def test_register_clears_cache(self):
+        """Test that registering plugins clears compiled converters."""
+
+        class Custom(Color):
+            pass
+
+        c1 = Custom.converter('srgb', 'lab')
+        Custom.register(CAT02())
+        self.assertIsNot(c1, Custom.converter('srgb', 'lab'))
+
+
+class TestRoutingTable(util.ColorAsserts, unittest.TestCase):
+    """Test precomputed routing tables."""
+
+    def names(self, chain):
+        """Get the names of the spaces in a chain."""
+
+        return [(a.NAME, b.NAME, direction, adapt) for a, b, direction, adapt in chain]
+
+    def test_routes(self):
+        """Test that routes match the dynamically calculated chains."""
+
+        class Custom(ColorAll):
+            ROUTING_TABLE = True
+
+        routes = Custom._ROUTES
+        self.assertEqual(len(routes), len(Custom.CS_MAP) ** 2)
+        self.assertIsNone(ColorAll._ROUTES)
+        for cs in Custom.CS_MAP.values():
+            for target in Custom.CS_MAP:
+                self.assertEqual(
+                    self.names(routes.chain(cs, target)),
+                    self.names(convert.get_convert_chain(ColorAll, ColorAll.CS_MAP[cs.NAME], target))
+                )
+
+        self.assertColorEqual(Custom('red').convert('hwb'), ColorAll('red').convert('hwb'))
+        self.assertIsNone(routes.chain(Custom.CS_MAP['srgb'], 'bad'))
+        with self.assertRaises(ValueError):
+            Custom('red').convert('bad')
+
+    def test_update(self):
+        """Test that routes are updated on registration."""
+
+        from coloraide.spaces.hsv import HSV
+
+        class Custom(Color):
+            ROUTING_TABLE = True
+
+        routes = Custom._ROUTES
+        Custom.deregister('space:hsv')
+        # HWB is based on HSV, so it has no routes either.
+        total = len(Custom.CS_MAP)
+        self.assertEqual(len(routes), (total - 1) ** 2)
+        self.assertIsNone(routes.chain(Custom.CS_MAP['srgb'], 'hsv'))
+        self.assertIsNone(routes.chain(Custom.CS_MAP['srgb'], 'hwb'))
+
+        Custom.register(HSV())
+        self.assertEqual(len(routes), (total + 1) ** 2)
+        self.assertEqual(
+            self.names(routes.chain(Custom.CS_MAP['hsv'], 'lab')),
+            self.names(convert.get_convert_chain(Color, Color.CS_MAP['hsv'], 'lab'))
+        )
+
+        # Spaces that cannot resolve to XYZ D65 have no routes.
+        Custom.deregister('space:srgb')
+        self.assertIsNone(routes.chain(Custom.CS_MAP['hsl'], 'lab'))
+        with self.assertRaises(KeyError):
+            Custom('hsl', [0, 0, 0]).convert('lab')
+
+    def test_frozen(self):
+        """Test frozen classes."""
+
+        Frozen = ColorAll.freeze()
+        self.assertEqual(Frozen.__name__, 'ColorAll')
+        self.assertTrue(issubclass(Frozen, ColorAll))
+        info = Frozen.cache_info()['converter']
+        self.assertEqual(info.currsize, len(Frozen.CS_MAP) ** 2)
+
+        for space in ('srgb', 'oklch', 'cam16-jmh', 'xyz-d50'):
+            self.assertColorEqual(Frozen('red').convert(space), ColorAll('red').convert(space))
+        self.assertEqual(Frozen.converter('srgb', 'lab')([1, 0, 0]), ColorAll.converter('srgb', 'lab')([1, 0, 0]))
+
+        # Results that were not precomputed are calculated but not stored
+        Frozen.CHROMATIC_ADAPTATION = 'cat02'
+        self.assertEqual(Frozen.converter('srgb', 'lab').steps, Frozen.converter('srgb', 'lab').steps)
+        self.assertIsNot(Frozen.converter('srgb', 'lab'), Frozen.converter('srgb', 'lab'))
+        self.assertEqual(Frozen.cache_info()['converter'], info)
+
+        with self.assertRaises(RuntimeError):
+            Frozen.register(CAT02(), overwrite=True)
+        with self.assertRaises(RuntimeError):
+            Frozen.deregister('space:srgb')
+        with self.assertRaises(RuntimeError):
+            Frozen.set_cache_size(10)
+
+        # Subclasses of frozen classes are not frozen
+        class Custom(Frozen):
+            pass
+
+        Custom.deregister('space:hsv')
+        self.assertIn('hsv', Frozen.CS_MAP)
+
+    def test_frozen_threads(self):
+        """Test sharing a frozen class across threads."""
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        Frozen = Color.freeze()
+        spaces = list(Frozen.CS_MAP)
+
+        def work(i):
+            color = Frozen('srgb', [i / 100, 0.5, 0.25])
+            return [color.convert(space)[:] for space in spaces]
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(work, range(100)))
+        self.assertEqual(results, [work(i) for i in range(100)])
@@ -970,6 +970,15 @@ class TestClosest(util.ColorAsserts, unittest.TestCase):
             Color('green')
         )
 
+    def test_bounded_methods(self):
+        """Test that methods using a spatial index find the same color as comparing every color."""
+
+        colors = ['pink', 'green', 'blue', 'orange', 'purple', 'maroon', 'aqua', 'gold', 'navy', 'olive']
+        for method in ('76', '94', 'cmc', 'hyab', 'ok', 'itp', 'jz', '99o', 'cam16'):
+            for color in ('red', 'teal', 'white', 'rebeccapurple'):
+                expected = min(colors, key=lambda c, m=method, s=color: Color(s).delta_e(c, method=m))
+                self.assertColorEqual(Color(color).closest(colors, method=method), Color(expected))
+
     def test_bad_method(self):
         """Test bad method."""
 
@@ -1,5 +1,6 @@
 """Test filter method."""
 from coloraide import Color
+from coloraide.batch import ColorArray
 from . import util
 import pytest
 import unittest
@@ -93,3 +94,81 @@ class TestFilterMisc(util.ColorAsserts, unittest.TestCase):
 
         with self.assertRaises(ValueError):
             Color('red').filter('bad')
+
+
+class TestFilterChain(util.ColorAsserts, unittest.TestCase):
+    """Test compiled filter chains."""
+
+    REQUESTS = [
+        ('sepia', 0.5),
+        ('brightness', 1.2),
+        ('contrast', 0.8, {}),
+        'invert',
+        ('opacity', 0.5),
+        ('hue-rotate', 40),
+        ('protan', 0.45),
+        ('deutan', 1, {'method': 'machado'}),
+        ('tritan', 0.6),
+        ('saturate', 1.5, {'space': 'srgb'}),
+        ('grayscale', 0.2, {'space': 'srgb'})
+    ]
+
+    COLORS = ['red', 'rgb(0 128 255 / 0.5)', 'color(srgb 0.2 none 0.8 / none)', 'oklch(0.7 0.2 150)']
+
+    @staticmethod
+    def sequential(color, requests):
+        """Apply filters one at a time."""
+
+        for request in requests:
+            if isinstance(request, str):
+                request = (request,)
+            kwargs = dict(request[2]) if len(request) > 2 else {}
+            color = color.filter(request[0], *request[1:2], **kwargs)
+        return color
+
+    def test_chain(self):
+        """Test that a chain matches applying the filters one at a time."""
+
+        chain = Color.filter_chain(self.REQUESTS)
+        # Affine filters are combined, Brettel filtering and space changes are separate steps.
+        self.assertEqual(len(chain.steps), 3)
+        for c in self.COLORS:
+            color = Color(c)
+            result = chain(color)
+            self.assertIsNot(result, color)
+            self.assertColorEqual(result, self.sequential(color, self.REQUESTS))
+
+    def test_in_place(self):
+        """Test filtering in place and output spaces."""
+
+        chain = Color.filter_chain([('sepia', 1), ('contrast', 1.5)])
+        color = Color('orange')
+        result = chain(color, out_space='srgb', in_place=True)
+        self.assertIs(result, color)
+        self.assertColorEqual(result, Color('orange').filter('sepia').filter('contrast', 1.5, out_space='srgb'))
+
+    def test_many(self):
+        """Test filtering a color array."""
+
+        chain = Color.filter_chain(self.REQUESTS)
+        colors = ColorArray.from_colors(Color, self.COLORS, 'display-p3')
+        result = chain.many(colors, out_space='oklab')
+        self.assertIs(result, colors)
+        self.assertEqual(colors.space(), 'oklab')
+        for c1, c2 in zip(colors, self.COLORS):
+            self.assertColorEqual(c1, self.sequential(Color(c2).convert('display-p3'), self.REQUESTS).convert('oklab'))
+
+    def test_empty(self):
+        """Test an empty chain."""
+
+        self.assertColorEqual(Color.filter_chain([])(Color('red')), Color('red'))
+
+    def test_bad(self):
+        """Test bad requests."""
+
+        with self.assertRaises(ValueError):
+            Color.filter_chain(['bad'])
+        with self.assertRaises(ValueError):
+            Color.filter_chain([('protan', 1, {'space': 'srgb'})])
+        with self.assertRaises(ValueError):
+            Color.filter_chain([('protan', 1, {'method': 'bad'})])
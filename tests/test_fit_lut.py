@@ -0,0 +1,132 @@
+"""Test baked gamut mapping LUTs."""
+import math
+import random
+import unittest
+from array import array
+from coloraide import Color
+from coloraide.gamut.lut import FitLUT
+from . import util
+
+
+class TestFitLUT(util.ColorAsserts, unittest.TestCase):
+    """Test baked gamut mapping LUTs."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Setup."""
+
+        cls.lut = Color.bake_fit_lut('display-p3', 'srgb', method='minde-chroma', size=9)
+
+    def test_grid(self):
+        """Test that grid points match the baked method exactly."""
+
+        for coords in ([1, 0, 0], [0.25, 0.5, 1], [0, 0.875, 0.125], [1, 1, 1], [0, 0, 0]):
+            color = Color('display-p3', coords)
+            expected = color.clone().fit('srgb', method='minde-chroma')
+            for interpolation in ('trilinear', 'tetrahedral'):
+                self.assertColorEqual(
+                    color.clone().fit('srgb', method='lut', lut=self.lut, interpolation=interpolation),
+                    expected
+                )
+
+    def test_in_gamut(self):
+        """Test that results are in gamut and close to the baked method."""
+
+        random.seed(3)
+        for _ in range(50):
+            color = Color('display-p3', [random.random() for _ in range(3)], random.random())
+            expected = color.clone().fit('srgb', method='minde-chroma')
+            for interpolation in ('trilinear', 'tetrahedral'):
+                result = color.clone().fit('srgb', method='lut', lut=self.lut, interpolation=interpolation)
+                self.assertEqual(result.space(), 'display-p3')
+                self.assertTrue(result.in_gamut('srgb'))
+                self.assertEqual(result.alpha(), color.alpha())
+                self.assertLess(result.delta_e(expected, method='2000'), 6)
+
+    def test_interpolation(self):
+        """Test that both interpolation methods are exact on linear tables."""
+
+        table = FitLUT('srgb', 'srgb', 3, [[0, 1]] * 3, Color.bake_fit_lut('srgb', 'srgb', size=3).table)
+        random.seed(5)
+        for _ in range(20):
+            coords = [random.random() for _ in range(3)]
+            for interpolation in ('trilinear', 'tetrahedral'):
+                for a, b in zip(table.apply(coords, interpolation), coords):
+                    self.assertCompare(a, b)
+
+        self.assertEqual(table.apply([-1, 2, math.nan]), [0.0, 1.0, 0.0])
+
+        with self.assertRaises(ValueError):
+            table.apply([0.5, 0.5, 0.5], 'bad')
+
+    def test_cube(self):
+        """Test round tripping through the `.cube` format."""
+
+        text = self.lut.to_cube()
+        self.assertIn('LUT_3D_SIZE 9', text)
+        self.assertEqual(FitLUT.from_cube(text), self.lut)
+
+        # Generic `.cube` files without source and target information.
+        lines = [line for line in text.splitlines() if not line.startswith('#')]
+        with self.assertRaises(ValueError):
+            FitLUT.from_cube('\n'.join(lines))
+        self.assertEqual(FitLUT.from_cube('\n'.join(lines), 'display-p3', 'srgb'), self.lut)
+
+        with self.assertRaises(ValueError):
+            FitLUT.from_cube('LUT_1D_SIZE 2\n0 0 0\n1 1 1\n', 'srgb', 'srgb')
+
+    def test_bytes(self):
+        """Test round tripping through the binary format."""
+
+        self.assertEqual(FitLUT.from_bytes(self.lut.to_bytes()), self.lut)
+
+        with self.assertRaises(ValueError):
+            FitLUT.from_bytes(b'bad')
+
+        with self.assertRaises(ValueError):
+            FitLUT.from_bytes(b'X' + self.lut.to_bytes()[1:])
+
+        with self.assertRaises(ValueError):
+            FitLUT.from_bytes(self.lut.to_bytes()[:-8])
+
+    def test_bytes_long_names(self):
+        """Test round tripping names that do not fit in a single byte length."""
+
+        lut = FitLUT('a' * 300, 'b' * 257, 2, [[0, 1]] * 3, array('d', [0.0] * 24))
+        restored = FitLUT.from_bytes(lut.to_bytes())
+        self.assertEqual(restored.source, 'a' * 300)
+        self.assertEqual(restored.target, 'b' * 257)
+        self.assertEqual(restored, lut)
+
+        with self.assertRaises(ValueError):
+            FitLUT('a' * 0x10000, 'srgb', 2, [[0, 1]] * 3, array('d', [0.0] * 24)).to_bytes()
+
+    def test_fit_errors(self):
+        """Test fit errors."""
+
+        with self.assertRaises(ValueError):
+            Color('display-p3', [1, 0, 0]).fit('srgb', method='lut')
+
+        with self.assertRaises(ValueError):
+            Color('display-p3', [1, 0, 0]).fit('rec2020', method='lut', lut=self.lut)
+
+    def test_gamut_space(self):
+        """Test that LUTs are stored in the gamut checking space."""
+
+        lut = Color.bake_fit_lut('srgb', 'hsl', size=2)
+        self.assertEqual(lut.target, 'srgb')
+
+        with self.assertRaises(ValueError):
+            Color.bake_fit_lut('srgb', 'hsl', size=1)
+
+        with self.assertRaises(ValueError):
+            Color.bake_fit_lut('oklch', 'srgb')
+
+        with self.assertRaises(ValueError):
+            Color.bake_fit_lut('bad', 'srgb')
+
+        with self.assertRaises(ValueError):
+            Color.bake_fit_lut('srgb', 'bad')
+
+        with self.assertRaises(ValueError):
+            Color.bake_fit_lut('srgb', 'oklch')
@@ -1,10 +1,12 @@
 """Test gamut mapping fitting."""
 import unittest
 import math
+from unittest import mock
 from coloraide.everything import ColorAll as Color
 from coloraide import gamut
 from coloraide.gamut.fit_raytrace import raytrace_box
 from coloraide.gamut.fit_oklch_cubic import get_hue_data
+from coloraide.gamut.fit_minde_chroma import chroma_table
 from . import util
 
 
@@ -203,6 +205,70 @@ class TestGamut(util.ColorAsserts, unittest.TestCase):
             Color('color(display-p3 0.99673 0.99892 0.33034)')
         )
 
+    def test_minde_chroma_table(self):
+        """Test that seeding the search with the chroma table gives the same results within the JND."""
+
+        colors = [
+            Color('display-p3', [r, g, b])
+            for r in (0, 0.3, 0.6, 1) for g in (0, 0.5, 1) for b in (0, 0.4, 1)
+        ]
+        options = [
+            {'method': 'minde-chroma'},
+            {'method': 'minde-chroma', 'jnd': 0},
+            {'method': 'minde-chroma', 'pspace': 'oklab'},
+            {'method': 'lch-chroma'},
+            {'method': 'minde-chroma', 'chroma_table': (16, 36)}
+        ]
+
+        for opts in options:
+            plugin = Color.FIT_MAP[opts['method']]
+            jnd = opts.get('jnd', plugin.JND)
+            expected = [c.clone().fit('srgb', **opts) for c in colors]
+            results = [c.clone().fit('srgb', **{'chroma_table': True, **opts}) for c in colors]
+            for c1, c2 in zip(results, expected):
+                self.assertTrue(c1.in_gamut('srgb'))
+                self.assertLess(c1.delta_e(c2, **plugin.DE_OPTIONS), jnd or 0.001)
+
+    def test_minde_chroma_table_iterations(self):
+        """Test that seeding the search with the chroma table reduces iterations."""
+
+        colors = [Color('display-p3', [r, g, b]) for r in (0, 0.5, 1) for g in (0, 0.5, 1) for b in (0, 0.5, 1)]
+        for opts in ({'method': 'minde-chroma'}, {'method': 'lch-chroma'}):
+            counts = []
+            for enabled in (False, True):
+                # Build any table entries first, so only the search is counted.
+                [c.clone().fit('srgb', chroma_table=enabled, **opts) for c in colors]
+                with mock.patch.object(Color, 'convert', autospec=True, side_effect=Color.convert) as m:
+                    [c.clone().fit('srgb', chroma_table=enabled, **opts) for c in colors]
+                counts.append(m.call_count)
+            self.assertLess(counts[1], counts[0] * 0.8)
+
+    def test_minde_chroma_table_cache(self):
+        """Test that the chroma table is cached and unhashable options bypass it."""
+
+        # The table is opt-in
+        chroma_table.cache_clear()
+        Color('color(display-p3 1 0 0)').fit('srgb', method='minde-chroma')
+        self.assertEqual(chroma_table.cache_info().misses, 0)
+
+        Color('color(display-p3 1 0 0)').fit('srgb', method='minde-chroma', chroma_table=True)
+        Color('color(display-p3 0 1 0)').fit('srgb', method='minde-chroma', chroma_table=True)
+        info = chroma_table.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+        # Tables of a different size are cached separately.
+        Color('color(display-p3 0 1 0)').fit('srgb', method='minde-chroma', chroma_table=(8, 18))
+        self.assertEqual(chroma_table.cache_info().misses, 2)
+
+        chroma_table.cache_clear()
+        self.assertColorEqual(
+            Color('color(display-p3 1 0 0)').fit(
+                'srgb', method='minde-chroma', de_options={'method': 'ok', 'x': []}, chroma_table=True
+            ),
+            Color('color(display-p3 1 0 0)').fit('srgb', method='minde-chroma')
+        )
+        self.assertEqual(chroma_table.cache_info().misses, 0)
+
     def test_minde_adaptive_lightness_lab(self):
         """Test MINDE adaptive lightness."""
 
@@ -378,6 +444,40 @@ class TestRayTrace(util.ColorAsserts, unittest.TestCase):
             Color('color(display-p3 0.83876 0.81766 0.26577)')
         )
 
+    def test_raytrace_fit_many(self):
+        """Test ray tracing many colors matches fitting each color."""
+
+        raytrace = Color.FIT_MAP['raytrace']
+        colors = [
+            Color('display-p3', [r, g, b])
+            for r in (-0.1, 0.3, 0.6, 1.1) for g in (0, 0.5, 1) for b in (0, 0.4, 1.05)
+        ] + [Color('oklch', [0.7, 0.4, h]) for h in range(0, 360, 30)] + [Color('oklch(0.5 0 none)')]
+        options = [
+            {},
+            {'adaptive': 0.5},
+            {'pspace': 'oklab'},
+            {'pspace': 'lch-d65'},
+            {'pspace': 'lch-d65', 'adaptive': 0.5}
+        ]
+
+        for space in ('srgb', 'display-p3', 'rec2020'):
+            for opts in options:
+                results = raytrace.fit_many(colors, space, **opts)
+                for c, coords in zip(colors, results):
+                    self.assertColorEqual(
+                        Color(space, coords),
+                        c.clone().fit(space, method='raytrace', **opts).convert(space)
+                    )
+
+        self.assertEqual(raytrace.fit_many([], 'srgb'), [])
+
+    def test_raytrace_fit_many_gamut_check(self):
+        """Test ray tracing many colors in a space that checks its gamut in another space."""
+
+        colors = [Color('display-p3', [1, 0, 0]), Color('color(display-p3 0 1 0)')]
+        for c, coords in zip(colors, Color.FIT_MAP['raytrace'].fit_many(colors, 'hsl')):
+            self.assertColorEqual(Color('hsl', coords), c.clone().fit('hsl', method='raytrace').convert('hsl'))
+
     def test_edge_case_raytrace_adaptive_lightness_lch(self):
         """Test edge case ray trace adaptive lightness."""
 
@@ -0,0 +1,142 @@
+"""Test pixel buffer pipelines."""
+import unittest
+from array import array
+from coloraide import Color
+from coloraide.everything import ColorAll
+from coloraide.image import Pipeline
+from . import util
+
+
+def encode(color, alpha=False):
+    """Encode a color as 8 bit channels."""
+
+    return [round(v * 255) for v in (color[:] if alpha else color[:-1])]
+
+
+class TestPipeline(util.ColorAsserts, unittest.TestCase):
+    """Test pixel buffer pipelines."""
+
+    PIXELS = bytes([255, 0, 0, 255, 0, 128, 255, 64, 255, 0, 0, 255, 10, 200, 30, 0])
+
+    def test_passthrough(self):
+        """Test that pixels are unchanged without steps."""
+
+        self.assertEqual(bytes(Pipeline(Color, alpha=True).run(self.PIXELS)), self.PIXELS)
+
+    def test_filter_fit(self):
+        """Test filtering and fitting pixels."""
+
+        out = Pipeline(Color, alpha=True).filter('sepia', 0.5).convert('srgb').fit(method='clip').run(self.PIXELS)
+        expected = []
+        for i in range(0, len(self.PIXELS), 4):
+            p = self.PIXELS[i:i + 4]
+            c = Color('srgb', [v / 255 for v in p[:3]], p[3] / 255)
+            expected.extend(encode(c.filter('sepia', 0.5, out_space='srgb').fit(method='clip'), True))
+        self.assertEqual(list(out), expected)
+
+    def test_composite(self):
+        """Test compositing pixels and dropping alpha."""
+
+        out = Pipeline(Color, alpha=True, out_alpha=False).composite('white').run(self.PIXELS)
+        self.assertEqual(list(out[:3]), [255, 0, 0])
+        self.assertEqual(list(out[3:6]), encode(Color.layer([Color('srgb', [0, 128 / 255, 1], 64 / 255), 'white'])))
+        self.assertEqual(list(out[-3:]), [255, 255, 255])
+
+    def test_composite_modes(self):
+        """Test compositing with other blend modes, operators, and undefined values matches layering."""
+
+        pixels = array('d', [0.2, float('nan'), 0.8, 0.5, 1.0, 0.3, 0.1, float('nan'), 0.4, 0.9, 0.6, 0.0])
+        modes = (('normal', 'source-over'), ('multiply', 'source-over'), (None, 'xor'), ('screen', None))
+        for blend, operator in modes:
+            pipeline = Pipeline(Color, typecode='d', alpha=True).composite(
+                'rgb(0 0 255 / 0.75)', blend=blend, operator=operator
+            )
+            out = pipeline.run(pixels)
+            for i in range(0, len(pixels), 4):
+                expected = Color.layer(
+                    [Color('srgb', pixels[i:i + 3], pixels[i + 3]), 'rgb(0 0 255 / 0.75)'],
+                    blend=blend,
+                    operator=operator
+                )
+                self.assertEqual(list(out[i:i + 4]), expected[:])
+
+        with self.assertRaises(ValueError):
+            Pipeline(ColorAll).composite('white', space='lab').run(bytes(3))
+
+    def test_filters_combined(self):
+        """Test that consecutive filters are compiled into a single chain."""
+
+        pipeline = Pipeline(Color, alpha=True).filter('sepia', 0.5).filter('brightness', 0.8).filter('grayscale', 0.2)
+        self.assertEqual(len(pipeline._steps), 1)
+        out = pipeline.run(self.PIXELS)
+        expected = []
+        for i in range(0, len(self.PIXELS), 4):
+            p = self.PIXELS[i:i + 4]
+            c = Color('srgb', [v / 255 for v in p[:3]], p[3] / 255)
+            c = c.filter('sepia', 0.5).filter('brightness', 0.8).filter('grayscale', 0.2, out_space='srgb')
+            expected.extend(encode(c.clip(), True))
+        self.assertEqual(list(out), expected)
+
+    def test_output_formats(self):
+        """Test converting to other spaces and channel types."""
+
+        out = Pipeline(ColorAll, out_space='oklab', out_typecode='d').run(bytes([255, 0, 0, 0, 0, 255]))
+        self.assertIsInstance(out, array)
+        self.assertEqual(out.typecode, 'd')
+        self.assertColorEqual(ColorAll('oklab', out[:3]), ColorAll('red').convert('oklab'))
+        self.assertColorEqual(ColorAll('oklab', out[3:]), ColorAll('blue').convert('oklab'))
+
+        out = Pipeline(Color, 'srgb', 'd', out_typecode='H').run(array('d', [1.0, 0.5, 0.0]))
+        self.assertEqual(list(out), [65535, 32768, 0])
+
+    def test_destination_buffer(self):
+        """Test writing to a provided buffer."""
+
+        src = array('H', [65535, 0, 0, 0, 0, 65535])
+        dst = bytearray(6)
+        pipeline = Pipeline(Color, 'display-p3', 'H', out_space='srgb', out_typecode='B').convert('srgb').fit()
+        result = pipeline.run(src, dst)
+        self.assertIs(result, dst)
+        self.assertEqual(list(dst[:3]), encode(Color('display-p3', [1, 0, 0]).convert('srgb').fit()))
+        self.assertEqual(list(dst[3:]), encode(Color('display-p3', [0, 0, 1]).convert('srgb').fit()))
+
+        # 16 bit channels given as raw bytes
+        dst2 = bytearray(6)
+        pipeline.clear_cache()
+        pipeline.run(src.tobytes(), dst2)
+        self.assertEqual(dst, dst2)
+
+    def test_cache(self):
+        """Test that processed pixels are remembered."""
+
+        pipeline = Pipeline(Color).convert('oklch')
+        pipeline.run(bytes([255, 0, 0] * 4))
+        self.assertEqual(len(pipeline._cache), 1)
+        pipeline.run(bytes([255, 0, 0, 0, 255, 0]))
+        self.assertEqual(len(pipeline._cache), 2)
+        pipeline.fit()
+        self.assertEqual(len(pipeline._cache), 0)
+
+        pipeline = Pipeline(Color, cache_size=1)
+        pipeline.run(bytes([255, 0, 0]))
+        out = pipeline.run(bytes([255, 0, 0, 0, 255, 0, 0, 0, 255]))
+        self.assertEqual(bytes(out), bytes([255, 0, 0, 0, 255, 0, 0, 0, 255]))
+        self.assertEqual(len(pipeline._cache), 0)
+
+    def test_errors(self):
+        """Test bad inputs."""
+
+        with self.assertRaises(ValueError):
+            Pipeline(Color, typecode='i')
+        with self.assertRaises(ValueError):
+            Pipeline(Color, out_typecode='i')
+        with self.assertRaises(ValueError):
+            Pipeline(Color, 'bad')
+        with self.assertRaises(ValueError):
+            Pipeline(Color, 'lab')
+        with self.assertRaises(ValueError):
+            Pipeline(Color).run(bytes(4))
+        with self.assertRaises(ValueError):
+            Pipeline(Color).run(bytes(3), bytearray(4))
+        with self.assertRaises(ValueError):
+            Pipeline(Color).filter('bad').run(bytes(3))
@@ -1,8 +1,10 @@
 """Test Interpolation."""
 import unittest
 import math
+import itertools
 from coloraide.everything import ColorAll as Color
 from coloraide import NaN, stop, hint, ease_in
+from coloraide.interpolate import spectral
 from . import util
 import pytest
 
@@ -1167,6 +1169,60 @@ class TestInterpolation(util.ColorAsserts, unittest.TestCase):
         colors = Color.steps(['red', 'blue'], space="srgb", max_delta_e=10, max_steps=5)
         self.assertTrue(len(colors) == 5)
 
+    def test_steps_adaptive_max_delta_e(self):
+        """Test steps with a max delta e that only refines the segments that need it."""
+
+        colors = Color.steps(['black', '#111', 'white'], space="srgb-linear", max_delta_e=1, adaptive=True)
+        for c1, c2 in itertools.pairwise(colors):
+            self.assertTrue(c1.delta_e(c2) <= 1)
+        self.assertTrue(len(colors) < len(Color.steps(['black', '#111', 'white'], space="srgb-linear", max_delta_e=1)))
+
+        # Endpoints, the midpoint, and requested steps are kept in place.
+        i = Color.interpolate(['red', 'blue'], space='srgb')
+        colors = Color.steps(['red', 'blue'], space="srgb", steps=3, max_delta_e=3, adaptive=True)
+        self.assertColorEqual(colors[0], Color('red').convert('srgb'))
+        self.assertColorEqual(colors[-1], Color('blue').convert('srgb'))
+        self.assertIn(i(0.5), colors)
+
+    def test_steps_adaptive_max_steps(self):
+        """Test that adaptive steps honor the maximum steps."""
+
+        colors = Color.steps(['red', 'blue'], space="srgb", max_delta_e=1, max_steps=7, adaptive=True)
+        self.assertEqual(len(colors), 7)
+        colors = Color.steps(['red', 'blue'], space="srgb", max_delta_e=10, max_steps=None, adaptive=True)
+        self.assertTrue(len(colors) > 2)
+
+    def test_steps_adaptive_max_steps_balanced(self):
+        """Test that segments with equal delta E are split together when limited by the maximum steps."""
+
+        colors = Color.steps(['black', 'white'], steps=3, max_delta_e=0.1, max_steps=20, adaptive=True)
+        self.assertTrue(len(colors) <= 20)
+        lightness = [c['lightness'] for c in colors]
+        self.assertIn(0.5, lightness)
+        # Segments above a quarter have equal delta E, so they are split evenly.
+        upper = [v for v in lightness if v >= 0.25]
+        for a, b in itertools.pairwise(upper):
+            self.assertCompare(b - a, upper[1] - upper[0])
+
+    def test_steps_adaptive_discontinuity(self):
+        """Test that adaptive steps stop splitting at hard color stops."""
+
+        colors = Color.steps(
+            ['red', stop('red', 0.5), stop('blue', 0.5), 'blue'],
+            space="srgb",
+            max_delta_e=10,
+            max_steps=None,
+            adaptive=True
+        )
+        self.assertTrue(len(colors) > 2)
+
+    def test_discrete_adaptive(self):
+        """Test discrete interpolation with adaptive steps."""
+
+        i = Color.discrete(['red', 'blue'], space='srgb', max_delta_e=10, adaptive=True)
+        self.assertColorEqual(i(0), Color('red'))
+        self.assertColorEqual(i(1), Color('blue'))
+
     def test_too_few_colors_linear(self):
         """Test too few colors during linear interpolation."""
 
@@ -2458,6 +2514,25 @@ class TestInterpolation(util.ColorAsserts, unittest.TestCase):
         with self.assertRaises(ValueError):
             Color.weighted_mix([], method='spectral')
 
+    def test_spectral_mix_many(self):
+        """Test mixing many points matches mixing each point."""
+
+        xyz1 = Color('#002185').convert('xyz-d65').coords()
+        xyz2 = Color('#FCD200').convert('xyz-d65').coords()
+        points = [0, 0.25, 0.5, 1]
+        self.assertEqual(
+            spectral.spectral_mix_many(xyz1, xyz2, points),
+            [spectral.spectral_mix(xyz1, xyz2, t) for t in points]
+        )
+
+    def test_spectral_cached_segments(self):
+        """Test that segments with undefined values interpolate the same way on repeated calls."""
+
+        for method in ('spectral', 'spectral-continuous'):
+            i = Color.interpolate(['rgb(none 200 30 / none)', 'red', 'color(srgb none 0.2 1 / 0.5)'], method=method)
+            first = [i(p / 10) for p in range(11)]
+            self.assertEqual([i(p / 10) for p in range(11)], first)
+
     def test_carryforward_sets(self):
         """Test analogous sets."""
 
@@ -2488,3 +2563,132 @@ class TestInterpolation(util.ColorAsserts, unittest.TestCase):
             carryforward=True
         )(0.5)
         self.assertColorEqual(result, Color('oklab(0.60514 0.1 -1.5)'))
+
+
+class TestSample(util.ColorAsserts, unittest.TestCase):
+    """Test sampling many points of an interpolation."""
+
+    POINTS = [0.9, -0.1, 0, 0.15, 0.3, 0.5, 0.3, 1, 1.2, 0.65]
+
+    def test_sample(self):
+        """Test that sampling matches interpolating each point."""
+
+        colors = ['red', stop('rgb(0 255 0 / 0.5)', 0.3), hint(0.7), 'oklch(0.5 0.2 none)', 'blue']
+        methods = (
+            'linear', 'continuous', 'bspline', 'natural', 'catrom', 'monotone', 'spectral', 'spectral-continuous'
+        )
+        for method in methods:
+            for kwargs in ({}, {'domain': [0, 0.3, 1]}, {'padding': 0.1, 'extrapolate': True}):
+                i = Color.interpolate(colors, space='oklch', out_space='srgb', method=method, **kwargs)
+                results = i.sample(self.POINTS)
+                self.assertEqual(results.space(), 'srgb')
+                self.assertEqual(len(results), len(self.POINTS))
+                for c, p in zip(results, self.POINTS):
+                    self.assertColorEqual(c, i(p))
+
+    def test_sample_coords(self):
+        """Test sampling raw coordinates."""
+
+        i = Color.interpolate(['red', 'blue'], space='srgb', out_space='oklab', progress=ease_in)
+        coords = i.sample_coords([0.5, 0])
+        self.assertEqual(len(coords), 2)
+        self.assertColorEqual(Color('srgb', coords[0][:-1], coords[0][-1]), i(0.5).convert('srgb'))
+        self.assertEqual(coords[1], [1.0, 0.0, 0.0, 1.0])
+
+    def test_sample_discrete(self):
+        """Test sampling a discrete interpolation."""
+
+        i = Color.discrete(['red', 'green', 'blue'], space='srgb')
+        for c, p in zip(i.sample(self.POINTS), self.POINTS):
+            self.assertColorEqual(c, i(p))
+
+    def test_sample_empty(self):
+        """Test sampling no points."""
+
+        self.assertEqual(len(Color.interpolate(['red', 'blue']).sample([])), 0)
+
+
+class TestGradientLUT(util.ColorAsserts, unittest.TestCase):
+    """Test interpolation lookup tables."""
+
+    def test_samples(self):
+        """Test that samples match the interpolation."""
+
+        i = Color.interpolate(['red', 'green', 'blue'], space='oklab')
+        lut = i.to_lut(9)
+        self.assertEqual(len(lut), 9)
+        self.assertEqual(lut.space(), 'oklab')
+        for n, color in enumerate(lut):
+            self.assertColorEqual(color, i(n / 8))
+        self.assertColorEqual(lut[-1], Color('blue').convert('oklab'))
+        with self.assertRaises(IndexError):
+            lut[9]
+
+    def test_lookup(self):
+        """Test linear and nearest lookups."""
+
+        lut = Color.interpolate(['black', 'white'], space='srgb').to_lut(5)
+        self.assertColorEqual(lut(0.5), Color('srgb', [0.5, 0.5, 0.5]))
+        self.assertColorEqual(lut(0.1), Color('srgb', [0.1, 0.1, 0.1]))
+        self.assertColorEqual(lut(0.3, 'nearest'), Color('srgb', [0.25, 0.25, 0.25]))
+        self.assertEqual(lut.coords(0.75), [0.75, 0.75, 0.75, 1.0])
+        self.assertColorEqual(lut(-1), Color('black'))
+        self.assertColorEqual(lut(2), Color('white'))
+        with self.assertRaises(ValueError):
+            lut(0.5, 'cubic')
+
+    def test_hue(self):
+        """Test hues are interpolated the short way between samples."""
+
+        lut = Color.interpolate(['hsl(350 100% 50%)', 'hsl(10 100% 50%)'], space='hsl').to_lut(3)
+        self.assertCompare(lut(0.25)['hue'], 355)
+        self.assertCompare(lut(0.75)['hue'], 5)
+
+    def test_undefined(self):
+        """Test undefined values use the defined neighbor."""
+
+        lut = Color.interpolate(['white', 'red'], space='srgb').to_lut(2, space='hsl')
+        self.assertTrue(lut[0].is_nan('hue'))
+        self.assertCompare(lut(0.5)['hue'], 0)
+
+    def test_domain(self):
+        """Test samples span the domain."""
+
+        i = Color.interpolate(['red', 'blue'], space='srgb', domain=[0, 100])
+        lut = i.to_lut(11)
+        self.assertColorEqual(lut(50), i(50))
+        self.assertColorEqual(lut(30), i(30))
+
+    def test_space_and_fit(self):
+        """Test output space and gamut mapping."""
+
+        i = Color.interpolate(['oklch(0.7 0.4 40)', 'oklch(0.7 0.4 200)'], space='oklch')
+        lut = i.to_lut(5, space='srgb')
+        self.assertFalse(all(c.in_gamut() for c in lut))
+        lut = i.to_lut(5, space='srgb', fit=True)
+        self.assertTrue(all(c.in_gamut() for c in lut))
+        self.assertColorEqual(lut[1], i(0.25).convert('srgb').fit())
+        lut = i.to_lut(5, space='srgb', fit='clip')
+        self.assertColorEqual(lut[1], i(0.25).convert('srgb').clip())
+        lut = i.to_lut(5, space='srgb', fit={'method': 'raytrace', 'pspace': 'oklch'})
+        self.assertColorEqual(lut[1], i(0.25).convert('srgb').fit(method='raytrace', pspace='oklch'))
+
+        with self.assertRaises(ValueError):
+            i.to_lut(5, space='bad')
+        with self.assertRaises(ValueError):
+            i.to_lut(1)
+
+    def test_to_array(self):
+        """Test exporting packed arrays."""
+
+        lut = Color.interpolate(['black', 'rgb(255 255 255 / 0.5)'], space='srgb', premultiplied=False).to_lut(3)
+        self.assertEqual(lut.to_array().tolist(), [0, 0, 0, 255, 128, 128, 128, 191, 255, 255, 255, 128])
+        self.assertEqual(lut.to_array('B', alpha=False).tolist(), [0, 0, 0, 128, 128, 128, 255, 255, 255])
+        self.assertEqual(lut.to_array('f').itemsize, 4)
+        self.assertEqual(lut.to_array('d', alpha=False).tolist(), [0, 0, 0, 0.5, 0.5, 0.5, 1, 1, 1])
+        self.assertEqual(
+            Color.interpolate(['white', 'red'], space='srgb').to_lut(2, space='hsl').to_array('d').tolist(),
+            [0, 0, 1, 1, 0, 1, 0.5, 1]
+        )
+        with self.assertRaises(ValueError):
+            lut.to_array('i')
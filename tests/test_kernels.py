@@ -0,0 +1,127 @@
+"""Test NumPy kernels."""
+import math
+import random
+import subprocess
+import sys
+import unittest
+from coloraide import Color
+from coloraide import kernels
+from coloraide.batch import ColorArray
+from coloraide.spaces.hsl import HSL
+from coloraide.spaces.srgb import sRGB
+from . import util
+
+
+class TestLazyImport(unittest.TestCase):
+    """Test that NumPy is only imported when needed."""
+
+    def test_import_does_not_load_numpy(self):
+        """Test that importing ColorAide does not import NumPy."""
+
+        code = 'import sys, coloraide, coloraide.batch; print("numpy" in sys.modules)'
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
+@unittest.skipUnless(kernels.HAS_NUMPY, 'NumPy is not installed')
+class TestKernels(util.ColorAsserts, unittest.TestCase):
+    """Test NumPy kernels against the pure Python conversions."""
+
+    PAIRS = [
+        ('srgb', 'oklch'),
+        ('srgb', 'lab'),
+        ('display-p3', 'rec2020'),
+        ('oklab', 'ictcp'),
+        ('jzazbz', 'lab-d65'),
+        ('lch', 'srgb'),
+        ('srgb', 'jzczhz'),
+        ('ictcp', 'display-p3'),
+        ('srgb', 'xyz-d50')
+    ]
+
+    def setUp(self):
+        """Setup."""
+
+        random.seed(12)
+
+    def samples(self, space, count=64):
+        """Get in gamut samples for a space by converting from sRGB."""
+
+        return [
+            Color('srgb', [random.random() for _ in range(3)]).convert(space, norm=False)[:-1]
+            for _ in range(count)
+        ]
+
+    def test_many(self):
+        """Test that converters using kernels match the per color path."""
+
+        for src, dst in self.PAIRS:
+            converter = Color.converter(src, dst)
+            self.assertIsNotNone(converter.kernel())
+            coords = self.samples(src)
+            for c1, c2 in zip(converter.many(coords), [converter(c) for c in coords]):
+                for a, b in zip(c1, c2):
+                    self.assertCompare(a, b, 6)
+
+    def test_no_kernel(self):
+        """Test that pipelines with unsupported steps do not get a kernel."""
+
+        self.assertIsNone(Color.converter('srgb', 'hsl').kernel())
+        self.assertIsNone(Color.converter('srgb', 'hwb').kernel())
+
+    def test_subclass_override(self):
+        """Test that a space overriding a kernel's function does not use the kernel."""
+
+        class Custom(sRGB):
+            NAME = '-custom-srgb'
+            SERIALIZE = ('--custom-srgb',)
+
+            def to_base(self, coords):
+                return super().to_base(coords)
+
+        class Custom2(Color):
+            pass
+
+        Custom2.register(Custom())
+        self.assertIsNotNone(Custom2.converter('srgb', 'oklab').kernel())
+        self.assertIsNone(Custom2.converter('-custom-srgb', 'oklab').kernel())
+
+    def test_register(self):
+        """Test registering a custom kernel."""
+
+        class Custom(HSL):
+            NAME = '-custom-hsl'
+            SERIALIZE = ('--custom-hsl',)
+
+        class Custom2(Color):
+            pass
+
+        Custom2.register(Custom())
+        self.assertIsNone(Custom2.converter('hsl', 'srgb').kernel())
+        try:
+            kernels.register(HSL.to_base, lambda space, a: a)
+            Custom2._clear_convert_cache()
+            self.assertIsNotNone(Custom2.converter('hsl', 'srgb').kernel())
+        finally:
+            del kernels.KERNELS[HSL.to_base]
+
+    def test_disabled(self):
+        """Test disabling the NumPy path."""
+
+        try:
+            kernels.USE_NUMPY = False
+            self.assertIsNone(Color.converter('srgb', 'oklab').kernel())
+        finally:
+            kernels.USE_NUMPY = True
+        self.assertIsNotNone(Color.converter('srgb', 'oklab').kernel())
+
+    def test_color_array(self):
+        """Test color array conversion with kernels."""
+
+        coords = self.samples('srgb') + [[0.5, 0.5, 0.5], [math.nan, 0.2, 0.3]]
+        a = ColorArray(Color, 'srgb', coords, [0.5] * len(coords))
+        for space in ('oklch', 'lab', 'display-p3', 'jzazbz'):
+            b = a.convert(space)
+            self.assertEqual(b.space(), space)
+            for c1, c2 in zip(a, b):
+                self.assertColorEqual(c1.convert(space), c2)
@@ -0,0 +1,88 @@
+"""Test palette spatial index."""
+import random
+import unittest
+from coloraide.everything import ColorAll as Color
+from coloraide.palette import Palette
+from . import util
+
+
+class TestPalette(util.ColorAsserts, unittest.TestCase):
+    """Test palettes."""
+
+    METHODS = ('76', 'ok', 'itp', 'jz', 'hyab', '94', 'cmc', '2000', 'cam16', 'cam02', '99o', 'hct')
+
+    def setUp(self):
+        """Setup."""
+
+        random.seed(7)
+        self.colors = [Color('srgb', [random.random() for _ in range(3)]) for _ in range(64)]
+        self.samples = [Color('srgb', [random.random() for _ in range(3)]) for _ in range(8)]
+
+    def brute(self, sample, method):
+        """Get all palette distances sorted by brute force."""
+
+        return sorted((sample.delta_e(c, method=method), i) for i, c in enumerate(self.colors))
+
+    def test_nearest(self):
+        """Test nearest color matches `closest`."""
+
+        for method in self.METHODS:
+            palette = Palette(Color, self.colors, method=method)
+            for sample in self.samples:
+                self.assertColorEqual(palette.nearest(sample), sample.closest(self.colors, method=method))
+
+    def test_k_nearest(self):
+        """Test k nearest colors."""
+
+        for method in self.METHODS:
+            palette = Palette(Color, self.colors, method=method)
+            for sample in self.samples:
+                expected = self.brute(sample, method)[:5]
+                results = palette.query(sample, 5)
+                self.assertEqual([i for i, _ in results], [i for _, i in expected])
+                for (_, d1), (d2, _) in zip(results, expected):
+                    self.assertCompare(d1, d2)
+                self.assertEqual(palette.k_nearest(sample, 5), [self.colors[i] for _, i in expected])
+
+    def test_within_radius(self):
+        """Test colors within a radius."""
+
+        for method in ('76', '2000', 'hyab'):
+            palette = Palette(Color, self.colors, method=method)
+            for sample in self.samples:
+                expected = [i for d, i in self.brute(sample, method) if d <= 20]
+                self.assertEqual([i for i, _ in palette.query(sample, len(palette), 20)], expected)
+                self.assertEqual(len(palette.within_radius(sample, 20)), len(expected))
+
+    def test_options(self):
+        """Test distancing options are passed along."""
+
+        palette = Palette(Color, self.colors, method='76', space='lab')
+        for sample in self.samples:
+            self.assertColorEqual(palette.nearest(sample), sample.closest(self.colors, method='76', space='lab'))
+
+        with self.assertRaises(ValueError):
+            Palette(Color, self.colors, method='76', space='oklab')
+
+    def test_input(self):
+        """Test palette input."""
+
+        palette = Palette(Color, ['red', 'green', 'blue'])
+        self.assertEqual(len(palette), 3)
+        self.assertColorEqual(palette.nearest('orange'), Color('red'))
+        self.assertColorEqual(palette[2], Color('blue'))
+        self.assertEqual(palette.query('orange', 0), [])
+
+    def test_empty(self):
+        """Test empty palettes."""
+
+        palette = Palette(Color, [])
+        self.assertEqual(palette.k_nearest('red', 2), [])
+        with self.assertRaises(ValueError):
+            palette.nearest('red')
+
+    def test_bad_method(self):
+        """Test bad method."""
+
+        with self.assertRaises(ValueError):
+            Palette(Color, self.colors, method='bad')
@@ -0,0 +1,73 @@
+"""Test parallel batch conversion."""
+import random
+import unittest
+from coloraide import Color
+from coloraide.everything import ColorAll
+from coloraide.batch import ColorArray
+from coloraide import parallel
+from . import util
+
+
+class TestParallel(util.ColorAsserts, unittest.TestCase):
+    """Test parallel conversion."""
+
+    def setUp(self):
+        """Setup."""
+
+        random.seed(11)
+        self.colors = [Color('srgb', [random.random() for _ in range(3)]) for _ in range(50)]
+
+    def test_backends(self):
+        """Test that all backends match serial conversion."""
+
+        expected = [c.convert('oklch') for c in self.colors]
+        for backend in parallel.BACKENDS:
+            results = parallel.map_convert(self.colors, 'oklch', workers=2, backend=backend, chunksize=8)
+            self.assertEqual(len(results), len(expected))
+            for c1, c2 in zip(results, expected):
+                self.assertColorEqual(c1, c2)
+
+    def test_color_array(self):
+        """Test converting color arrays."""
+
+        colors = ColorArray.from_colors(ColorAll, self.colors, 'display-p3')
+        results = parallel.map_convert(colors, 'cam16-jmh', workers=2, chunksize=16)
+        self.assertIsInstance(results, ColorArray)
+        self.assertEqual(results.space(), 'cam16-jmh')
+        self.assertEqual(results.coords(), colors.clone().convert('cam16-jmh').coords())
+
+    def test_mixed_spaces(self):
+        """Test colors in different color spaces."""
+
+        colors = [Color('red'), Color('lab', [50, 20, -30]), Color('lab', [30, 0, 0], 0.5), Color('green')]
+        results = parallel.map_convert(colors, 'hsl', workers=2, backend='thread', chunksize=1)
+        for c1, c2 in zip(results, colors):
+            self.assertColorEqual(c1, c2.convert('hsl'))
+        self.assertTrue(results[2].is_nan('hue'))
+        self.assertEqual(results[2].alpha(), 0.5)
+
+        results = parallel.map_convert(colors, 'hsl', workers=1, norm=False)
+        self.assertFalse(results[2].is_nan('hue'))
+
+    def test_fit(self):
+        """Test gamut mapping the results."""
+
+        colors = [Color('oklch', [0.7, 0.4, h]) for h in range(0, 360, 15)]
+        for fit, kwargs in ((True, {}), ('clip', {'method': 'clip'}), ({'method': 'raytrace'}, {'method': 'raytrace'})):
+            results = parallel.map_convert(colors, 'srgb', fit=fit, workers=2, backend='thread', chunksize=4)
+            for c1, c2 in zip(results, colors):
+                self.assertColorEqual(c1, c2.convert('srgb').fit(**kwargs))
+
+    def test_empty(self):
+        """Test no colors."""
+
+        self.assertEqual(parallel.map_convert([], 'srgb'), [])
+        self.assertEqual(len(parallel.map_convert(ColorArray(Color, 'srgb'), 'lab')), 0)
+
+    def test_errors(self):
+        """Test bad inputs."""
+
+        with self.assertRaises(ValueError):
+            parallel.map_convert(self.colors, 'bad')
+        with self.assertRaises(ValueError):
+            parallel.map_convert(self.colors, 'lab', backend='bad')
@@ -118,6 +118,51 @@ class TestCustom(util.ColorAsserts, unittest.TestCase):
         Custom.register(lab_d65.LabD65())
         self.assertEqual(Custom('red').convert('lab-d65').to_string(), expected)
 
+    def test_plugin_registration_space_parsing(self):
+        """Test that space parsing reflects registration and deregistration."""
+
+        from coloraide.spaces.lab.css import Lab
+        from coloraide.spaces import lab_d65
+
+        class Custom(Color):
+            pass
+
+        Custom.deregister(['space:lab', 'space:lab-d65'])
+        with self.assertRaises(ValueError):
+            Custom('lab(50% 20 -30)')
+        with self.assertRaises(ValueError):
+            Custom('color(--lab-d65 50 20 -30)')
+        self.assertColorEqual(Color('lab(50% 20 -30)'), Color('lab', [50, 20, -30]))
+
+        Custom.register([Lab(), lab_d65.LabD65()])
+        self.assertColorEqual(Custom('lab(50% 20 -30)'), Custom('lab', [50, 20, -30]))
+        self.assertColorEqual(Custom('color(--lab-d65 50 20 -30)'), Custom('lab-d65', [50, 20, -30]))
+
+    def test_plugin_registration_space_custom_match(self):
+        """Test that spaces with custom matching are still matched."""
+
+        from coloraide.spaces.hsv import HSV
+
+        class CustomHSV(HSV):
+            NAME = '-hsv'
+            SERIALIZE = ('--hsv-custom',)
+
+            def match(self, string, start=0, fullmatch=True):
+                if string[start:start + 4] == 'hsv(':
+                    end = string.index(')', start)
+                    values = [float(v) for v in string[start + 4:end].split(',')]
+                    if not fullmatch or end + 1 == len(string):
+                        return (values, 1.0), end + 1
+                return None
+
+        class Custom(Color):
+            pass
+
+        Custom.register(CustomHSV())
+        self.assertColorEqual(Custom('hsv(120, 0.5, 0.5)'), Custom('-hsv', [120, 0.5, 0.5]))
+        self.assertColorEqual(Custom('red'), Custom('srgb', [1, 0, 0]))
+        self.assertColorEqual(Custom('color(--hsv-custom 120 0.5 0.5)'), Custom('-hsv', [120, 0.5, 0.5]))
+
     def test_incompatible_spaces(self):
         """
         Test two incompatible spaces.
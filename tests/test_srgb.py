@@ -187,3 +187,50 @@ class TestsAchromatic(util.ColorAsserts, unittest.TestCase):
         self.assertEqual(Color('srgb', [0.3, 0.3, 0.30000001]).is_achromatic(), True)
         self.assertEqual(Color('srgb', [0.3, 0.4, 0.3]).is_achromatic(), False)
         self.assertEqual(Color('srgb', [0.3, 0.3, NaN]).is_achromatic(), False)
+
+
+class TestsHexMany(util.ColorAsserts, unittest.TestCase):
+    """Test bulk hex parsing and serialization."""
+
+    HEX = ['#ff8800', '#FF880080', '#f80', '#F808', '#000000', '#ffffffff']
+
+    def test_from_hex_many(self):
+        """Test parsing many hex colors."""
+
+        for c1, value in zip(Color.from_hex_many(self.HEX), self.HEX):
+            self.assertEqual(c1, Color(value))
+
+    def test_from_hex_many_bad(self):
+        """Test that only hex colors are accepted."""
+
+        for value in ('#ff 88 00', '#ff880', '#gg8800', 'ff8800', '#', ' #fff', '#fff ', 'red'):
+            with self.assertRaises(ValueError):
+                Color.from_hex_many([value])
+
+    def test_to_hex_many(self):
+        """Test serializing many colors matches serializing individual colors."""
+
+        colors = [
+            *Color.from_hex_many(self.HEX),
+            Color('srgb', [0.5, NaN, 1.2], 0.5),
+            Color('srgb', [0.2, 0.4, 0.6], NaN),
+            Color('oklch', [0.7, 0.4, 30])
+        ]
+        options = (
+            {},
+            {'upper': True},
+            {'compress': True},
+            {'alpha': True, 'compress': True},
+            {'alpha': False, 'fit': 'clip'},
+            {'fit': {'method': 'raytrace'}}
+        )
+        for kwargs in options:
+            expected = [c.convert('srgb').to_string(hex=True, **kwargs) for c in colors]
+            self.assertEqual(Color.to_hex_many(colors, **kwargs), expected)
+
+    def test_to_hex_many_unmodified(self):
+        """Test that gamut mapping does not modify the colors."""
+
+        c1 = Color('srgb', [0.5, 0, 1.2])
+        self.assertEqual(Color.to_hex_many([c1]), ['#7852ff'])
+        self.assertEqual(c1[:-1], [0.5, 0, 1.2])
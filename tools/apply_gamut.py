@@ -1,5 +1,5 @@
 """Modify a picture by increasing chroma and applying gamut mapping."""
-from functools import lru_cache
+from array import array
 from PIL import Image
 from PIL import ImageCms
 import time
@@ -15,6 +15,7 @@ try:
     from coloraide_extras.everything import ColorAll as Color
 except ImportError:
     from coloraide.everything import ColorAll as Color
+from coloraide.image import Pipeline
 
 GMAP = {}
 
@@ -48,18 +49,6 @@ def printt(t):
         print(f'{t} nsec')
 
 
-@lru_cache(maxsize=1024 * 1024)
-def apply_gamut_map(amount, p, gamut):
-    """Apply filter."""
-
-    has_alpha = len(p) > 3
-    color = Color(gamut, [x / 255 for x in p[:3]], p[3] / 255 if has_alpha else 1)
-    if amount:
-        color.set('oklch.c', lambda c: c * amount)
-    # Fit the color back into the color gamut and return the results
-    return tuple(round(x * 255) for x in color.convert('srgb').fit(**GMAP)[:4 if has_alpha else -1])
-
-
 def process_image(img, output, amount, gamut):
     """Process the image applying the requested filter."""
 
@@ -69,21 +58,33 @@ def process_image(img, output, amount, gamut):
         if im.format == 'PNG':
             if im.mode not in ('RGBA',):
                 im = im.convert('RGBA')
+        if im.mode not in ('RGB', 'RGBA'):
+            im = im.convert('RGB')
 
-        pixels = im.load()
+        alpha = im.mode == 'RGBA'
         start = time.perf_counter_ns()
-        total = im.size[0] * im.size[1]
-        factor = 100 / total
-        i = j = 0
-        print(f'Pixels: {total}')
-        print('> 0%', end='\r')
-        for i in range(im.size[0]):
-            for j in range(im.size[1]):
-                pixels[i, j] = apply_gamut_map(amount, pixels[i, j], gamut)
-            print(f'> {int((i * j) * factor)}%', end="\r")
-        print('> 100%')
+        print(f'Pixels: {im.size[0] * im.size[1]}')
+
+        # If the chroma is adjusted, decode the pixels to OkLCh first so the chroma can be scaled.
+        # Then gamut map the pixels to sRGB.
+        pixels = im.tobytes()
+        if amount:
+            lch = Pipeline(Color, gamut, alpha=alpha, out_space='oklch', out_typecode='d', out_alpha=True).run(pixels)
+            lch[1::4] = array('d', [c * amount for c in lch[1::4]])
+            pixels = lch
+        out = Pipeline(
+            Color,
+            'oklch' if amount else gamut,
+            'd' if amount else 'B',
+            alpha=bool(amount) or alpha,
+            out_space='srgb',
+            out_typecode='B',
+            out_alpha=alpha
+        ).convert('srgb').fit(**GMAP).run(pixels)
+
         t = time.perf_counter_ns() - start
         printt(t)
+        im = Image.frombytes(im.mode, im.size, out.tobytes())
         im.save(output, icc_profile=ImageCms.ImageCmsProfile(ImageCms.createProfile('sRGB')).tobytes(), quality=100)
 
 
@@ -1,5 +1,5 @@
 """Get the average color of an image."""
-from functools import lru_cache
+from collections import Counter
 from PIL import Image
 import time
 import argparse
@@ -14,6 +14,7 @@ try:
     from coloraide_extras.everything import ColorAll as Color
 except ImportError:
     from coloraide.everything import ColorAll as Color
+from coloraide.image import Pipeline
 
 
 def printt(t):
@@ -45,40 +46,39 @@ def printt(t):
         print(f'{t} nsec')
 
 
-@lru_cache(maxsize=1024 * 1024)
-def get_color(space, p):
-    """Translate the pixel to a color."""
-
-    return Color('srgb', [x / 255 for x in p[:3]], p[3] / 255 if len(p) > 3 else 1).convert(space, in_place=True)
-
-
-def iter_image(img, space, no_resize):
-    """Process the image applying the requested filter."""
+def average_image(img, space, no_resize, premultiplied):
+    """Average the colors of the image."""
 
     with Image.open(img) as im:
-        if im.format == 'PNG':
-            if im.mode not in ('RGBA',):
-                im = im.convert('RGBA')
+        if im.mode not in ('RGB', 'RGBA'):
+            im = im.convert('RGBA' if im.format == 'PNG' else 'RGB')
 
         if not no_resize and (im.size[0] > 500 or im.size[1] > 500):
             factor = 500 / max(im.size)
             new_im = im.resize((max(1, int(im.size[0] * factor)), max(1, int(im.size[1] * factor))))
         else:
             new_im = im
-        pixels = new_im.load()
+
         start = time.perf_counter_ns()
-        total = new_im.size[0] * new_im.size[1]
-        factor = 100 / total
-        i = j = 0
-        print(f'Pixels: {total}')
-        print('> 0%', end='\r')
-        for i in range(new_im.size[0]):
-            for j in range(new_im.size[1]):
-                yield get_color(space, pixels[i, j])
-            print(f'> {int((i * j) * factor)}%', end="\r")
-        print('> 100%')
+        print(f'Pixels: {new_im.size[0] * new_im.size[1]}')
+
+        # Count the unique pixels and only convert those, using the counts as weights
+        channels = len(new_im.mode)
+        data = new_im.tobytes()
+        counts = Counter(zip(*[data[i::channels] for i in range(channels)]))
+        pipeline = Pipeline(
+            Color, 'srgb', alpha=channels == 4, out_space=space, out_typecode='d', out_alpha=True
+        )
+        stride = len(Color.CS_MAP[space].CHANNELS) + 1
+        results = pipeline.run(bytes(v for p in counts for v in p))
+        colors = [
+            Color(space, results[i:i + stride - 1], results[i + stride - 1]) for i in range(0, len(results), stride)
+        ]
+        color = Color.average(colors, counts.values(), space=space, premultiplied=premultiplied)
+
         t = time.perf_counter_ns() - start
         printt(t)
+        return color
 
 
 def main():
@@ -99,10 +99,11 @@ def main():
         gmap.update(parts[1])
 
     print(
-        Color.average(
-            iter_image(args.input, args.space, args.no_resize),
-            space=args.space,
-            premultiplied=args.premultiplied,
+        average_image(
+            args.input,
+            args.space,
+            args.no_resize,
+            args.premultiplied
         ).convert(args.out_space).to_string(fit=gmap)
     )
 
@@ -0,0 +1,68 @@
+"""
+Benchmark the time it takes to import ColorAide.
+
+Each import is run in a fresh interpreter. If `--max` is given, the benchmark fails when
+the median import time exceeds it, which can be used to guard against startup regressions.
+"""
+import sys
+import os
+import argparse
+import statistics
+import subprocess
+
+MODULES = {
+    'coloraide': 'import coloraide',
+    'everything': 'import coloraide.everything'
+}
+
+
+def import_time(module):
+    """Get the cumulative import time of a module in microseconds using `-X importtime`."""
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', MODULES[module]],
+        cwd=os.getcwd(),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    # The last entry is the top level module we imported.
+    name = MODULES[module].split()[-1]
+    for line in reversed(result.stderr.splitlines()):
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == name:
+            return int(parts[1])
+    raise RuntimeError(f'Could not find the import time of {name}')
+
+
+def main():
+    """Main."""
+
+    parser = argparse.ArgumentParser(
+        prog='benchmark_import.py',
+        description='Benchmark the import time of ColorAide.'
+    )
+    parser.add_argument('--module', '-m', default='coloraide', choices=list(MODULES), help="Module to import.")
+    parser.add_argument('--runs', '-r', type=int, default=10, help="Number of imports to run.")
+    parser.add_argument('--max', type=float, default=0, help="Fail if the median import exceeds this many msec.")
+    args = parser.parse_args()
+
+    # Warm up the file system caches and bytecode cache.
+    import_time(args.module)
+
+    times = [import_time(args.module) / 1000 for _ in range(args.runs)]
+    median = statistics.median(times)
+    print(f'Imports: {args.runs}')
+    print(f'Median: {median:.2f} msec')
+    print(f'Min: {min(times):.2f} msec')
+    print(f'Max: {max(times):.2f} msec')
+
+    if args.max and median > args.max:
+        print(f'FAILED: median import time exceeds {args.max} msec')
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
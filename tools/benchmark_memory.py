@@ -0,0 +1,75 @@
+"""
+Benchmark the memory used by ColorAide color objects.
+
+Colors are created in a fresh interpreter and the memory they allocate is measured with
+`tracemalloc`. Results are reported as bytes per color for individual `Color` objects and,
+for comparison, for the same colors stored in a `ColorArray`.
+"""
+import sys
+import os
+import argparse
+import subprocess
+
+SCRIPT = """
+import random
+import tracemalloc
+from coloraide import Color
+from coloraide.batch import ColorArray
+
+random.seed(0)
+values = [[random.random() for _ in range(3)] for _ in range({count})]
+
+# Coordinates are generated while measuring so that any float objects kept by colors are counted.
+tracemalloc.start()
+base = tracemalloc.get_traced_memory()[0]
+colors = [Color('{space}', [random.random() for _ in range(3)]) for _ in range({count})]
+used = tracemalloc.get_traced_memory()[0] - base
+del colors
+
+base = tracemalloc.get_traced_memory()[0]
+array = ColorArray(Color, '{space}', values)
+used_array = tracemalloc.get_traced_memory()[0] - base
+print(used, used_array)
+"""
+
+
+def measure(count, space):
+    """Measure the memory used by `count` colors in bytes."""
+
+    result = subprocess.run(
+        [sys.executable, '-c', SCRIPT.format(count=count, space=space)],
+        cwd=os.getcwd(),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    used, used_array = result.stdout.split()
+    return int(used), int(used_array)
+
+
+def main():
+    """Main."""
+
+    parser = argparse.ArgumentParser(
+        prog='benchmark_memory.py',
+        description='Benchmark the memory used by ColorAide color objects.'
+    )
+    parser.add_argument('--count', '-c', type=int, default=100000, help="Number of colors to create.")
+    parser.add_argument('--space', '-s', default='srgb', help="Color space of the colors.")
+    parser.add_argument('--max', type=float, default=0, help="Fail if a color exceeds this many bytes.")
+    args = parser.parse_args()
+
+    used, used_array = measure(args.count, args.space)
+    per_color = used / args.count
+    print(f'Colors: {args.count}')
+    print(f'Color: {per_color:.1f} bytes per color')
+    print(f'ColorArray: {used_array / args.count:.1f} bytes per color')
+
+    if args.max and per_color > args.max:
+        print(f'FAILED: colors exceed {args.max} bytes')
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
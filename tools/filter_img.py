@@ -1,5 +1,4 @@
 """Modify a picture with a given filter."""
-from functools import lru_cache
 from PIL import Image
 import time
 import argparse
@@ -14,6 +13,7 @@ try:
     from coloraide_extras.everything import ColorAll as Color
 except ImportError:
     from coloraide.everything import ColorAll as Color
+from coloraide.image import Pipeline
 
 
 GMAP = {}
@@ -48,22 +48,6 @@ def printt(t):
         print(f'{t} nsec')
 
 
-@lru_cache(maxsize=1024 * 1024)
-def apply_filter(name, amount, space, method, p):
-    """Apply filter."""
-
-    has_alpha = len(p) > 3
-    color = Color('srgb', [x / 255 for x in p[:3]], p[3] / 255 if has_alpha else 1)
-    if method is not None:
-        # This is a CVD filter that allows specifying the method
-        color.filter(name, amount, space=space, in_place=True, method=method, out_space='srgb')
-    else:
-        # General filter.
-        color.filter(name, amount, space=space, in_place=True, out_space='srgb')
-    # Fit the color back into the color gamut and return the results
-    return tuple(round(x * 255) for x in color.fit(**GMAP)[:4 if has_alpha else -1])
-
-
 def process_image(img, output, name, amount, space, cvd_approach):
     """Process the image applying the requested filter."""
 
@@ -73,22 +57,20 @@ def process_image(img, output, name, amount, space, cvd_approach):
         if im.format == 'PNG' and name == 'opacity':
             if im.mode not in ('RGBA',):
                 im = im.convert('RGBA')
+        if im.mode not in ('RGB', 'RGBA'):
+            im = im.convert('RGB')
+
+        # CVD filters allow specifying the method
+        kwargs = {'method': cvd_approach} if cvd_approach is not None else {}
+        pipeline = Pipeline(Color, 'srgb', alpha=im.mode == 'RGBA')
+        pipeline.filter(name, amount, space=space, **kwargs).convert('srgb').fit(**GMAP)
 
-        pixels = im.load()
         start = time.perf_counter_ns()
-        total = im.size[0] * im.size[1]
-        factor = 100 / total
-        i = j = 0
-        print(f'Pixels: {total}')
-        print('> 0%', end='\r')
-        for i in range(im.size[0]):
-            for j in range(im.size[1]):
-                pixels[i, j] = apply_filter(name, amount, space, cvd_approach, pixels[i, j])
-            print(f'> {int((i * j) * factor)}%', end="\r")
-        print('> 100%')
+        print(f'Pixels: {im.size[0] * im.size[1]}')
+        pixels = pipeline.run(im.tobytes())
         t = time.perf_counter_ns() - start
         printt(t)
-        im.save(output)
+        Image.frombytes(im.mode, im.size, pixels.tobytes()).save(output)
 
 
 def main():